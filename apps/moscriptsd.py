@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+
+# Standard Library
+from pathlib import Path
+
+# Third Party
+from typer import Exit, Option, Typer, colors, secho
+
+# My Imports
+from moscripts.client import DAEMON_TOOLS, daemon_socket_path
+from moscripts.daemon import serve
+
+app: Typer = Typer(add_completion=False)
+
+
+@app.command()
+def moscriptsd(
+    socket_path: Path = Option(  # noqa: B008 - Typer declares options as defaults
+        None,
+        "--socket",
+        help="Unix socket to listen on. Defaults to `$XDG_RUNTIME_DIR/moscripts/daemon.sock`.",
+    ),
+) -> None:
+    """Keep moscripts tools imported and warm behind a Unix socket."""
+    path: Path = socket_path or Path(daemon_socket_path())
+    secho(
+        f"🔥 Serving {', '.join(sorted(DAEMON_TOOLS))} on {path}",
+        fg=colors.BRIGHT_GREEN,
+    )
+    try:
+        serve(path)
+    except RuntimeError as e:
+        secho(f"🚨 {e}", fg=colors.RED, err=True)
+        raise Exit(1)
+    except KeyboardInterrupt:
+        secho("👋 Stopped.", fg=colors.YELLOW)
+
+
+if __name__ == "__main__":
+    app()
@@ -1,32 +1,74 @@
 #!/usr/bin/env python
 
 # Standard Library
+import ast
+import heapq
+import json
 import os
+import re
+import shutil
 import subprocess
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from hashlib import sha256
+from operator import itemgetter
 from uuid import uuid4
 from pathlib import Path
-from typing import Iterable, Never
+from typing import Iterable, Iterator, Never
 from datetime import datetime
 
 # Third Party
-from typer import Argument, Exit, Option, Typer, colors, confirm, secho
+from typer import Argument, BadParameter, Exit, Option, Typer, colors, confirm, secho
 from rich import print
 
 # My Imports
-from moscripts.utilities import nix_run_prefix
+from moscripts.utilities import clone_file, nix_run_prefix, write_json_atomic
 from moscripts.gum import gum_confirm, gum_choose
+from moscripts.trace import flush as flush_trace, span, traced
+from moscripts.locks import directory_lock, hold_for_exec, locked
+from moscripts.settings import Settings, load_settings
+from moscripts.archive import (
+    ArchiveEntry,
+    archive_notebooks,
+    read_index,
+    restore_entry,
+)
+from moscripts.dedup import find_duplicates
+from moscripts.notebook_index import search_notebooks, update_index
 from moscripts import TZ, HOME
 
 # Globals
+SETTINGS: Settings = load_settings()
 CWD: Path = Path.cwd()
-MOTMP: Path = HOME / ".cache" / "marimo" / "motmp"
-VENV: Path = MOTMP / ".venv"
+MOTMP: Path = SETTINGS.motmp
+VENV: Path = SETTINGS.venv
+TEMPLATES: Path = SETTINGS.templates
+# Subdirectory of a MOTMP directory holding its compressed archive.
+ARCHIVE: str = "archive"
+
+PACKAGES_STATE: str = "motmp-packages.json"
+# Leading distribution name of a requirement such as `marimo[recommended]>=0.15`.
+REQUIREMENT_NAME: re.Pattern[str] = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+# `marimo export` formats and the suffix of their output files.
+EXPORT_SUFFIXES: dict[str, str] = {
+    "script": ".py",
+    "html": ".html",
+    "md": ".md",
+    "ipynb": ".ipynb",
+}
 
 uv_cmd_prefix: tuple[str, ...] = nix_run_prefix("uv")
 
 
+@traced()
 def init_motmp() -> None:
-    """Initializes a virtual environment for MOTMP and build file structure."""
+    """Initializes a virtual environment for MOTMP and build file structure.
+
+    Holds the MOTMP lock exclusively, so concurrent invocations wait for the
+    first one to finish creating the venv instead of running uv alongside it.
+    """
     secho("Initializing MOTMP...", fg=colors.BRIGHT_GREEN)
     assert HOME.exists(), "Home directory does not exist."
 
@@ -34,27 +76,20 @@ def init_motmp() -> None:
         MOTMP.mkdir(parents=True, exist_ok=True)
         secho(f"Created {MOTMP}", fg=colors.BRIGHT_GREEN)
 
+    with directory_lock(MOTMP):
+        _init_venv()
+    secho("🎉 Setup complete.", fg=colors.GREEN)
+
+
+def _init_venv() -> None:
+    """Creates VENV with uv unless it exists. Callers hold the MOTMP lock."""
     if not VENV.exists():
         secho(f"VENV not found at {VENV}", fg=colors.YELLOW)
         if confirm("Create VENV?", default=True):
             try:
-                subprocess.run(
-                    [*uv_cmd_prefix, "init", "--bare", "--name", "motmp"],
-                    check=True,
-                    cwd=MOTMP,
-                )
-                subprocess.run(
-                    [
-                        *uv_cmd_prefix,
-                        "add",
-                        "marimo[recommended]",
-                        "python-lsp-server",
-                        "websockets",
-                        "watchdog",
-                    ],
-                    check=True,
-                    cwd=MOTMP,
-                )
+                with span("uv venv"):
+                    subprocess.run([*uv_cmd_prefix, "venv", str(VENV)], check=True)
+                sync_packages(VENV, SETTINGS.motmp_packages)
             except subprocess.CalledProcessError as e:
                 secho(
                     f"Failed to create virtual environment: {e}",
@@ -65,9 +100,93 @@ def init_motmp() -> None:
         else:
             secho("womp womp", fg=colors.RED)
             raise Exit(1)
-    secho("🎉 Setup complete.", fg=colors.GREEN)
 
 
+def normalize_name(name: str) -> str:
+    """Normalizes a distribution name as in PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def installed_packages(venv: Path) -> set[str]:
+    """Returns the normalized names of the distributions installed in a venv."""
+    return {
+        normalize_name(dist_info.name.split("-")[0])
+        for dist_info in venv.glob("lib/python*/site-packages/*.dist-info")
+    }
+
+
+def requirement_name(requirement: str) -> str:
+    """Returns the normalized distribution name of a requirement."""
+    match: re.Match[str] | None = REQUIREMENT_NAME.match(requirement)
+    return normalize_name(match.group(1) if match else requirement)
+
+
+def packages_hash(packages: Iterable[str]) -> str:
+    """Returns a stable hash of a package spec."""
+    return sha256("\n".join(sorted(packages)).encode()).hexdigest()
+
+
+def read_packages_state(venv: Path) -> dict:
+    """Returns the spec and hash recorded by the last sync, or {}."""
+    try:
+        return json.loads((venv / PACKAGES_STATE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def packages_synced(venv: Path, packages: list[str]) -> bool:
+    """Returns True if the venv was last synced to exactly this package spec."""
+    return read_packages_state(venv).get("hash") == packages_hash(packages)
+
+
+@traced()
+def sync_packages(venv: Path, packages: list[str]) -> list[str]:
+    """Installs the part of a package spec that a venv is missing.
+
+    The spec and its hash are stored in the venv (so recreating the venv
+    resets them). When the hash matches, nothing else is read. Otherwise a
+    requirement is installed with `uv pip install` if its distribution isn't
+    in site-packages or its specifier changed since the last sync. Packages
+    dropped from the spec are left installed.
+
+    Returns:
+        The requirements that were installed.
+    """
+    desired_hash: str = packages_hash(packages)
+    state: dict = read_packages_state(venv)
+    if state.get("hash") == desired_hash:
+        return []
+
+    installed: set[str] = installed_packages(venv)
+    # Without a recorded spec (e.g. a venv built by `uv add`), trust any
+    # installed distribution and only fill in the missing ones.
+    synced: set[str] = set(state.get("packages", packages))
+    missing: list[str] = [
+        requirement
+        for requirement in packages
+        if requirement not in synced or requirement_name(requirement) not in installed
+    ]
+    if missing:
+        secho(f"📦 Installing {missing}", fg=colors.BRIGHT_CYAN)
+        with span("uv pip install", packages=missing):
+            subprocess.run(
+                [
+                    *uv_cmd_prefix,
+                    "pip",
+                    "install",
+                    "--python",
+                    str(venv / "bin" / "python"),
+                    *missing,
+                ],
+                check=True,
+            )
+    write_json_atomic(
+        venv / PACKAGES_STATE, {"hash": desired_hash, "packages": packages}
+    )
+    return missing
+
+
+@traced()
 def scan_motmp(directory: Path = MOTMP) -> list[tuple[Path, Path | None]]:
     """Scans a directory for MOTMP files."""
     SESSION: Path = directory / "__marimo__" / "session"
@@ -81,54 +200,140 @@ def scan_motmp(directory: Path = MOTMP) -> list[tuple[Path, Path | None]]:
     return motmp_files
 
 
-def sort_motmp_files(
-    motmp_files: Iterable[tuple[Path, Path | None]], reverse: bool = True
-) -> dict[str, str]:
-    """Sorts MOTMP files by created time."""
-    return {
-        str(file.stem): datetime.fromtimestamp(file.stat().st_ctime, tz=TZ).strftime(
-            "%m-%d %I:%M %p"
-        )
-        for file, _ in sorted(
-            motmp_files, key=lambda x: x[0].stat().st_ctime, reverse=reverse
+def recent_motmp_files(
+    motmp_files: Iterable[tuple[Path, Path | None]],
+    limit: int | None = None,
+    since: float | None = None,
+) -> Iterator[tuple[Path, float]]:
+    """Yields MOTMP files newest first, with their created time.
+
+    With `limit`, only the newest files are kept on a heap instead of sorting
+    them all. `since` skips files created before that timestamp.
+    """
+    stamped: Iterator[tuple[float, Path]] = (
+        (file.stat().st_ctime, file) for file, _ in motmp_files
+    )
+    if since is not None:
+        stamped = (row for row in stamped if row[0] >= since)
+    newest: list[tuple[float, Path]] = (
+        heapq.nlargest(limit, stamped, key=itemgetter(0))
+        if limit is not None
+        else sorted(stamped, key=itemgetter(0), reverse=True)
+    )
+    for created, file in newest:
+        yield file, created
+
+
+def print_motmp_rows(rows: Iterable[tuple[Path, float]]) -> list[Path]:
+    """Prints MOTMP files as a table while rows arrive. Returns the listed files.
+
+    Rows are written a screenful at a time, so the first screen shows up
+    before the rest of the rows are formatted.
+    """
+    screen: int = max(shutil.get_terminal_size().lines - 2, 1)
+    listed: list[Path] = []
+    lines: list[str] = [f"{'#':>6}  {'MOTMP file':<44}  Created"]
+    for file, created in rows:
+        listed.append(file)
+        lines.append(
+            f"{len(listed):>6}  {file.stem:<44}  "
+            + datetime.fromtimestamp(created, tz=TZ).strftime("%m-%d %I:%M %p")
         )
-    }
+        if len(lines) >= screen:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+            lines.clear()
+    if lines and listed:
+        sys.stdout.write("\n".join(lines) + "\n")
+    return listed
 
 
+@traced()
 def get_previous_file(destination: Path) -> Path:
-    """Returns the previous file in the directory."""
+    """Returns the previous file in the directory.
+
+    Notebooks in the directory's archive are listed too; choosing one restores
+    it from the archive.
+    """
     assert destination.exists(), "Destination not found."
     assert destination.is_dir(), "Destination must be a directory."
 
-    previous_files: dict[str, Path] = {
+    candidates: list[tuple[float, str, Path | ArchiveEntry]] = [
+        (file.stat().st_ctime, str(file.stem), file)
+        for file, _ in scan_motmp(destination)
+    ]
+    live: set[str] = {name for _, name, _ in candidates}
+    candidates += [
+        (entry.created, f"{entry.name}  (archived)", entry)
+        for entry in read_index(destination / ARCHIVE).values()
+        if entry.name not in live
+    ]
+    previous_files: dict[str, Path | ArchiveEntry] = {
         str(
-            str(file.stem)
+            name
             + "  @  "
-            + datetime.fromtimestamp(file.stat().st_ctime, tz=TZ).strftime(
-                "%m-%d %I:%M %p"
-            )
-        ): file
-        for file, _ in sorted(
-            scan_motmp(destination), key=lambda x: x[0].stat().st_ctime, reverse=True
+            + datetime.fromtimestamp(created, tz=TZ).strftime("%m-%d %I:%M %p")
+        ): target
+        for created, name, target in sorted(
+            candidates, key=lambda x: x[0], reverse=True
         )
     }
     choices: list[str] = list(previous_files.keys())
     if len(choices) > 0:
         result: str = gum_choose(choices, header="Previous MOTMP files:")
-        previous_file: Path = previous_files[result]
-        assert previous_file.exists(), "Previous file not found."
-        assert previous_file.is_file(), "Previous file is not a file."
-        return previous_file
+        previous: Path | ArchiveEntry = previous_files[result]
+        if isinstance(previous, ArchiveEntry):
+            previous = restore_entry(destination / ARCHIVE, previous, destination)
+            secho(f"🗄️ Restored {previous.name} from the archive.", fg=colors.CYAN)
+        assert previous.exists(), "Previous file not found."
+        assert previous.is_file(), "Previous file is not a file."
+        return previous
     else:
         secho("🔎 Found no MOTMP files.", fg=colors.YELLOW)
         raise Exit(0)
 
 
+@traced()
+def search_motmp(destination: Path, terms: str) -> Path:
+    """Returns a notebook picked from a full-text search of the directory.
+
+    The search index is brought up to date first, reading only notebooks that
+    changed since the last search.
+    """
+    if not destination.is_dir():
+        raise BadParameter(
+            "Cannot search a file. Please specify a directory.",
+            param_hint="'destination'",
+        )
+    start: float = time.perf_counter()
+    update_index(destination, [file for file, _ in scan_motmp(destination)])
+    results: list[tuple[Path, str]] = search_notebooks(terms, destination)
+    elapsed_ms: float = (time.perf_counter() - start) * 1000
+    if not results:
+        secho(f"🔎 No MOTMP files match `{terms}`.", fg=colors.YELLOW)
+        raise Exit(0)
+    secho(f"🔎 Found {len(results)} matches in {elapsed_ms:.1f} ms.", fg=colors.YELLOW)
+    matches: dict[str, Path] = {
+        f"{path.stem}  @  {snippet}": path for path, snippet in results
+    }
+    result: str = gum_choose(list(matches), header="Matching MOTMP files:")
+    return matches[result]
+
+
+@traced()
 def wipe_motmp(motmp_files: Iterable[tuple[Path, Path | None]]) -> None:
-    """Wipes a directory of MOTMP files."""
+    """Wipes a directory of MOTMP files.
+
+    Callers hold the directory lock exclusively. Notebooks still locked by a
+    running marimo (see `hold_for_exec`) are skipped.
+    """
     for motmp_file, session_file in motmp_files:
         try:
-            motmp_file.unlink()
+            with locked(motmp_file, blocking=False):
+                motmp_file.unlink()
+        except BlockingIOError:
+            secho(f"Skipped {motmp_file}: in use.", fg=colors.YELLOW)
+            continue
         except Exception as e:
             secho(f"Failed to wipe {motmp_file}: {e}", fg=colors.RED, err=True)
             pass
@@ -140,18 +345,160 @@ def wipe_motmp(motmp_files: Iterable[tuple[Path, Path | None]]) -> None:
             pass
 
 
-def create_motmp(directory: Path = MOTMP) -> Path:
-    """Creates a new MOTMP file."""
+def export_is_fresh(notebook: Path, target: Path) -> bool:
+    """Returns True if an export exists and is newer than its notebook."""
+    try:
+        return target.stat().st_mtime_ns >= notebook.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def export_notebook(
+    notebook: Path, target: Path, fmt: str, venv: Path
+) -> tuple[Path, float, str | None]:
+    """Runs `marimo export` for one notebook.
+
+    Output goes to a temporary name first so a failed export never looks
+    fresh on the next run.
+
+    Returns:
+        The notebook, the seconds the export took, and an error or None.
+    """
+    partial: Path = target.with_name(f".{target.stem}.partial{target.suffix}")
+    cmd: list[str] = [
+        str(venv / "bin" / "marimo"),
+        "export",
+        fmt,
+        str(notebook),
+        "-o",
+        str(partial),
+    ]
+    start: float = time.perf_counter()
+    with span("marimo export", notebook=notebook, format=fmt):
+        result: subprocess.CompletedProcess = subprocess.run(
+            cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL, check=False
+        )
+    elapsed: float = time.perf_counter() - start
+    if result.returncode != 0 or not partial.exists():
+        partial.unlink(missing_ok=True)
+        lines: list[str] = result.stderr.strip().splitlines()
+        return notebook, elapsed, lines[-1] if lines else f"exit {result.returncode}"
+    partial.replace(target)
+    return notebook, elapsed, None
+
+
+def export_motmp(
+    motmp_files: Iterable[tuple[Path, Path | None]],
+    output: Path,
+    fmt: str,
+    venv: Path,
+    jobs: int,
+) -> Iterator[tuple[Path, float, str | None]]:
+    """Exports notebooks concurrently, skipping those with a fresh export.
+
+    At most `jobs` `marimo export` processes run at once. Results are yielded
+    as each export finishes; skipped notebooks are not yielded.
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    suffix: str = EXPORT_SUFFIXES[fmt]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures: list[Future[tuple[Path, float, str | None]]] = [
+            pool.submit(export_notebook, notebook, target, fmt, venv)
+            for notebook, _ in motmp_files
+            if not export_is_fresh(
+                notebook, target := output / f"{notebook.stem}{suffix}"
+            )
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def create_motmp(directory: Path = MOTMP, template: Path | None = None) -> Path:
+    """Creates a new MOTMP file, prefilled from a template if one is given."""
     file_name: str = f"motmp_{uuid4()}.py".replace("-", "_")
     motmp_file: Path = Path(directory) / file_name
     try:
-        motmp_file.touch(mode=0o644)
+        if template is None:
+            motmp_file.touch(mode=0o644)
+        else:
+            clone_file(template, motmp_file)
+            motmp_file.chmod(0o644)
     except Exception as e:
         secho(f"Failed to create {motmp_file}: {e}", fg=colors.RED, err=True)
         raise e
     return motmp_file
 
 
+def get_template(name: str) -> Path:
+    """Returns the path of a named template in TEMPLATES."""
+    template: Path = TEMPLATES / f"{name}.py"
+    if not template.is_file():
+        available: list[str] = sorted(file.stem for file in TEMPLATES.glob("*.py"))
+        secho(
+            f"🚨 Template `{name}` not found in {TEMPLATES}. Available: {available}",
+            fg=colors.RED,
+        )
+        raise Exit(1)
+    return template
+
+
+def store_template(source: Path, name: str) -> Path:
+    """Saves a notebook as a named template, replacing any existing one."""
+    if not source.is_file() or source.suffix != ".py":
+        secho(
+            f"🚨 Cannot save `{source}` as a template. Please specify a notebook file.",
+            fg=colors.RED,
+        )
+        raise Exit(1)
+    if not name or Path(name).name != name:
+        secho(
+            f"🚨 Invalid template name `{name}`. Use a plain name like `polars`.",
+            fg=colors.RED,
+        )
+        raise Exit(1)
+    TEMPLATES.mkdir(parents=True, exist_ok=True)
+    template: Path = TEMPLATES / f"{name}.py"
+    template.unlink(missing_ok=True)
+    clone_file(source, template)
+    return template
+
+
+def template_imports(template: Path) -> str:
+    """Returns the top-level import statements of a notebook's `@app.cell`s."""
+    imports: list[ast.stmt] = [
+        statement
+        for node in ast.parse(template.read_text()).body
+        if isinstance(node, ast.FunctionDef)
+        and any(
+            ast.unparse(decorator).startswith("app.cell")
+            for decorator in node.decorator_list
+        )
+        for statement in node.body
+        if isinstance(statement, (ast.Import, ast.ImportFrom))
+    ]
+    return "\n".join(ast.unparse(statement) for statement in imports)
+
+
+def warm_venv(template: Path, venv: Path) -> None:
+    """Imports a template's libraries in the background to fill `__pycache__`.
+
+    uv doesn't compile bytecode on install, so the first import of each
+    library in a fresh venv compiles it. Running the import cell alongside
+    marimo's startup moves that cost off the first cell run.
+    """
+    code: str = template_imports(template)
+    if not code:
+        return
+    with span("warm venv", template=template):
+        subprocess.Popen(
+            [str(venv / "bin" / "python"), "-c", code],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+
 def launch_motmp(motmp_file: Path, venv: Path = VENV) -> Never:
     """Launches a MOTMP file using a virtual environment."""
     marimo_executable: Path = venv / "bin" / "marimo"
@@ -165,6 +512,7 @@ def launch_motmp(motmp_file: Path, venv: Path = VENV) -> Never:
         "--no-token",
     ]
     print(cmd)
+    flush_trace()  # os.execv skips atexit handlers
     try:
         os.execv(str(marimo_executable), cmd)
     except Exception as e:
@@ -172,11 +520,11 @@ def launch_motmp(motmp_file: Path, venv: Path = VENV) -> Never:
         raise e
 
 
-def validate_motmp_file(destination: Path) -> Path:
+def validate_motmp_file(destination: Path, template: Path | None = None) -> Path:
     """Validates a MOTMP file. Returns the validated file path."""
     assert destination.exists(), "Destination not found."
     if destination.is_dir():
-        return create_motmp(destination)
+        return create_motmp(destination, template)
     elif destination.is_file():
         assert destination.suffix == ".py", "Destination must be a Python file."
         return destination
@@ -184,18 +532,23 @@ def validate_motmp_file(destination: Path) -> Path:
         raise ValueError("Destination must be a file or directory.")
 
 
+@traced()
 def validate_venv(venv: Path, post_init: bool = False) -> Path:
     """Validates a virtual environment. Returns the validated virtual environment path or None."""
     result: Path = venv if venv.exists() else VENV
     try:
-        assert result.exists(), f"🚨 Virtual environment not found at {venv}"
-        assert result.is_dir(), f"🚨 Virtual environment is not a directory at {venv}"
-        assert Path(result / "bin" / "python").exists(), (
-            f"🚨 python not found in {venv}"
-        )
-        assert Path(result / "bin" / "marimo").exists(), (
-            f"🚨 marimo not found in {venv}"
-        )
+        # Shared with other launches; waits while init_motmp is creating VENV
+        with directory_lock(MOTMP, exclusive=False):
+            assert result.exists(), f"🚨 Virtual environment not found at {venv}"
+            assert result.is_dir(), (
+                f"🚨 Virtual environment is not a directory at {venv}"
+            )
+            assert Path(result / "bin" / "python").exists(), (
+                f"🚨 python not found in {venv}"
+            )
+            assert Path(result / "bin" / "marimo").exists(), (
+                f"🚨 marimo not found in {venv}"
+            )
     except AssertionError as e:
         if (
             confirm("Invaild `.venv`. Create a new one?", default=True)
@@ -222,42 +575,198 @@ def motmp(
         help=f"Location of the virtual environment. Tries to find a `.venv` in cwd. Falls back to `{VENV}`.",
     ),
     scan: bool = Option(False, help="Scan the directory for MOTMP files."),
+    limit: int = Option(
+        None, min=1, help="With --scan, list only the N most recent MOTMP files."
+    ),
+    since: float = Option(
+        None,
+        min=0,
+        help="With --scan, list only MOTMP files created in the last N days.",
+    ),
+    archive: float = Option(
+        None,
+        min=0,
+        help=f"Move MOTMP files older than this many days into `<destination>/{ARCHIVE}` and exit.",
+    ),
+    prune: bool = Option(
+        False, help="Wipe empty and duplicate MOTMP files in the directory."
+    ),
     prev: bool = Option(
         False,
         help="Launch a previous MOTMP file.",
     ),
+    search: str = Option(
+        None,
+        help="Launch a MOTMP file picked from a full-text search of notebook sources.",
+    ),
+    template: str = Option(
+        None,
+        help=f"Prefill a new MOTMP file from a named template in `{TEMPLATES}`.",
+    ),
+    save_template: str = Option(
+        None,
+        "--save-template",
+        help="Save the destination notebook as a named template and exit.",
+    ),
+    warm: bool = Option(
+        False,
+        help="Import the template's libraries in the venv while marimo starts.",
+    ),
+    export: str = Option(
+        None,
+        help=f"Export the MOTMP files in the destination as {', '.join(EXPORT_SUFFIXES)} to `<destination>/exports` and exit.",
+    ),
+    jobs: int = Option(
+        os.cpu_count() or 1,
+        min=1,
+        help="Number of concurrent `marimo export` processes.",
+    ),
 ) -> Never:
     """Create and edit temp marimo notebooks."""
     # Try initializing MOTMP
     if not MOTMP.exists():
         init_motmp()
 
+    # Save a notebook as a template
+    if save_template is not None:
+        saved: Path = store_template(destination, save_template)
+        secho(f"💾 Saved template {saved}", fg=colors.BRIGHT_GREEN)
+        raise Exit(0)
+
     # Sanity checks
+    if warm and template is None:
+        raise BadParameter(
+            "Needs --template to know what to warm.", param_hint="'--warm'"
+        )
     assert CWD.exists(), f"🚨 Current working directory not found at {CWD}"
     assert destination.exists(), f"Destination not found. {destination}"
+    template_file: Path | None = get_template(template) if template else None
+    motmp_files: list[tuple[Path, Path | None]]
+
+    # Export MOTMP files
+    if export is not None:
+        if export not in EXPORT_SUFFIXES:
+            secho(
+                f"🚨 Unknown export format `{export}`. Choose from {', '.join(EXPORT_SUFFIXES)}.",
+                fg=colors.RED,
+            )
+            raise Exit(1)
+        if not destination.is_dir():
+            secho("🚨 Cannot export a file. Please specify a directory.", fg=colors.RED)
+            raise Exit(1)
+        export_venv: Path = validate_venv(venv if venv is not None else VENV)
+        output: Path = destination / "exports"
+        failed: int = 0
+        start: float = time.perf_counter()
+        # Shared, so a concurrent wipe waits until the exports are done
+        with directory_lock(destination, exclusive=False):
+            motmp_files = scan_motmp(destination)
+            exported: int = 0
+            for notebook, elapsed, error in export_motmp(
+                motmp_files, output, export, export_venv, jobs
+            ):
+                exported += 1
+                if error is None:
+                    secho(f"  {elapsed:6.2f}s  {notebook.name}", fg=colors.GREEN)
+                else:
+                    failed += 1
+                    secho(
+                        f"  {elapsed:6.2f}s  {notebook.name}: {error}",
+                        fg=colors.RED,
+                        err=True,
+                    )
+        secho(
+            f"📦 Exported {exported - failed}, failed {failed}, "
+            f"skipped {len(motmp_files) - exported} up to date "
+            f"in {time.perf_counter() - start:.2f}s to {output}",
+            fg=colors.BRIGHT_GREEN if failed == 0 else colors.YELLOW,
+        )
+        raise Exit(1 if failed else 0)
+
+    # Archive old MOTMP files
+    if archive is not None:
+        if not destination.is_dir():
+            secho(
+                "🚨 Cannot archive a file. Please specify a directory.", fg=colors.RED
+            )
+            raise Exit(1)
+        archive_cutoff: float = time.time() - archive * 86400
+        with directory_lock(destination):
+            motmp_files = scan_motmp(destination)
+            entries: list[ArchiveEntry] = archive_notebooks(
+                motmp_files, destination, destination / ARCHIVE, archive_cutoff
+            )
+        secho(
+            f"🗄️ Archived {len(entries)} of {len(motmp_files)} MOTMP files "
+            f"to {destination / ARCHIVE}.",
+            fg=colors.BRIGHT_GREEN,
+        )
+        raise Exit(0)
+
+    # Prune empty and duplicate MOTMP files
+    if prune:
+        if not destination.is_dir():
+            secho("🚨 Cannot prune a file. Please specify a directory.", fg=colors.RED)
+            raise Exit(1)
+        with directory_lock(destination, exclusive=False):
+            motmp_files = scan_motmp(destination)
+            empty, duplicates = find_duplicates(file for file, _ in motmp_files)
+        redundant: set[Path] = {*empty, *duplicates}
+        if not redundant:
+            secho(
+                f"🔎 No empty or duplicate files among {len(motmp_files)} MOTMP files.",
+                fg=colors.YELLOW,
+            )
+            raise Exit(0)
+        secho(
+            f"🔎 Found {len(empty)} empty and {len(duplicates)} duplicate MOTMP files.",
+            fg=colors.YELLOW,
+        )
+        if gum_confirm(f"🗑️ Wipe {len(redundant)} files?"):
+            with directory_lock(destination):
+                wipe_motmp(pair for pair in motmp_files if pair[0] in redundant)
+        raise Exit(0)
 
     # Scan for MOTMP files
     if scan and destination.is_dir():
-        motmp_files: list[tuple[Path, Path | None]] = scan_motmp(destination)
-        if len(motmp_files) > 0:
-            secho(f"🔎 Found {len(motmp_files)} MOTMP files.", fg=colors.YELLOW)
+        since_cutoff: float | None = (
+            time.time() - since * 86400 if since is not None else None
+        )
+        with directory_lock(destination, exclusive=False):
+            motmp_files = scan_motmp(destination)
+            listed: list[Path] = print_motmp_rows(
+                recent_motmp_files(motmp_files, limit, since_cutoff)
+            )
+        if len(listed) > 0:
+            secho(
+                f"🔎 Listed {len(listed)} of {len(motmp_files)} MOTMP files.",
+                fg=colors.YELLOW,
+            )
         else:
             secho("🔎 Found no MOTMP files.", fg=colors.YELLOW)
             raise Exit(0)
-        print(sort_motmp_files(motmp_files))
-        if gum_confirm("🗑️ Wipe files?"):
-            wipe_motmp(motmp_files)
+        if gum_confirm(f"🗑️ Wipe {len(listed)} listed files?"):
+            sessions: dict[Path, Path | None] = dict(motmp_files)
+            with directory_lock(destination):
+                wipe_motmp((file, sessions[file]) for file in listed)
 
         raise Exit(0)
     elif scan and destination.is_file():
         secho("🚨 Cannot scan a file. Please specify a directory.", fg=colors.RED)
         raise Exit(1)
 
-    # Resolve previous file or create new file
-    if prev:
-        motmp_file: Path = get_previous_file(destination)
-    else:
-        motmp_file: Path = validate_motmp_file(destination)
+    # Resolve previous file or create new file. The shared lock keeps a
+    # concurrent wipe out until the notebook is locked for marimo, which
+    # inherits the lock across exec and holds it until it exits.
+    lock_dir: Path = destination if destination.is_dir() else destination.parent
+    with directory_lock(lock_dir, exclusive=False):
+        if search is not None:
+            motmp_file: Path = search_motmp(destination, search)
+        elif prev:
+            motmp_file: Path = get_previous_file(destination)
+        else:
+            motmp_file: Path = validate_motmp_file(destination, template_file)
+        hold_for_exec(motmp_file)
 
     # Validate venv
     if venv is None:
@@ -273,7 +782,12 @@ def motmp(
     except Exception:
         venv = VENV
     assert venv.exists(), "Failed to find virtual environment."
+    if venv == VENV and not packages_synced(VENV, SETTINGS.motmp_packages):
+        with directory_lock(MOTMP):
+            sync_packages(VENV, SETTINGS.motmp_packages)
     secho(f"Using venv=`{str(venv)}`", fg=colors.BRIGHT_MAGENTA)
+    if warm and template_file is not None:
+        warm_venv(template_file, venv)
 
     # Launch MOTMP file
     assert motmp_file.exists(), "Failed to create MOTMP file."
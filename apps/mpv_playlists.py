@@ -2,6 +2,11 @@
 
 # Standard Library
 import os
+import subprocess
+import threading
+import time
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
 
 # Third Party
@@ -11,51 +16,190 @@ from rich import print
 # My Imports
 from moscripts.utilities import nix_run_prefix
 from moscripts.gum import gum_choose
+from moscripts.trace import flush as flush_trace, span
+from moscripts.settings import Settings, load_settings
+from moscripts.library import (
+    CACHE_DIR,
+    query_tracks,
+    scan_library,
+    write_m3u,
+)
+from moscripts.mpv import (
+    MpvClient,
+    MpvError,
+    connect_mpv,
+    load_playlist,
+    mpv_socket_path,
+)
+from moscripts.mix import (
+    MIX_HEAD,
+    parse_mix_spec,
+    read_entries,
+    stream_mix,
+    weighted_mix,
+)
+from moscripts.prefetch import AUDIO_CACHE, TrackCache, prefetch_playlist
 
 # Globals
-HOME: Path = Path.home()
-PLAYLISTS: Path = HOME / "Music" / "Playlists"
+SETTINGS: Settings = load_settings()
+PLAYLISTS: Path = SETTINGS.playlists
+MUSIC: Path = SETTINGS.music
+QUERY_PLAYLIST: Path = CACHE_DIR / "playlists" / "query.m3u"
+MIX_PLAYLIST: Path = CACHE_DIR / "playlists" / "mix.m3u"
 
 assert PLAYLISTS.exists(), (
-    "Playlists directory does not exist. Please create it at `~/Music/Playlists`."
+    f"Playlists directory does not exist. Please create it at `{PLAYLISTS}`."
 )
 assert PLAYLISTS.is_dir(), (
-    "Playlists directory is not a directory. Please create it at `~/Music/Playlists`."
+    f"Playlists directory is not a directory. Please create it at `{PLAYLISTS}`."
 )
 
-playlists: list[Path] = list(PLAYLISTS.iterdir())
+with span("scan playlists", directory=PLAYLISTS):
+    playlists: list[Path] = list(PLAYLISTS.iterdir())
 assert len(playlists) > 0, (
-    "No playlists found. Please create at least one playlist in `~/Music/Playlists`."
+    f"No playlists found. Please create at least one playlist in `{PLAYLISTS}`."
 )
 
 app: Typer = Typer(add_completion=False)
 
 
+def start_mix_stream(socket_path: Path, entries: Iterator[str]) -> threading.Thread:
+    """Streams the rest of a mix into mpv on a background thread."""
+
+    def run() -> None:
+        appended: int = stream_mix(socket_path, entries, MIX_PLAYLIST)
+        secho(
+            f"🔀 Streamed {appended} more tracks into the mix.", fg=colors.BRIGHT_CYAN
+        )
+
+    thread: threading.Thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def follow_playlist(socket_path: Path, ahead: int) -> None:
+    """Prefetches upcoming tracks into the audio cache until mpv exits."""
+    cache: TrackCache = TrackCache(AUDIO_CACHE, SETTINGS.audio_cache_bytes)
+    secho(
+        f"📥 Prefetching {ahead} tracks ahead into {AUDIO_CACHE}",
+        fg=colors.BRIGHT_CYAN,
+    )
+    try:
+        prefetch_playlist(socket_path, cache, ahead)
+    except KeyboardInterrupt:
+        pass
+    secho(
+        f"📊 Cache hit rate {cache.hit_rate:.0%} ({cache.hits}/{cache.hits + cache.misses}), "
+        f"{cache.bytes_cached / 1024**2:.1f} MiB copied.",
+        fg=colors.BRIGHT_CYAN,
+    )
+
+
 @app.command()
 def mpv_playlists(
     playlist: Path = Argument(playlists[0], help="Playlist name."),
     scan: bool = Option(False, help="Scan the directory for playlists."),
     shuffle: bool = Option(True, help="Shuffle the playlist."),
+    query: str = Option(
+        None,
+        help=(
+            'Play tracks from the tag index matching e.g. `artist:X genre:"Y Z" words`. '
+            "Tags are read with mutagen (the `tags` extra); "
+            "without it, tracks only match by path."
+        ),
+    ),
+    index: bool = Option(
+        False,
+        help=f"Update the tag index from `{MUSIC}` (only changed files are read).",
+    ),
+    mix: list[str] | None = Option(
+        None,
+        help="Blend playlists by weight, e.g. `--mix focus.m3u:0.7 --mix jazz.m3u:0.3`.",
+    ),
+    prefetch: int = Option(
+        0,
+        min=0,
+        help="Copy the next N tracks to a local cache while playing (for slow storage).",
+    ),
 ) -> None:
     """Launches mpv with a playlist."""
-    if scan:
+    # Queries update the index first; only files whose mtime changed are read
+    if index or query is not None:
+        updated, removed, unchanged = scan_library(MUSIC)
+        secho(
+            f"🗂️ Indexed {updated} changed, {removed} removed, {unchanged} unchanged tracks.",
+            fg=colors.BRIGHT_CYAN,
+        )
+        if query is None:
+            raise Exit(0)
+
+    remainder: Iterator[str] | None = None
+    if mix:
+        try:
+            sources: list[tuple[Path, float]] = [
+                parse_mix_spec(spec, PLAYLISTS) for spec in mix
+            ]
+        except ValueError as e:
+            secho(f"🚨 {e}", fg=colors.RED, err=True)
+            raise Exit(1)
+        # mpv reads a playlist file to EOF before playing, so only the head of
+        # the mix goes into the file; the rest is appended over IPC
+        remainder = weighted_mix(
+            (read_entries(path), weight) for path, weight in sources
+        )
+        playlist = write_m3u(list(islice(remainder, MIX_HEAD)), MIX_PLAYLIST)
+        shuffle = False  # The mix is already interleaved at random
+    elif query is not None:
+        try:
+            tracks: list[str] = query_tracks(query)
+        except ValueError as e:
+            secho(f"🚨 {e}", fg=colors.RED, err=True)
+            raise Exit(1)
+        if not tracks:
+            secho(f"🔎 No tracks match `{query}`.", fg=colors.YELLOW)
+            raise Exit(1)
+        secho(f"🔎 {len(tracks)} tracks match `{query}`.", fg=colors.BRIGHT_CYAN)
+        playlist = write_m3u(tracks, QUERY_PLAYLIST)
+    elif scan:
         secho(f"🔎 Found {len(playlists)} Playlists.", fg=colors.BRIGHT_CYAN)
         choices: list[str] = [str(playlist.stem) for playlist in playlists]
         result: str | None = gum_choose(choices)
         if result is not None:
-            playlist: Path = PLAYLISTS / result
+            playlist: Path = playlists[choices.index(result)]
         else:
             secho("🚨 Cancelled.", fg=colors.RED)
             raise Exit(1)
+    if not mix and query is None:
+        assert playlist in playlists, "Playlist not found."
 
-    assert playlist in playlists, "Playlist not found."
+    # Switch the playlist of an mpv that's already running, keeping its state
+    socket_path: Path = mpv_socket_path()
+    client: MpvClient | None = connect_mpv(socket_path)
+    if client is not None:
+        try:
+            with client, span("mpv ipc switch", playlist=playlist):
+                load_playlist(client, playlist, shuffle)
+        except (MpvError, OSError) as e:
+            secho(f"Failed to switch to {playlist}: {e}", fg=colors.RED, err=True)
+            raise Exit(1)
+        secho(f"🎵 Switched to {playlist}", fg=colors.BRIGHT_GREEN)
+        streamer: threading.Thread | None = (
+            start_mix_stream(socket_path, remainder) if remainder is not None else None
+        )
+        if prefetch:
+            follow_playlist(socket_path, prefetch)
+        if streamer is not None:
+            streamer.join()
+        return None
 
     secho(f"🎵 Launching {playlist}", fg=colors.BRIGHT_GREEN)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
     mpv_cmd_prefix: tuple[str, ...] = nix_run_prefix("mpv")
     mpv_cmd_options: tuple[str, ...] = (
-        ("--loop-playlist", "--no-video", "--shuffle")
-        if shuffle
-        else ("--loop-playlist", "--no-video")
+        "--loop-playlist",
+        "--no-video",
+        f"--input-ipc-server={socket_path}",
+        *(("--shuffle",) if shuffle else ()),
     )
     cmd: tuple[str, ...] = (
         *mpv_cmd_prefix,
@@ -63,6 +207,21 @@ def mpv_playlists(
         str(playlist),
     )
     print(cmd)
+    if prefetch or remainder is not None:
+        # Stay alive next to mpv to feed it the mix and cached tracks. No mpv
+        # answered on the socket, so a leftover file is stale and would end
+        # the wait below before mpv listens.
+        socket_path.unlink(missing_ok=True)
+        process: subprocess.Popen = subprocess.Popen(cmd)
+        while not socket_path.exists() and process.poll() is None:
+            time.sleep(0.05)
+        if process.poll() is None:
+            if remainder is not None:
+                start_mix_stream(socket_path, remainder)
+            if prefetch:
+                follow_playlist(socket_path, prefetch)
+        raise Exit(process.wait())
+    flush_trace()  # os.execv skips atexit handlers
     try:
         os.execv(mpv_cmd_prefix[0], cmd)
     except Exception as e:
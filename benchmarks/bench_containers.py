@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Size and cold-start report for the docker-archive images built by the flake.
+
+    nix build .#password_generator-container .#human_timestamp-container ...
+    python benchmarks/bench_containers.py result*
+    python benchmarks/bench_containers.py --runtime podman --runs 5 result*
+
+Layers are identified by their content digest, so the "unique MiB" column is
+what pulling an image costs once the other images are already present.
+"""
+
+# Standard Library
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tarfile
+import time
+from collections import Counter
+from pathlib import Path
+
+# Globals
+MIB: int = 1024 * 1024
+
+
+def read_layers(archive: Path) -> tuple[str, dict[str, int]]:
+    """Returns the image tag and its layer sizes keyed by layer path."""
+    with tarfile.open(archive) as tar:
+        manifest_file = tar.extractfile("manifest.json")
+        assert manifest_file is not None, f"{archive} has no manifest.json"
+        manifest: dict = json.load(manifest_file)[0]
+        layers: dict[str, int] = {
+            layer: tar.getmember(layer).size for layer in manifest["Layers"]
+        }
+    return manifest["RepoTags"][0], layers
+
+
+def cold_start_ms(runtime: str, archive: Path, tag: str, runs: int) -> float:
+    """Loads an image and returns the median wall time of `run --rm` in ms."""
+    subprocess.run(
+        [runtime, "load", "-i", str(archive)], check=True, capture_output=True
+    )
+    samples: list[float] = []
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        subprocess.run([runtime, "run", "--rm", tag, "--help"], capture_output=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("archives", nargs="+", type=Path)
+    parser.add_argument(
+        "--runtime",
+        default=None,
+        help="docker or podman; measure cold start with `run --rm` (default: sizes only).",
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.runtime and shutil.which(args.runtime) is None:
+        sys.exit(f"{args.runtime} not found")
+
+    images: list[tuple[Path, str, dict[str, int]]] = [
+        (archive, *read_layers(archive)) for archive in args.archives
+    ]
+    usage: Counter[str] = Counter(layer for _, _, layers in images for layer in layers)
+    header: str = f"{'image':<40} {'layers':>6} {'MiB':>8} {'unique MiB':>11}"
+    print(header + (f" {'cold start ms':>14}" if args.runtime else ""))
+    for archive, tag, layers in images:
+        total: int = sum(layers.values())
+        unique: int = sum(size for layer, size in layers.items() if usage[layer] == 1)
+        row: str = (
+            f"{tag:<40} {len(layers):>6} {total / MIB:>8.1f} {unique / MIB:>11.1f}"
+        )
+        if args.runtime:
+            row += f" {cold_start_ms(args.runtime, archive, tag, args.runs):>14.1f}"
+        print(row)
+
+    sizes: dict[str, int] = {
+        layer: size for _, _, layers in images for layer, size in layers.items()
+    }
+    naive: int = sum(sum(layers.values()) for _, _, layers in images)
+    print(
+        f"\n{len(images)} images: {naive / MIB:.1f} MiB pulled separately, "
+        f"{sum(sizes.values()) / MIB:.1f} MiB with shared layers deduplicated"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Calls/sec of `moscripts <tool>` with and without the `moscriptsd` daemon.
+
+With the daemon running, calls go through `python -m moscripts` and through
+the standalone client shim (`python -I -S client.py`).
+"""
+
+# Standard Library
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# My Imports
+import moscripts.client
+from moscripts.client import call_daemon
+
+
+def calls_per_second(cmd: list[str], env: dict[str, str], calls: int) -> float:
+    start: float = time.perf_counter()
+    for _ in range(calls):
+        subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, check=True)
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--tool", default="password_generator")
+    parser.add_argument("args", nargs="*", default=["--cli"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path: Path = Path(tmp) / "daemon.sock"
+        env: dict[str, str] = {
+            **os.environ,
+            "MOSCRIPTS_DAEMON_SOCKET": str(socket_path),
+        }
+        cmd: list[str] = [sys.executable, "-m", "moscripts", args.tool, *args.args]
+
+        without: float = calls_per_second(
+            cmd, {**env, "MOSCRIPTS_NO_DAEMON": "1"}, args.calls
+        )
+        daemon = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "moscripts",
+                "moscriptsd",
+                "--socket",
+                str(socket_path),
+            ],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            while not socket_path.exists():
+                time.sleep(0.05)
+            with_daemon: float = calls_per_second(cmd, env, args.calls)
+            shim: list[str] = [
+                sys.executable,
+                "-I",
+                "-S",
+                moscripts.client.__file__,
+                args.tool,
+                *args.args,
+            ]
+            with_shim: float = calls_per_second(shim, env, args.calls)
+
+            # Daemon round trips from an already running interpreter
+            with open(os.devnull, "w") as devnull:
+                fds: tuple[int, int, int] = (0, devnull.fileno(), 2)
+                start: float = time.perf_counter()
+                for _ in range(args.calls):
+                    call_daemon(args.tool, args.args, socket_path, fds)
+                in_process: float = args.calls / (time.perf_counter() - start)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    print(f"without daemon:        {without:>8.1f} calls/sec")
+    print(f"with daemon:           {with_daemon:>8.1f} calls/sec")
+    print(f"with daemon, shim:     {with_shim:>8.1f} calls/sec")
+    print(f"daemon round trip:     {in_process:>8.1f} calls/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Throughput benchmark for `human_timestamp` batch conversion, in lines/sec."""
+
+# Standard Library
+import argparse
+import importlib.util
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import ModuleType
+
+# Globals
+ROOT: Path = Path(__file__).resolve().parent.parent
+SCRIPT: Path = ROOT / "pythonScripts" / "human_timestamp.py"
+
+
+def load_script() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("human_timestamp", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_lines(count: int, seed: int = 0) -> list[str]:
+    """Builds a sorted, log-like mix of epoch seconds, epoch ms and ISO-8601 lines."""
+    rng: random.Random = random.Random(seed)
+    start: int = 1_600_000_000
+    lines: list[str] = []
+    for i in range(count):
+        epoch: int = start + i * 3 + rng.randrange(3)
+        kind: int = i % 3
+        if kind == 0:
+            lines.append(str(epoch))
+        elif kind == 1:
+            lines.append(str(epoch * 1000 + rng.randrange(1000)))
+        else:
+            lines.append(datetime.fromtimestamp(epoch, timezone.utc).isoformat())
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--target-tz", default="America/Chicago")
+    args = parser.parse_args()
+
+    module = load_script()
+    lines: list[str] = make_lines(args.lines)
+
+    start: float = time.perf_counter()
+    for _ in module.convert_many(lines, target_tz=args.target_tz):
+        pass
+    elapsed: float = time.perf_counter() - start
+    print(f"convert_many:  {args.lines / elapsed:>12,.0f} lines/sec")
+
+    payload: str = "\n".join(lines) + "\n"
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, str(SCRIPT), "--stdin", "-t", args.target_tz],
+        input=payload,
+        stdout=subprocess.DEVNULL,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    print(f"--stdin (CLI): {args.lines / elapsed:>12,.0f} lines/sec")
+
+
+if __name__ == "__main__":
+    main()
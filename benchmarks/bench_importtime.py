@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""`-X importtime` comparison: a tool run normally vs through a frozen launcher.
+
+The launcher (see src/moscripts/launcher.py) is generated against this
+interpreter into a temporary directory, then both commands are run with
+`-X importtime` and `--help`.
+"""
+
+# Standard Library
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# My Imports
+from moscripts.launcher import write_launcher
+from moscripts.multicall import tool_paths
+
+
+def import_profile(cmd: list[str]) -> tuple[int, int]:
+    """Returns the number of imported modules and their summed self time in us."""
+    stderr: str = subprocess.run(
+        cmd, capture_output=True, text=True, check=False
+    ).stderr
+    rows: list[list[str]] = [
+        line.split("|")
+        for line in stderr.splitlines()
+        if line.startswith("import time:")
+    ]
+    timings: list[int] = [int(row[0].split(":")[1]) for row in rows[1:]]
+    return len(timings), sum(timings)
+
+
+def wall_ms(cmd: list[str], runs: int) -> float:
+    """Returns the median wall time of a command in ms."""
+    samples: list[float] = []
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        subprocess.run(cmd, capture_output=True, check=False)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("tools", nargs="*", help="Tools to measure (default: all).")
+    args = parser.parse_args()
+
+    tools: dict[str, Path] = tool_paths()
+    python: Path = Path(sys.executable)
+    print(f"{'tool':<20} {'mode':<8} {'modules':>8} {'import ms':>10} {'wall ms':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.tools or sorted(tools):
+            launcher: Path = Path(tmp) / name
+            write_launcher(python, tools[name], launcher)
+            commands: dict[str, list[str]] = {
+                "site": [str(python), str(tools[name]), "--help"],
+                "frozen": [str(python), "-IS", str(launcher), "--help"],
+            }
+            for mode, cmd in commands.items():
+                modules, import_us = import_profile(
+                    [cmd[0], "-X", "importtime", *cmd[1:]]
+                )
+                print(
+                    f"{name:<20} {mode:<8} {modules:>8} {import_us / 1000:>10.1f} "
+                    f"{wall_ms(cmd, args.runs):>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Cold-start time per tool: the standalone script vs `python -m moscripts <tool>`."""
+
+# Standard Library
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# My Imports
+from moscripts.multicall import tool_paths
+
+# Globals
+# Arguments that make each tool exit quickly without prompting.
+TOOL_ARGS: dict[str, list[str]] = {
+    "hello": [],
+    "human_timestamp": [],
+    "password_generator": ["--cli"],
+    "motmp": ["--help"],
+    "mpv_playlists": ["--help"],
+}
+
+
+def time_command(cmd: list[str], runs: int) -> tuple[float, int]:
+    """Returns the median wall time in ms and the last exit code."""
+    samples: list[float] = []
+    returncode: int = 0
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        returncode = subprocess.run(cmd, capture_output=True).returncode
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), returncode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("tools", nargs="*", help="Tools to measure (default: all).")
+    args = parser.parse_args()
+
+    tools: dict[str, Path] = tool_paths()
+    print(f"{'tool':<20} {'script ms':>10} {'multicall ms':>13}")
+    for name in args.tools or sorted(tools):
+        extra: list[str] = TOOL_ARGS.get(name, ["--help"])
+        script_ms, script_rc = time_command(
+            [sys.executable, str(tools[name]), *extra], args.runs
+        )
+        multicall_ms, multicall_rc = time_command(
+            [sys.executable, "-m", "moscripts", name, *extra], args.runs
+        )
+        note: str = "" if script_rc == multicall_rc == 0 else "  (non-zero exit)"
+        print(f"{name:<20} {script_ms:>10.1f} {multicall_ms:>13.1f}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark of `str_to_timezone` over a realistic mix of IANA names and UTC offsets."""
+
+# Standard Library
+import argparse
+import random
+import re
+import time
+from collections.abc import Callable
+from datetime import timedelta, timezone
+from zoneinfo import ZoneInfo
+
+# My Imports
+from moscripts.utilities import parse_many, str_to_timezone
+
+# Globals
+ZONES: tuple[str, ...] = (
+    "America/Chicago",
+    "America/New_York",
+    "America/Los_Angeles",
+    "Europe/London",
+    "Europe/Berlin",
+    "Asia/Kolkata",
+    "Asia/Tokyo",
+    "Australia/Sydney",
+    "UTC",
+)
+OFFSETS: tuple[str, ...] = ("+05:30", "-08:00", "+0100", "-0300", "+09", "+00:00")
+INVALID: tuple[str, ...] = ("", "unknown", "N/A")
+
+
+def make_records(count: int, seed: int = 0) -> list[str]:
+    """Builds per-record timezone strings: mostly IANA names, some offsets, a few invalid."""
+    rng: random.Random = random.Random(seed)
+    population: tuple[str, ...] = ZONES + OFFSETS + INVALID
+    weights: list[int] = [20] * len(ZONES) + [10] * len(OFFSETS) + [1] * len(INVALID)
+    return rng.choices(population, weights=weights, k=count)
+
+
+def reference_str_to_timezone(tz_str: str) -> ZoneInfo | timezone:
+    """The previous implementation: ZoneInfo first, then an uncompiled regex."""
+    try:
+        return ZoneInfo(tz_str)
+    except Exception:
+        try:
+            match = re.match(r"([+-])(\d{1,2})(?::?(\d{2}))?", tz_str)
+            if match:
+                sign, hours_str, minutes_str = match.groups()
+                offset = timedelta(
+                    hours=int(hours_str), minutes=int(minutes_str) if minutes_str else 0
+                )
+                return timezone(-offset if sign == "-" else offset)
+            raise ValueError("Invalid timezone string format")
+        except ValueError:
+            return timezone.utc
+
+
+def measure(name: str, func: Callable[[], object], count: int) -> None:
+    start: float = time.perf_counter()
+    func()
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:<28} {count / elapsed:>14,.0f} records/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=500_000)
+    args = parser.parse_args()
+
+    records: list[str] = make_records(args.records)
+    measure(
+        "reference",
+        lambda: [reference_str_to_timezone(record) for record in records],
+        args.records,
+    )
+    str_to_timezone.cache_clear()
+    measure(
+        "str_to_timezone (uncached)",
+        lambda: [str_to_timezone.__wrapped__(record) for record in records],
+        args.records,
+    )
+    measure(
+        "str_to_timezone (memo)",
+        lambda: [str_to_timezone(record) for record in records],
+        args.records,
+    )
+    measure("parse_many", lambda: parse_many(records), args.records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Standard Library
+import importlib.util
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+# Third Party
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# Globals
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+
+def load_script(path: Path) -> ModuleType:
+    """Imports an app or standalone script by path without running its CLI."""
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def password_generator() -> ModuleType:
+    return load_script(ROOT / "pythonScripts" / "password_generator.py")
+
+
+@pytest.fixture(scope="session")
+def motmp() -> ModuleType:
+    return load_script(ROOT / "apps" / "motmp.py")
+
+
+@pytest.fixture(scope="session")
+def motmp_directory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[int], Path]:
+    """Builds (once per size) a synthetic motmp cache with `count` notebooks.
+
+    Every other notebook gets a marimo session file, like a cache that has
+    been in use for a while.
+    """
+    directories: dict[int, Path] = {}
+
+    def build(count: int) -> Path:
+        if count not in directories:
+            directory: Path = tmp_path_factory.mktemp(f"motmp_{count}")
+            session: Path = directory / "__marimo__" / "session"
+            session.mkdir(parents=True)
+            for index in range(count):
+                name: str = f"motmp_{index:08d}.py"
+                (directory / name).touch()
+                if index % 2 == 0:
+                    (session / f"{name}.json").touch()
+            directories[count] = directory
+        return directories[count]
+
+    return build
@@ -0,0 +1,33 @@
+#!/usr/bin/env bash
+# Runs the pytest-benchmark suite against stored JSON baselines.
+#
+#   benchmarks/run.sh save [pytest args...]     record a new baseline
+#   benchmarks/run.sh compare [pytest args...]  compare with the latest baseline and
+#                                               fail on regressions beyond $THRESHOLD
+set -euo pipefail
+
+BENCH_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+STORAGE="$BENCH_DIR/.baselines"
+THRESHOLD="${THRESHOLD:-15%}"
+MODE="${1:-compare}"
+shift || true
+
+case "$MODE" in
+  save)
+    exec python -m pytest "$BENCH_DIR" --benchmark-only \
+      --benchmark-storage="file://$STORAGE" --benchmark-save=baseline "$@"
+    ;;
+  compare)
+    if ! compgen -G "$STORAGE/*/*_baseline.json" >/dev/null; then
+      echo "No baseline in $STORAGE. Record one on this machine with: $0 save" >&2
+      exit 2
+    fi
+    exec python -m pytest "$BENCH_DIR" --benchmark-only \
+      --benchmark-storage="file://$STORAGE" --benchmark-compare \
+      --benchmark-compare-fail="mean:$THRESHOLD" "$@"
+    ;;
+  *)
+    echo "Usage: $0 save|compare [pytest args...]" >&2
+    exit 2
+    ;;
+esac
@@ -0,0 +1,28 @@
+# Standard Library
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+# Third Party
+import pytest
+
+# Globals
+MOTMP_SIZES: tuple[int, ...] = (1_000, 10_000, 100_000)
+
+
+@pytest.mark.parametrize("count", MOTMP_SIZES)
+def test_scan_motmp(
+    benchmark, motmp: ModuleType, motmp_directory: Callable[[int], Path], count: int
+) -> None:
+    directory: Path = motmp_directory(count)
+    files = benchmark(motmp.scan_motmp, directory)
+    assert len(files) == count
+
+
+@pytest.mark.parametrize("count", MOTMP_SIZES)
+def test_recent_motmp_files(
+    benchmark, motmp: ModuleType, motmp_directory: Callable[[int], Path], count: int
+) -> None:
+    files = motmp.scan_motmp(motmp_directory(count))
+    result = benchmark(lambda: list(motmp.recent_motmp_files(files, limit=50)))
+    assert len(result) == 50
@@ -0,0 +1,20 @@
+# Standard Library
+import subprocess
+import sys
+
+# Third Party
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module", ["moscripts", "moscripts.utilities", "moscripts.gum"]
+)
+def test_import_time(benchmark, module: str) -> None:
+    """Cold import of a moscripts module in a fresh interpreter."""
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", f"import {module}"],),
+        kwargs={"check": True},
+        rounds=10,
+        warmup_rounds=1,
+    )
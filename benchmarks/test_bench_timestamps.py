@@ -0,0 +1,18 @@
+# Standard Library
+from datetime import datetime, timezone
+
+# My Imports
+from moscripts.utilities import convert_many, create_human_readable_timestamp
+
+EPOCHS: list[int] = list(range(1_700_000_000, 1_700_000_000 + 100_000 * 7, 7))
+
+
+def test_create_human_readable_timestamp(benchmark) -> None:
+    moment: datetime = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    result: str = benchmark(create_human_readable_timestamp, moment)
+    assert result == "2023-12-31 06:00:00 PM"
+
+
+def test_convert_many(benchmark) -> None:
+    result: list[str] = benchmark(lambda: list(convert_many(EPOCHS)))
+    assert len(result) == len(EPOCHS)
@@ -56,6 +56,46 @@
     standaloneScripts = loadStandaloneScripts ./pythonScripts;
     apps = loadApps ./apps;
 
+    # Names of every package pinned in a uv lock file
+    lockedNames = lockFile: map (package: package.name) (lib.importTOML lockFile).package;
+
+    # Overlay compiling each locked package to .pyc at install time. The store is
+    # read-only, so without shipped bytecode CPython recompiles every module on
+    # every run. unchecked-hash .pyc are trusted as-is: no source stat or hash
+    # on import, which is safe because store paths never change.
+    mkBytecodeOverlay = names: final: prev:
+      lib.genAttrs (lib.filter (name: prev ? ${name}) names) (
+        name:
+          prev.${name}.overrideAttrs (old: {
+            postInstall =
+              (old.postInstall or "")
+              + ''
+                unset PYTHONDONTWRITEBYTECODE
+                if [ -d $out/${final.python.sitePackages} ]; then
+                  ${final.python.interpreter} -m compileall -q --invalidation-mode unchecked-hash \
+                    $out/${final.python.sitePackages}
+                fi
+              '';
+          })
+      );
+
+    # Executable running `script` with the venv's interpreter under `-I -S` and a
+    # sys.path frozen at build time, skipping site and .pth processing
+    # (see src/moscripts/launcher.py). The frozen path is also written to
+    # share/moscripts/<name>.sys-path.json, and the script's code object to
+    # share/moscripts/<name>.code so starts don't recompile it.
+    makeFrozenExecutable = pkgs: name: venv: script:
+      pkgs.runCommand "${name}-in-bin" {} ''
+        mkdir -p $out/bin $out/share/moscripts
+        cp ${script} $out/share/moscripts/${name}.py
+        ${venv}/bin/python ${./src/moscripts/launcher.py} \
+          --python ${venv}/bin/python \
+          --script $out/share/moscripts/${name}.py \
+          --out $out/bin/${name} \
+          --manifest $out/share/moscripts/${name}.sys-path.json \
+          --code $out/share/moscripts/${name}.code
+      '';
+
     # Create derivations for standalone scripts
     standaloneScriptDerivations = forAllSystems (
       system: let
@@ -75,17 +115,14 @@
               lib.composeManyExtensions [
                 pyproject-build-systems.overlays.default
                 overlay
+                (mkBytecodeOverlay (lockedNames (./pythonScripts + "/${name}.lock")))
                 pyprojectOverrides
               ]
             );
           in
-            pkgs.writeScript script.name (
-              script.renderScript {
-                venv = script.mkVirtualEnv {
-                  inherit pythonSet;
-                };
-              }
-            )
+            makeFrozenExecutable pkgs (lib.removeSuffix ".py" name) (script.mkVirtualEnv {
+              inherit pythonSet;
+            }) (./pythonScripts + "/${name}")
         )
         standaloneScripts
     );
@@ -185,6 +222,7 @@
           lib.composeManyExtensions [
             pyproject-build-systems.overlays.default
             overlay
+            (mkBytecodeOverlay (lockedNames ./uv.lock))
             pyprojectOverrides
           ]
         );
@@ -206,7 +244,8 @@
         pkgs = nixpkgs.legacyPackages.${system};
         python = pkgs.python313;
         pythonSet = pythonSets.${system}.standard;
-        venv = pythonSet.mkVirtualEnv "moscripts-venv" workspace.deps.default;
+        # With the `tags` extra, so mpv_playlists --index reads tags with mutagen
+        venv = pythonSet.mkVirtualEnv "moscripts-venv" (workspace.deps.default // {moscripts = ["tags"];});
         # alpine base docker image
         alpine = pkgs.dockerTools.pullImage {
           imageName = "alpine";
@@ -223,73 +262,14 @@
             else system;
         };
 
-        # Helper to create executable scripts (for standalone scripts)
-        makeStandaloneExecutable = scriptName: scriptDrv:
-          pkgs.stdenv.mkDerivation {
-            name = "${scriptName}-in-bin";
-            buildCommand = ''
-              mkdir -p $out/bin
-              cp ${scriptDrv} $out/bin/${scriptName}
-              chmod +x $out/bin/${scriptName}
-            '';
-          };
-
         # Helper to create executable apps (for apps that need moscripts venv)
-        makeAppExecutable = appName: appPath:
-          pkgs.stdenv.mkDerivation {
-            name = "${appName}-in-bin";
-            buildCommand = ''
-              mkdir -p $out/bin
-              cp ${appPath} $out/bin/${appName}
-              chmod +x $out/bin/${appName}
-              patchShebangs $out/bin/${appName}
-            '';
-            buildInputs = [venv];
-          };
-
-        # Helper to create docker images for standalone scripts
-        makeDockerImage = scriptName: scriptDrv:
-          pkgs.dockerTools.buildLayeredImage {
-            name = "${scriptName}-container";
-            fromImage = alpine;
-            contents = [(makeStandaloneExecutable scriptName scriptDrv) pkgs.curl pkgs.nix];
-            config = {
-              Cmd = ["/bin/${scriptName}"];
-            };
-          };
-
-        # Helper to create docker images for apps
-        makeAppDockerImage = appName: appPath:
-          pkgs.dockerTools.buildLayeredImage {
-            name = "${appName}-container";
-            fromImage = alpine;
-            contents = [(makeAppExecutable appName appPath) pkgs.curl pkgs.nix];
-            config = {
-              Cmd = ["/bin/${appName}"];
-            };
-          };
+        makeAppExecutable = appName: appPath: makeFrozenExecutable pkgs appName venv appPath;
 
         # Create binary packages for standalone scripts
         standaloneBinaryPackages =
-          lib.mapAttrs' (
-            name: drv:
-              lib.nameValuePair (lib.removeSuffix ".py" name)
-              (makeStandaloneExecutable (lib.removeSuffix ".py" name) drv)
-          )
+          lib.mapAttrs' (name: drv: lib.nameValuePair (lib.removeSuffix ".py" name) drv)
           standaloneScriptDerivations.${system};
 
-        # Create container packages for standalone scripts
-        standaloneContainerPackages =
-          if pkgs.stdenv.isLinux
-          then
-            lib.mapAttrs' (
-              name: drv:
-                lib.nameValuePair "${lib.removeSuffix ".py" name}-container"
-                (makeDockerImage (lib.removeSuffix ".py" name) drv)
-            )
-            standaloneScriptDerivations.${system}
-          else {};
-
         # Create binary packages for apps
         appBinaryPackages =
           lib.mapAttrs' (
@@ -300,19 +280,74 @@
           )
           apps;
 
-        # Create container packages for apps
-        appContainerPackages =
+        # Tool names served by the multi-call binary
+        toolNames = map (lib.removeSuffix ".py") (lib.attrNames apps ++ lib.attrNames standaloneScripts);
+
+        # Tools the moscriptsd daemon can serve, mirroring DAEMON_TOOLS in src/moscripts/client.py
+        daemonTools = ["hello" "human_timestamp" "password_generator"];
+
+        # Single busybox-style `moscripts` binary: one venv and interpreter for every tool,
+        # only the requested tool's module is imported (see src/moscripts/multicall.py).
+        # Daemon tools start through the standalone client shim, which tries the daemon
+        # before importing anything from moscripts.
+        multicall = pkgs.stdenv.mkDerivation {
+          name = "moscripts-multicall";
+          nativeBuildInputs = [pkgs.makeWrapper];
+          buildCommand = ''
+            mkdir -p $out/bin $out/share/moscripts
+            cp -r ${./apps} $out/share/moscripts/apps
+            cp -r ${./pythonScripts} $out/share/moscripts/pythonScripts
+            makeWrapper ${venv}/bin/moscripts $out/bin/moscripts \
+              --set MOSCRIPTS_ROOT $out/share/moscripts
+            cp ${./src/moscripts/client.py} $out/share/moscripts/client.py
+            for tool in ${lib.concatStringsSep " " toolNames}; do
+              makeWrapper ${venv}/bin/moscripts $out/bin/moscripts-$tool \
+                --set MOSCRIPTS_ROOT $out/share/moscripts \
+                --add-flags $tool
+            done
+            for tool in ${lib.concatStringsSep " " daemonTools}; do
+              makeWrapper ${venv}/bin/python $out/bin/moscripts-$tool \
+                --set MOSCRIPTS_ROOT $out/share/moscripts \
+                --add-flags "-I -S $out/share/moscripts/client.py $tool"
+            done
+          '';
+          meta.description = "Multi-call moscripts binary dispatching to every app and script";
+        };
+
+        # Tools that shell out through `nix run` (gum, uv, mpv) and need nix in their image
+        nixTools = ["motmp" "mpv_playlists"];
+
+        # Helper to create docker images. Every image runs its tool through the
+        # multi-call venv, so all images share one interpreter + moscripts closure.
+        # buildLayeredImage puts each store path in its own layer, ordered by
+        # popularity, so those layers are byte-identical across images and
+        # registries store and pull them once.
+        makeDockerImage = toolName:
+          pkgs.dockerTools.buildLayeredImage {
+            name = "${toolName}-container";
+            fromImage = alpine;
+            contents = [multicall] ++ lib.optionals (lib.elem toolName nixTools) [pkgs.curl pkgs.nix];
+            maxLayers = 120;
+            config = {
+              Cmd = ["/bin/moscripts-${toolName}"];
+              Env = ["MOSCRIPTS_NO_DAEMON=1"];
+            };
+          };
+
+        # Create container packages for apps and standalone scripts
+        containerPackages =
           if pkgs.stdenv.isLinux
-          then
-            lib.mapAttrs' (
-              name: appPath: let
-                appName = lib.removeSuffix ".py" name;
-              in
-                lib.nameValuePair "${appName}-container" (makeAppDockerImage appName appPath)
-            )
-            apps
+          then lib.listToAttrs (map (tool: lib.nameValuePair "${tool}-container" (makeDockerImage tool)) toolNames)
           else {};
 
+        # Image size report, attached to the build as `nix build .#containers-report`.
+        # Cold start needs a container runtime: see benchmarks/bench_containers.py.
+        containersReport = pkgs.runCommand "moscripts-containers-report" {} ''
+          mkdir $out
+          ${python.interpreter} ${./benchmarks/bench_containers.py} \
+            ${lib.concatStringsSep " " (lib.attrValues containerPackages)} > $out/report.txt
+        '';
+
         # Create a default package that bundles all binary packages
         default = pkgs.symlinkJoin {
           name = "moscripts-bundled-apps";
@@ -325,11 +360,12 @@
       in
         {
           inherit default;
+          moscripts = multicall;
         }
+        // lib.optionalAttrs pkgs.stdenv.isLinux {containers-report = containersReport;}
         // standaloneBinaryPackages
-        // standaloneContainerPackages
         // appBinaryPackages
-        // appContainerPackages
+        // containerPackages
     );
 
     # Create apps that are runnable with `nix run .#<app>`
@@ -345,7 +381,7 @@
           };
         };
         # Filter out the 'default' package from the runnable apps
-        runnablePackages = lib.filterAttrs (name: _: name != "default" && !lib.hasSuffix "-container" name) self.packages.${system};
+        runnablePackages = lib.filterAttrs (name: _: name != "default" && name != "containers-report" && !lib.hasSuffix "-container" name) self.packages.${system};
       in
         lib.mapAttrs' (name: _: lib.nameValuePair name (makeRunnableApp name))
         runnablePackages
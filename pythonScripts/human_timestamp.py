@@ -6,10 +6,93 @@
 # ]
 # ///
 
+import sys
 import typer
-from datetime import datetime, timezone
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
+# Epoch values at or above this magnitude are treated as milliseconds.
+EPOCH_MS_THRESHOLD: int = 100_000_000_000
+# Maximum number of timezones kept in the ZoneInfo and transition table caches.
+ZONE_CACHE_SIZE: int = 64
+# UTC years [start, end) covered by the precomputed zone transition tables.
+TRANSITION_YEARS: tuple[int, int] = (1970, 2100)
+UNIX_EPOCH: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# strftime directives that depend on the time of day and on nothing else.
+_TIME_DIRECTIVES: frozenset[str] = frozenset("HIMSpf")
+# strftime directives that mix the time of day into a composite field.
+_COMPOSITE_DIRECTIVES: frozenset[str] = frozenset("cXrTRsEOklP")
+_MERIDIEM: tuple[str, str] = (
+    datetime(2000, 1, 1, 0).strftime("%p"),
+    datetime(2000, 1, 1, 12).strftime("%p"),
+)
+
+
+@lru_cache(maxsize=ZONE_CACHE_SIZE)
+def get_zone(name: str) -> ZoneInfo:
+    """Returns the ZoneInfo for an IANA timezone name from a bounded LRU cache."""
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=ZONE_CACHE_SIZE)
+def zone_transitions(name: str) -> tuple[list[int], list[timezone], int]:
+    """Precomputes the UTC-offset transition table of a zone.
+
+    The zone is sampled once a day across `TRANSITION_YEARS` and every change
+    of offset or abbreviation is bisected down to the second, so converting an
+    instant inside the table only needs a fixed-offset timezone.
+
+    Args:
+        name: The IANA timezone name.
+
+    Returns:
+        The sorted epoch seconds at which each period starts, a fixed-offset
+        timezone (named after the zone's abbreviation) for each period, and
+        the epoch second at which the table stops being valid.
+    """
+    zone: ZoneInfo = get_zone(name)
+    first: int = int(
+        datetime(TRANSITION_YEARS[0], 1, 1, tzinfo=timezone.utc).timestamp()
+    )
+    end: int = int(datetime(TRANSITION_YEARS[1], 1, 1, tzinfo=timezone.utc).timestamp())
+    fixed: dict[tuple[timedelta | None, str | None], timezone] = {}
+
+    def period(epoch: int) -> timezone:
+        local_dt: datetime = datetime.fromtimestamp(epoch, zone)
+        key: tuple[timedelta | None, str | None] = (
+            local_dt.utcoffset(),
+            local_dt.tzname(),
+        )
+        if key not in fixed:
+            offset: timedelta = key[0] or timedelta(0)
+            fixed[key] = (
+                timezone(offset) if key[1] is None else timezone(offset, key[1])
+            )
+        return fixed[key]
+
+    starts: list[int] = [first]
+    zones: list[timezone] = [period(first)]
+    known: int = first
+    for epoch in range(first + 86_400, end + 86_400, 86_400):
+        current: timezone = period(epoch)
+        while current is not zones[-1]:
+            # Bisect (known, epoch] for the first second of the next period.
+            low, high = known, epoch
+            while high - low > 1:
+                mid: int = (low + high) // 2
+                if period(mid) is zones[-1]:
+                    low = mid
+                else:
+                    high = mid
+            starts.append(high)
+            zones.append(period(high))
+            known = high
+        known = epoch
+    return starts, zones, end
+
 
 def create_human_readable_timestamp(
     dt_object: datetime | None = None,
@@ -18,8 +101,9 @@ def create_human_readable_timestamp(
 ) -> str:
     """Creates a formatted, human-readable timestamp from a datetime object.
 
-    This function is optimized to cache ZoneInfo lookups, making it highly
-    performant for repeated calls with the same target timezone.
+    ZoneInfo lookups go through the bounded `get_zone` LRU cache, so repeated
+    calls with the same target timezone skip the zone lookup. Use
+    `convert_many` for bulk conversion.
 
     Args:
         dt_object: An optional timezone-aware datetime object. If naive, it's
@@ -37,12 +121,184 @@ def create_human_readable_timestamp(
     else:
         source_dt = dt_object
 
-    display_tz: ZoneInfo = ZoneInfo(target_tz)
+    display_tz: ZoneInfo = get_zone(target_tz)
     local_dt: datetime = source_dt.astimezone(display_tz)
 
     return local_dt.strftime(fmt)
 
 
+def parse_timestamp(value: str | int | float | datetime) -> datetime:
+    """Parses an epoch or ISO-8601 timestamp into an aware datetime.
+
+    Numeric values are epoch seconds, or epoch milliseconds when their
+    magnitude is at least `EPOCH_MS_THRESHOLD`. Strings that are not numeric
+    are parsed as ISO-8601. Naive results are assumed to be in UTC.
+
+    Raises:
+        ValueError: If the value is not a recognised timestamp.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+    return UNIX_EPOCH + timedelta(microseconds=_epoch_micros(value))
+
+
+def _epoch_micros(value: str | int | float | datetime) -> int:
+    """Returns the epoch microseconds of a timestamp without building a datetime for numbers."""
+    if isinstance(value, datetime):
+        return (parse_timestamp(value) - UNIX_EPOCH) // timedelta(microseconds=1)
+    if isinstance(value, str):
+        text: str = value.strip()
+        try:
+            value = float(text) if "." in text else int(text)
+        except ValueError:
+            return _epoch_micros(datetime.fromisoformat(text))
+    if abs(value) >= EPOCH_MS_THRESHOLD:
+        return round(value * 1_000)
+    return round(value * 1_000_000)
+
+
+@lru_cache(maxsize=32)
+def _compile_format(fmt: str) -> tuple[str, tuple[str, ...]] | None:
+    """Splits a strftime format into a per-day template and time-of-day fields.
+
+    Date directives stay in the template, which is rendered with `strftime`
+    once per local day. Time-of-day directives become `%s` slots filled from
+    integer arithmetic. Returns None when the format contains directives that
+    cannot be split this way (e.g. `%c`, `%T` or platform flags like `%-d`).
+    """
+    template: list[str] = []
+    fields: list[str] = []
+    index: int = 0
+    while index < len(fmt):
+        char: str = fmt[index]
+        if char != "%":
+            template.append(char)
+            index += 1
+            continue
+        if index + 1 == len(fmt):
+            return None
+        directive: str = fmt[index + 1]
+        if directive == "%":
+            template.append("%%%%")
+        elif directive in _TIME_DIRECTIVES:
+            template.append("%%s")
+            fields.append(directive)
+        elif directive.isalpha() and directive not in _COMPOSITE_DIRECTIVES:
+            template.append("%" + directive)
+        else:
+            return None
+        index += 2
+    return "".join(template), tuple(fields)
+
+
+def _time_fields(fields: tuple[str, ...], seconds: int, micros: int) -> tuple[str, ...]:
+    """Renders the time-of-day fields of a compiled format."""
+    hour: int = seconds // 3600
+    values: dict[str, str] = {
+        "H": f"{hour:02d}",
+        "I": f"{hour % 12 or 12:02d}",
+        "M": f"{seconds // 60 % 60:02d}",
+        "S": f"{seconds % 60:02d}",
+        "p": _MERIDIEM[hour >= 12],
+        "f": f"{micros:06d}",
+    }
+    return tuple(values[field] for field in fields)
+
+
+def convert_many(
+    values: Iterable[str | int | float | datetime],
+    target_tz: str = "America/Chicago",
+    fmt: str = "%Y-%m-%d %I:%M:%S %p",
+    on_error: str = "raise",
+) -> Iterator[str]:
+    """Lazily converts many timestamps into human-readable strings.
+
+    Instants are resolved against the zone's precomputed `zone_transitions`
+    table with a moving pointer, so a sorted stream advances through the
+    table instead of doing a full timezone lookup per value. The format is
+    compiled once: date fields are rendered once per local day and time
+    fields are filled in from integer arithmetic, without a datetime per
+    value.
+
+    Args:
+        values: Epoch seconds, epoch milliseconds, ISO-8601 strings or
+                datetime objects. Blank strings are skipped.
+        target_tz: The IANA timezone name to convert the times to.
+        fmt: The strftime format string for the output.
+        on_error: What to do with an unparseable value: raise a ValueError,
+                  skip it, or pass it through unchanged.
+
+    Yields:
+        One formatted string per converted value.
+
+    Raises:
+        ValueError: If a value is invalid and `on_error` is "raise", or if
+                    `on_error` is not one of the supported modes.
+    """
+    if on_error not in ("raise", "skip", "passthrough"):
+        raise ValueError(f"Invalid on_error mode: {on_error!r}")
+    display_tz: ZoneInfo = get_zone(target_tz)
+    starts, zones, end = zone_transitions(target_tz)
+    offsets: list[int] = [
+        (zone.utcoffset(None) or timedelta(0)) // timedelta(microseconds=1)
+        for zone in zones
+    ]
+    last_start: int = len(starts) - 1
+    compiled: tuple[str, tuple[str, ...]] | None = _compile_format(fmt)
+    day_templates: dict[tuple[int, int], str] = {}
+    time_cache: dict[int, tuple[str, ...]] = {}
+    index: int = 0
+
+    for value in values:
+        if isinstance(value, str) and not value.strip():
+            continue
+        try:
+            micros: int = _epoch_micros(value)
+            epoch: int = micros // 1_000_000
+            if compiled is None or not starts[0] <= epoch < end:
+                yield (
+                    (UNIX_EPOCH + timedelta(microseconds=micros))
+                    .astimezone(display_tz)
+                    .strftime(fmt)
+                )
+                continue
+        except (ValueError, OverflowError, OSError):
+            if on_error == "skip":
+                continue
+            if on_error == "passthrough":
+                yield str(value).strip()
+                continue
+            raise ValueError(f"Invalid timestamp: {value!r}")
+
+        if epoch < starts[index]:
+            index = bisect_right(starts, epoch) - 1
+        while index < last_start and starts[index + 1] <= epoch:
+            index += 1
+
+        local_seconds, fraction = divmod(micros + offsets[index], 1_000_000)
+        day, seconds = divmod(local_seconds, 86_400)
+        template: str | None = day_templates.get((day, index))
+        if template is None:
+            if len(day_templates) >= 4096:
+                day_templates.clear()
+            midnight: datetime = datetime.fromtimestamp(
+                day * 86_400, timezone.utc
+            ).replace(tzinfo=zones[index])
+            template = midnight.strftime(compiled[0])
+            day_templates[(day, index)] = template
+
+        if "f" in compiled[1]:
+            yield template % _time_fields(compiled[1], seconds, fraction)
+            continue
+        fields: tuple[str, ...] | None = time_cache.get(seconds)
+        if fields is None:
+            fields = _time_fields(compiled[1], seconds, 0)
+            time_cache[seconds] = fields
+        yield template % fields
+
+
 app: typer.Typer = typer.Typer(
     name="human-timestamp",
     help="A simple human-readable timestamp CLI.",
@@ -57,6 +313,7 @@ def create(
         "America/Chicago",
         "--target-tz",
         "-t",
+        envvar="MOSCRIPTS_TIMEZONE",
         help="The target timezone to convert the timestamp to.",
         show_default=True,
     ),
@@ -67,8 +324,33 @@ def create(
         help="The format string to use for the timestamp.",
         show_default=True,
     ),
+    stdin: bool = typer.Option(
+        False,
+        "--stdin",
+        help="Convert timestamps read line by line from stdin (epoch s, epoch ms or ISO-8601).",
+        show_default=False,
+    ),
+    on_error: str = typer.Option(
+        "raise",
+        "--on-error",
+        help="How to handle invalid lines in --stdin mode: raise, skip or passthrough.",
+        show_default=True,
+    ),
 ) -> None:
     """Creates a human-readable timestamp and prints it to the console."""
+    if stdin:
+        try:
+            with open(
+                sys.stdout.fileno(), "w", buffering=1 << 16, closefd=False
+            ) as out:
+                for line in convert_many(sys.stdin, target_tz, fmt, on_error):
+                    out.write(line)
+                    out.write("\n")
+        except ValueError as e:
+            typer.secho(f"Error: {e}", fg=typer.colors.RED, err=True)
+            raise typer.Exit(code=1)
+        return
+
     try:
         human_time: str = create_human_readable_timestamp(target_tz=target_tz, fmt=fmt)
         typer.secho(human_time, fg=typer.colors.CYAN)
@@ -7,11 +7,19 @@
 # ///
 
 from typing import LiteralString
+import hashlib
+import itertools
 import string
+import sys
 import typer
 from typer import Typer
 import secrets
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+
+# Bytes of keystream derived per SHAKE-256 call; a multiple of 1, 2, 3 and 4
+# so multi-byte samples never straddle blocks.
+KEYSTREAM_BLOCK: int = 3 * 2**16
+KEYSTREAM_DOMAIN: bytes = b"moscripts password_generator keyed stream v1\0"
 
 
 def generate_random_password(length: int, character_set: Iterable[str]) -> str:
@@ -47,6 +55,77 @@ def generate_random_password(length: int, character_set: Iterable[str]) -> str:
     return "".join(password_chars)
 
 
+def keyed_blocks(key: bytes) -> Iterator[bytes]:
+    """Yields the keystream for a key: SHAKE-256 in counter mode.
+
+    Block `i` is SHAKE-256(domain || len(key) || key || i), truncated to
+    KEYSTREAM_BLOCK bytes.
+    """
+    prefix: bytes = KEYSTREAM_DOMAIN + len(key).to_bytes(8, "big") + key
+    for counter in itertools.count():
+        yield hashlib.shake_256(prefix + counter.to_bytes(8, "big")).digest(
+            KEYSTREAM_BLOCK
+        )
+
+
+def keyed_passwords(
+    key: bytes, length: int, character_set: Iterable[str]
+) -> Iterator[str]:
+    """Yields an endless, reproducible stream of passwords derived from a key.
+
+    NOT for production credentials: anyone who knows the key can regenerate
+    every password. Meant for fixtures that need the same passwords each run.
+
+    Characters are drawn from the keystream with rejection sampling, like
+    `secrets.choice`: each sample takes the fewest whole bytes that cover the
+    character set, and values at or above the largest multiple of its size
+    are skipped, so every character is equally likely.
+
+    Args:
+        key: Secret the stream is derived from.
+        length: The length of each password. Must be a positive integer.
+        character_set: An iterable of characters to draw from.
+
+    Raises:
+        ValueError: If the length is not a positive integer or if the
+            character_set is empty.
+    """
+    char_list: list[str] = list(character_set)
+    if length <= 0:
+        raise ValueError("Password length must be a positive integer.")
+    if not char_list:
+        raise ValueError("Character set cannot be empty.")
+
+    size: int = len(char_list)
+    width: int = 1
+    while 256**width < size:
+        width += 1
+    limit: int = 256**width - 256**width % size
+    pending: str = ""
+    if width == 1 and all(ord(char) < 256 for char in char_list):
+        # Map and reject a whole block at once in C with bytes.translate
+        table: bytes = bytes(
+            ord(char_list[value % size]) if value < limit else 0 for value in range(256)
+        )
+        rejected: bytes = bytes(range(limit, 256))
+        for block in keyed_blocks(key):
+            text: str = pending + block.translate(table, rejected).decode("latin-1")
+            end: int = len(text) - len(text) % length
+            for start in range(0, end, length):
+                yield text[start : start + length]
+            pending = text[end:]
+    else:
+        chars: list[str] = []
+        for block in keyed_blocks(key):
+            for start in range(0, KEYSTREAM_BLOCK, width):
+                value: int = int.from_bytes(block[start : start + width], "big")
+                if value < limit:
+                    chars.append(char_list[value % size])
+                    if len(chars) == length:
+                        yield "".join(chars)
+                        chars.clear()
+
+
 app: Typer = typer.Typer(
     name="passgen",
     help="A secure, customizable password generator CLI.",
@@ -108,6 +187,20 @@ def generate(
         help="Print just the password",
         show_default=False,
     ),
+    seed_key: str | None = typer.Option(
+        None,
+        "--seed-key",
+        help="Derive reproducible passwords from this key. NOT for production credentials.",
+        show_default=False,
+    ),
+    count: int = typer.Option(
+        1,
+        "--count",
+        "-n",
+        help="Number of passwords to print, one per line.",
+        min=1,
+        show_default=True,
+    ),
 ) -> None:
     """Generates a secure random password and prints it to the console."""
     character_set_parts: list[str] = []
@@ -129,11 +222,33 @@ def generate(
 
         character_set = "".join(character_set_parts)
 
-    if cli:
-        password: str = generate_random_password(length, character_set)
+    if seed_key is not None:
+        typer.secho(
+            "⚠️ --seed-key passwords can be regenerated by anyone with the key. "
+            "Use them for test fixtures only, never as real credentials.",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
+        passwords: Iterator[str] = keyed_passwords(
+            seed_key.encode(), length, character_set
+        )
+    else:
+        passwords = (
+            generate_random_password(length, character_set) for _ in itertools.count()
+        )
+
+    if count > 1:
+        # Written in batches; millions of passwords can't go through secho
+        remaining: int = count
+        while remaining > 0:
+            batch: int = min(remaining, 65536)
+            sys.stdout.write("\n".join(itertools.islice(passwords, batch)) + "\n")
+            remaining -= batch
+    elif cli:
+        password: str = next(passwords)
         typer.secho(password, fg=typer.colors.GREEN, bold=True)
     else:
-        password: str = generate_random_password(length, character_set)
+        password: str = next(passwords)
         typer.secho("Generated Password:", fg=typer.colors.BRIGHT_CYAN, bold=True)
         typer.secho(f"{length=}", fg=typer.colors.CYAN)
         typer.secho(f"{character_set=}", fg=typer.colors.CYAN)
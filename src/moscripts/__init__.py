@@ -1,12 +1,27 @@
 from pathlib import Path
 from datetime import timezone
 from zoneinfo import ZoneInfo
-from .utilities import which_nix, str_to_timezone, _get_system_timezone_name
 
 # Globals
 HOME: Path = Path.home()
-NIX: Path = which_nix()
-TZ: timezone | ZoneInfo = str_to_timezone(_get_system_timezone_name())
+# NIX and TZ are resolved on first access (see __getattr__) so tools that never
+# touch them, like `moscripts password_generator`, skip the subprocess lookups.
+NIX: Path
+TZ: timezone | ZoneInfo
+
+
+def __getattr__(name: str) -> Path | timezone | ZoneInfo:
+    """Lazily resolves the NIX and TZ globals on first access."""
+    if name not in ("NIX", "TZ"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .utilities import which_nix, str_to_timezone, _get_system_timezone_name
+
+    if name == "NIX":
+        value: Path | timezone | ZoneInfo = which_nix()
+    else:
+        value = str_to_timezone(_get_system_timezone_name())
+    globals()[name] = value
+    return value
 
 
 def hello() -> None:
@@ -0,0 +1,4 @@
+from moscripts.multicall import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# Standard Library
+import io
+import json
+import lzma
+import os
+import tarfile
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# My Imports
+from moscripts.locks import locked
+from moscripts.trace import span, traced
+
+# Globals
+ARCHIVE_FILE: str = "motmp-archive.tar.xz"
+INDEX_FILE: str = "motmp-archive.jsonl"
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveEntry:
+    """One archived notebook: a single xz stream at `offset` in the archive."""
+
+    name: str
+    offset: int
+    length: int
+    created: float
+    members: tuple[str, ...]
+
+
+def tar_members(files: Iterable[tuple[Path, str]]) -> bytes:
+    """Returns tar headers and data for files without the end-of-archive blocks.
+
+    Streams built this way can be concatenated (after decompression) into one
+    valid tar, so the archive still extracts with `tar -xJf`.
+    """
+    chunks: list[bytes] = []
+    for path, arcname in files:
+        data: bytes = path.read_bytes()
+        stat: os.stat_result = path.stat()
+        info: tarfile.TarInfo = tarfile.TarInfo(arcname)
+        info.size = len(data)
+        info.mtime = stat.st_mtime
+        info.mode = stat.st_mode & 0o777
+        chunks.append(info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape"))
+        chunks.append(data + tarfile.NUL * (-len(data) % tarfile.BLOCKSIZE))
+    return b"".join(chunks)
+
+
+def append_entry(
+    archive_dir: Path,
+    name: str,
+    files: list[tuple[Path, str]],
+    created: float,
+) -> ArchiveEntry:
+    """Appends files as one xz stream to the archive and records it in the index.
+
+    The index line is written after the stream, so an interrupted append
+    leaves only unindexed bytes at the end of the archive.
+    """
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    compressed: bytes = lzma.compress(tar_members(files), format=lzma.FORMAT_XZ)
+    with (archive_dir / ARCHIVE_FILE).open("ab") as archive:
+        offset: int = archive.seek(0, os.SEEK_END)
+        archive.write(compressed)
+    entry: ArchiveEntry = ArchiveEntry(
+        name, offset, len(compressed), created, tuple(arcname for _, arcname in files)
+    )
+    with (archive_dir / INDEX_FILE).open("a") as index:
+        index.write(json.dumps(asdict(entry)) + "\n")
+    return entry
+
+
+def read_index(archive_dir: Path) -> dict[str, ArchiveEntry]:
+    """Returns the archived notebooks by name; a later entry wins over an earlier one."""
+    entries: dict[str, ArchiveEntry] = {}
+    try:
+        with (archive_dir / INDEX_FILE).open() as index:
+            for line in index:
+                record: dict = json.loads(line)
+                record["members"] = tuple(record["members"])
+                entries[record["name"]] = ArchiveEntry(**record)
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+@traced()
+def restore_entry(archive_dir: Path, entry: ArchiveEntry, destination: Path) -> Path:
+    """Extracts one archived notebook and its session file into destination.
+
+    Only the entry's own stream is read and decompressed.
+
+    Returns:
+        The restored notebook.
+    """
+    with (archive_dir / ARCHIVE_FILE).open("rb") as archive:
+        archive.seek(entry.offset)
+        data: bytes = lzma.decompress(archive.read(entry.length), format=lzma.FORMAT_XZ)
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:") as tar:
+        tar.extractall(destination, filter="data")
+    return destination / entry.members[0]
+
+
+@traced()
+def archive_notebooks(
+    motmp_files: Iterable[tuple[Path, Path | None]],
+    directory: Path,
+    archive_dir: Path,
+    cutoff: float,
+) -> list[ArchiveEntry]:
+    """Moves notebooks created before `cutoff` and their sessions into the archive.
+
+    Callers hold the directory lock exclusively. Notebooks still locked by a
+    running marimo are skipped.
+    """
+    entries: list[ArchiveEntry] = []
+    for motmp_file, session_file in motmp_files:
+        created: float = motmp_file.stat().st_ctime
+        if created >= cutoff:
+            continue
+        files: list[tuple[Path, str]] = [(motmp_file, motmp_file.name)]
+        if session_file is not None:
+            files.append((session_file, str(session_file.relative_to(directory))))
+        try:
+            with locked(motmp_file, blocking=False):
+                with span("archive notebook", notebook=motmp_file):
+                    entries.append(
+                        append_entry(archive_dir, motmp_file.stem, files, created)
+                    )
+                for path, _ in files:
+                    path.unlink()
+        except BlockingIOError:
+            continue
+    return entries
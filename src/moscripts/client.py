@@ -0,0 +1,125 @@
+"""Client for the moscriptsd daemon, also runnable standalone as a shim.
+
+Only builtin standard library modules are imported, so `python -I -S
+client.py` never loads the moscripts package. `_socket` and `marshal` stand in
+for `socket` and `json`, which import enum, selectors and re and would double
+the shim's startup time.
+"""
+
+# Standard Library
+import _socket
+import marshal
+import os
+import struct
+import sys
+
+# Globals
+# Non-interactive tools that can run inside the daemon. Interactive tools (gum
+# prompts, exec'ing marimo or mpv) always run in-process.
+DAEMON_TOOLS: frozenset[str] = frozenset(
+    {"hello", "human_timestamp", "password_generator"}
+)
+
+
+def daemon_socket_path() -> str:
+    """Returns the daemon's Unix socket path.
+
+    Honours MOSCRIPTS_DAEMON_SOCKET, then $XDG_RUNTIME_DIR/moscripts, and falls
+    back to ~/.cache/moscripts.
+    """
+    override: str | None = os.environ.get("MOSCRIPTS_DAEMON_SOCKET")
+    if override:
+        return override
+    runtime: str | None = os.environ.get("XDG_RUNTIME_DIR")
+    base: str = (
+        os.path.join(runtime, "moscripts")
+        if runtime
+        else os.path.join(os.path.expanduser("~"), ".cache", "moscripts")
+    )
+    return os.path.join(base, "daemon.sock")
+
+
+def call_daemon(
+    tool: str,
+    args: list[str],
+    socket_path: str | os.PathLike[str] | None = None,
+    fds: tuple[int, int, int] = (0, 1, 2),
+) -> int | None:
+    """Runs a tool in the daemon, forwarding argv, cwd, env and stdio.
+
+    Stdin, stdout and stderr are passed to the daemon as file descriptors, so
+    the tool reads and writes the caller's streams directly.
+
+    Returns:
+        The tool's exit code, or None when no daemon is listening so the
+        caller can fall back to running the tool in-process.
+    """
+    path: str = os.fspath(socket_path or daemon_socket_path())
+    connection: _socket.socket = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        connection.connect(path)
+    except OSError:
+        connection.close()
+        return None
+
+    try:
+        request: bytes = marshal.dumps(
+            {
+                "tool": tool,
+                "args": args,
+                "cwd": os.getcwd(),
+                "env": dict(os.environ),
+            }
+        )
+        connection.sendmsg(
+            [struct.pack("!I", len(request))],
+            [
+                (
+                    _socket.SOL_SOCKET,
+                    _socket.SCM_RIGHTS,
+                    struct.pack(f"{len(fds)}i", *fds),
+                )
+            ],
+        )
+        connection.sendall(request)
+        reply: bytes = recv_exactly(connection, 4)
+    finally:
+        connection.close()
+    if len(reply) < 4:
+        os.write(fds[2], b"moscripts: daemon closed the connection\n")
+        return 1
+    return struct.unpack("!i", reply)[0]
+
+
+def recv_exactly(connection: _socket.socket, size: int) -> bytes:
+    """Reads `size` bytes, or fewer if the peer closes the connection first."""
+    chunks: list[bytes] = []
+    remaining: int = size
+    while remaining:
+        chunk: bytes = connection.recv(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Client shim: `python -I -S client.py <tool> [args...]`.
+
+    Run as a script, this skips site-packages and the moscripts package, so a
+    call served by the daemon costs little more than a bare interpreter start.
+    Without a daemon, or for tools it doesn't serve, it execs
+    `python -m moscripts` to run the tool in-process.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in DAEMON_TOOLS and not os.environ.get("MOSCRIPTS_NO_DAEMON"):
+        code: int | None = call_daemon(argv[0], argv[1:])
+        if code is not None:
+            raise SystemExit(code)
+        os.environ["MOSCRIPTS_NO_DAEMON"] = "1"  # Already tried, don't connect again
+    os.execv(sys.executable, [sys.executable, "-m", "moscripts", *argv])
+
+
+if __name__ == "__main__":
+    main()
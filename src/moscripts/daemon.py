@@ -0,0 +1,137 @@
+# Standard Library
+import builtins
+import marshal
+import os
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import traceback
+from pathlib import Path
+from types import CodeType
+from typing import cast
+
+# My Imports
+from moscripts.client import DAEMON_TOOLS, recv_exactly
+from moscripts.multicall import tool_paths
+
+
+class _ForkingUnixServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Forks a copy of the warm daemon per request."""
+
+    codes: dict[str, tuple[Path, CodeType]]
+
+
+class _ToolRequestHandler(socketserver.BaseRequestHandler):
+    """Runs one tool invocation inside the forked child."""
+
+    def handle(self) -> None:
+        header, fds, _, _ = socket.recv_fds(self.request, 4, 3)
+        header += recv_exactly(self.request, 4 - len(header))
+        (length,) = struct.unpack("!I", header)
+        payload: dict = marshal.loads(recv_exactly(self.request, length))
+        server: _ForkingUnixServer = cast(_ForkingUnixServer, self.server)
+        code: int = run_request(payload, fds, server.codes)
+        self.request.sendall(struct.pack("!i", code))
+
+
+def warm_tools(
+    tools: dict[str, Path] | None = None,
+) -> dict[str, tuple[Path, CodeType]]:
+    """Compiles the daemon tools and imports their dependencies.
+
+    Each script body runs once under a non-`__main__` name, so its imports
+    (typer, rich, ...) are loaded into the daemon without running the CLI.
+    """
+    tools = tool_paths() if tools is None else tools
+    codes: dict[str, tuple[Path, CodeType]] = {}
+    for name in sorted(DAEMON_TOOLS & tools.keys()):
+        path: Path = tools[name]
+        code: CodeType = compile(path.read_bytes(), str(path), "exec")
+        # Tool scripts are trusted code from ROOT, exactly what `moscripts` runs
+        exec(code, {"__name__": f"_moscripts_warm_{name}", "__file__": str(path)})  # noqa: S102
+        codes[name] = (path, code)
+    return codes
+
+
+def run_request(
+    payload: dict, fds: list[int], codes: dict[str, tuple[Path, CodeType]]
+) -> int:
+    """Runs a tool with the caller's stdio, cwd, env and argv. Returns its exit code."""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    tool: str = payload["tool"]
+    if tool not in codes:
+        sys.stderr.write(f"moscripts: {tool} is not served by the daemon\n")
+        return 127
+    os.chdir(payload["cwd"])
+    os.environ.clear()
+    os.environ.update(payload["env"])
+    path, code = codes[tool]
+    sys.argv = [tool, *payload["args"]]
+
+    exit_code: int = 0
+    try:
+        exec(  # noqa: S102 - the tool compiled by warm_tools
+            code,
+            {"__name__": "__main__", "__file__": str(path), "__builtins__": builtins},
+        )
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            exit_code = e.code or 0
+        else:
+            sys.stderr.write(f"{e.code}\n")
+            exit_code = 1
+    except BaseException:  # noqa: BLE001 - any crash becomes the caller's exit code
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return exit_code
+
+
+def serve(socket_path: Path) -> None:
+    """Serves warm tools on a Unix socket until interrupted.
+
+    The socket is created owner-only (umask 077 around `bind`), in a directory
+    that must belong to the current user and not be writable by anyone else.
+
+    Raises:
+        RuntimeError: Another daemon is listening, or the socket directory is unsafe.
+    """
+    directory: Path = socket_path.parent
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    stat: os.stat_result = directory.stat()
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+        raise RuntimeError(
+            f"{directory} must be owned by you and not writable by others"
+        )
+    probe: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with probe:
+        if probe.connect_ex(str(socket_path)) == 0:
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    socket_path.unlink(missing_ok=True)  # Stale socket from a dead daemon
+
+    codes: dict[str, tuple[Path, CodeType]] = warm_tools()
+    # Exit through the finally below on SIGTERM so the socket is removed
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    umask: int = os.umask(0o077)
+    try:
+        server: _ForkingUnixServer = _ForkingUnixServer(
+            str(socket_path), _ToolRequestHandler
+        )
+    finally:
+        os.umask(umask)
+    with server:
+        server.codes = codes
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
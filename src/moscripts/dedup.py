@@ -0,0 +1,97 @@
+# Standard Library
+import hashlib
+import json
+import os
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# My Imports
+from moscripts.trace import span, traced
+from moscripts.utilities import CACHE_DIR, write_json_atomic
+
+# Globals
+DIGEST_CACHE: Path = CACHE_DIR / "digests.json"
+DIGEST_ALGORITHM: str = "blake2b"
+
+
+def file_digest(path: Path) -> str:
+    """Returns the hex digest of a file's contents."""
+    with path.open("rb") as file:
+        return hashlib.file_digest(file, DIGEST_ALGORITHM).hexdigest()
+
+
+def _read_digest_cache(cache_path: Path) -> dict[str, list]:
+    try:
+        cached = json.loads(cache_path.read_text())
+        if cached.get("algorithm") == DIGEST_ALGORITHM:
+            return cached["files"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return {}
+
+
+@traced()
+def find_duplicates(
+    paths: Iterable[Path], cache_path: Path = DIGEST_CACHE, workers: int | None = None
+) -> tuple[list[Path], list[Path]]:
+    """Finds empty files and files whose contents duplicate another file's.
+
+    Files are grouped by size first, and only files that share a size with
+    another file are hashed, in parallel. Digests are cached by resolved path,
+    size and mtime, so unchanged files are never read twice. Of each group of
+    duplicates the most recently modified file is kept.
+
+    Returns:
+        The empty files and the redundant duplicate files.
+    """
+    stats: dict[Path, os.stat_result] = {path: path.stat() for path in paths}
+    empty: list[Path] = [path for path, stat in stats.items() if stat.st_size == 0]
+    by_size: defaultdict[int, list[Path]] = defaultdict(list)
+    for path, stat in stats.items():
+        if stat.st_size > 0:
+            by_size[stat.st_size].append(path)
+    candidates: list[Path] = [
+        path for group in by_size.values() if len(group) > 1 for path in group
+    ]
+
+    cache: dict[str, list] = _read_digest_cache(cache_path)
+    # Resolved, so relative paths and symlinks share one entry per file
+    keys: dict[Path, str] = {path: str(path.resolve()) for path in candidates}
+    digests: dict[Path, str] = {}
+    stale: list[Path] = []
+    for path in candidates:
+        entry: list | None = cache.get(keys[path])
+        if entry and entry[:2] == [stats[path].st_size, stats[path].st_mtime_ns]:
+            digests[path] = entry[2]
+        else:
+            stale.append(path)
+    with span("hash files", files=len(stale)):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests.update(zip(stale, pool.map(file_digest, stale)))
+    if stale:
+        files: dict[str, list] = {
+            path: entry for path, entry in cache.items() if os.path.exists(path)
+        }
+        files.update(
+            {
+                keys[path]: [stats[path].st_size, stats[path].st_mtime_ns, digest]
+                for path, digest in digests.items()
+            }
+        )
+        try:
+            write_json_atomic(
+                cache_path, {"algorithm": DIGEST_ALGORITHM, "files": files}
+            )
+        except OSError:
+            pass  # An unwritable cache only costs the next run a rehash
+
+    by_digest: defaultdict[str, list[Path]] = defaultdict(list)
+    for path, digest in digests.items():
+        by_digest[digest].append(path)
+    duplicates: list[Path] = []
+    for group in by_digest.values():
+        group.sort(key=lambda path: stats[path].st_mtime_ns, reverse=True)
+        duplicates.extend(group[1:])
+    return empty, duplicates
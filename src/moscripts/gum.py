@@ -1,6 +1,7 @@
 from subprocess import CompletedProcess
 import subprocess
 from moscripts.utilities import nix_run_prefix
+from moscripts.trace import span
 import sys
 from typer import Exit, secho, colors
 
@@ -16,14 +17,15 @@ def gum_confirm(message: str) -> bool:
     ]
 
     try:
-        result: CompletedProcess[str] = subprocess.run(
-            cmd,
-            stdin=sys.stdin,
-            stdout=subprocess.PIPE,
-            stderr=sys.stderr,
-            text=True,
-            check=False,  # Don't raise exception on non-zero exit
-        )
+        with span("gum confirm", message=message):
+            result: CompletedProcess[str] = subprocess.run(
+                cmd,
+                stdin=sys.stdin,
+                stdout=subprocess.PIPE,
+                stderr=sys.stderr,
+                text=True,
+                check=False,  # Don't raise exception on non-zero exit
+            )
         # gum confirm returns 0 for yes, 1 for no, 130 for cancellation (SIGINT)
         if result.returncode == 0:
             return True
@@ -64,14 +66,15 @@ def gum_choose(
     ] + choices
 
     try:
-        result: CompletedProcess[str] = subprocess.run(
-            cmd,
-            stdin=sys.stdin,
-            stdout=subprocess.PIPE,
-            stderr=sys.stderr,
-            text=True,
-            check=False,  # Don't raise exception on non-zero exit
-        )
+        with span("gum choose", header=header, choices=len(choices)):
+            result: CompletedProcess[str] = subprocess.run(
+                cmd,
+                stdin=sys.stdin,
+                stdout=subprocess.PIPE,
+                stderr=sys.stderr,
+                text=True,
+                check=False,  # Don't raise exception on non-zero exit
+            )
 
         if result.returncode != 0:
             secho("🚨 Cancelled.", fg=colors.RED)
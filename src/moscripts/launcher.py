@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Writes a launcher that starts a script with a frozen import path.
+
+Used by the flake at build time. Only the standard library is imported, so it
+also runs against the standalone script venvs that don't include moscripts.
+
+The launcher runs its interpreter with `-I -S`. `site` is never imported, so
+startup skips `.pth` processing, user site lookups and path probing. Instead
+the launcher installs the `sys.path` that the venv computed at build time,
+minus entries that don't exist.
+
+The script itself is compiled at build time, by the target interpreter, into
+a marshalled code object behind the interpreter's bytecode magic number. The
+launcher loads that instead of compiling the source on every start, and only
+falls back to the source when run by an interpreter with another magic.
+"""
+
+# Standard Library
+import argparse
+import json
+import os
+import subprocess
+from pathlib import Path
+
+# Globals
+SYS_PATH_QUERY: str = "import json, sys; json.dump(sys.path[1:], sys.stdout)"
+COMPILE_QUERY: str = (
+    "import importlib.util, marshal, sys; "
+    "source = open(sys.argv[1], 'rb').read(); "
+    "sys.stdout.buffer.write(importlib.util.MAGIC_NUMBER"
+    " + marshal.dumps(compile(source, sys.argv[1], 'exec')))"
+)
+
+
+def frozen_sys_path(python: Path) -> list[str]:
+    """Returns the interpreter's `sys.path` without its script dir and missing entries."""
+    result: subprocess.CompletedProcess[str] = subprocess.run(
+        [str(python), "-c", SYS_PATH_QUERY], capture_output=True, text=True, check=True
+    )
+    return [path for path in json.loads(result.stdout) if os.path.exists(path)]
+
+
+def compile_script(python: Path, script: Path, code: Path) -> None:
+    """Writes the script's code object, compiled by `python`, to `code`."""
+    result: subprocess.CompletedProcess[bytes] = subprocess.run(
+        [str(python), "-c", COMPILE_QUERY, str(script)], capture_output=True, check=True
+    )
+    code.write_bytes(result.stdout)
+
+
+def render_launcher(python: Path, script: Path, sys_path: list[str], code: Path) -> str:
+    """Returns the source of a launcher that runs `script` as `__main__`.
+
+    The script is executed in the launcher's own namespace rather than through
+    `runpy`, which would pull in importlib and pkgutil on every start. The
+    magic number is read from the frozen importlib that every interpreter has
+    already loaded, as importing `importlib.util` would cost more than the
+    compile it saves.
+    """
+    return (
+        f"#!{python} -IS\n"
+        "import marshal, sys\n"
+        "from _frozen_importlib_external import MAGIC_NUMBER\n"
+        f"sys.path[:] = {sys_path!r}\n"
+        f"__file__ = {str(script)!r}\n"
+        f"with open({str(code)!r}, 'rb') as _cached:\n"
+        "    _code = _cached.read(len(MAGIC_NUMBER)) == MAGIC_NUMBER and marshal.load(_cached)\n"
+        "if not _code:  # Compiled for another interpreter\n"
+        "    with open(__file__, 'rb') as _source:\n"
+        "        _code = compile(_source.read(), __file__, 'exec')\n"
+        "exec(_code)\n"
+    )
+
+
+def write_launcher(
+    python: Path,
+    script: Path,
+    launcher: Path,
+    manifest: Path | None = None,
+    code: Path | None = None,
+) -> list[str]:
+    """Writes an executable launcher, its compiled script and optionally a path manifest.
+
+    The compiled script goes to `code`, by default `<launcher>.code` next to
+    the launcher.
+
+    Returns:
+        The frozen `sys.path` baked into the launcher.
+    """
+    code = launcher.with_name(f"{launcher.name}.code") if code is None else code
+    sys_path: list[str] = frozen_sys_path(python)
+    compile_script(python, script, code)
+    launcher.write_text(render_launcher(python, script, sys_path, code))
+    launcher.chmod(0o755)
+    if manifest is not None:
+        manifest.write_text(json.dumps(sys_path, indent=2) + "\n")
+    return sys_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--python", type=Path, required=True, help="Venv interpreter.")
+    parser.add_argument("--script", type=Path, required=True, help="Script to run.")
+    parser.add_argument("--out", type=Path, required=True, help="Launcher to write.")
+    parser.add_argument(
+        "--manifest", type=Path, help="Where to write the frozen sys.path."
+    )
+    parser.add_argument(
+        "--code",
+        type=Path,
+        help="Where to write the compiled script (default: <out>.code).",
+    )
+    args = parser.parse_args()
+    write_launcher(args.python, args.script, args.out, args.manifest, args.code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# Standard Library
+import os
+import shlex
+import sqlite3
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+# Third Party
+try:
+    import mutagen
+except ImportError:  # Optional: `pip install moscripts[tags]`
+    mutagen = None
+
+# My Imports
+from moscripts.trace import span, traced
+from moscripts.utilities import CACHE_DIR
+
+# Globals
+LIBRARY_DB: Path = CACHE_DIR / "library.sqlite"
+AUDIO_EXTENSIONS: frozenset[str] = frozenset(
+    {".mp3", ".flac", ".ogg", ".opus", ".m4a", ".aac", ".wav", ".wma", ".aiff"}
+)
+# Tag fields that `field:value` query terms may filter on.
+QUERY_FIELDS: tuple[str, ...] = ("title", "artist", "album", "genre")
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS tracks (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    title TEXT COLLATE NOCASE,
+    artist TEXT COLLATE NOCASE,
+    album TEXT COLLATE NOCASE,
+    genre TEXT COLLATE NOCASE,
+    duration REAL
+);
+CREATE INDEX IF NOT EXISTS tracks_artist ON tracks (artist);
+CREATE INDEX IF NOT EXISTS tracks_genre ON tracks (genre);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Track:
+    """One indexed audio file."""
+
+    path: str
+    mtime_ns: int
+    title: str | None = None
+    artist: str | None = None
+    album: str | None = None
+    genre: str | None = None
+    duration: float | None = None
+
+
+def read_tags(path: str, mtime_ns: int) -> Track:
+    """Reads a file's tags and duration with mutagen.
+
+    Without mutagen (the `tags` extra), and for files it can't read, the file
+    is indexed by path only.
+    """
+    if mutagen is None:
+        return Track(path=path, mtime_ns=mtime_ns)
+    try:
+        audio = mutagen.File(path, easy=True)
+    except (OSError, mutagen.MutagenError):
+        audio = None
+    if audio is None:
+        return Track(path=path, mtime_ns=mtime_ns)
+    tags: dict[str, str] = {}
+    for field in QUERY_FIELDS:
+        values = (audio.tags or {}).get(field)
+        if values:
+            tags[field] = str(values[0])
+    duration: float | None = getattr(audio.info, "length", None) or None
+    return Track(path=path, mtime_ns=mtime_ns, duration=duration, **tags)
+
+
+def walk_audio(root: Path) -> Iterator[tuple[str, int]]:
+    """Yields (path, mtime_ns) for every audio file under root."""
+    stack: list[str] = [str(root)]
+    while stack:
+        try:
+            entries: list[os.DirEntry[str]] = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS:
+                try:
+                    yield entry.path, entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+
+
+def connect_library(db_path: Path = LIBRARY_DB) -> sqlite3.Connection:
+    """Opens the tag index, creating it if needed."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection: sqlite3.Connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+@traced()
+def scan_library(
+    root: Path, db_path: Path = LIBRARY_DB, workers: int | None = None
+) -> tuple[int, int, int]:
+    """Updates the tag index from the files under root.
+
+    Only files whose mtime changed since the last scan are read, on a thread
+    pool; rows for files that disappeared are deleted.
+
+    Returns:
+        Counts of (updated, removed, unchanged) tracks.
+    """
+    with span("walk library", root=root):
+        on_disk: dict[str, int] = dict(walk_audio(root))
+    with connect_library(db_path) as connection:
+        indexed: dict[str, int] = dict(
+            connection.execute("SELECT path, mtime_ns FROM tracks")
+        )
+        changed: list[str] = [
+            path for path, mtime in on_disk.items() if indexed.get(path) != mtime
+        ]
+        removed: list[str] = [path for path in indexed if path not in on_disk]
+        with (
+            span("read tags", files=len(changed)),
+            ThreadPoolExecutor(max_workers=workers) as pool,
+        ):
+            tracks: list[Track] = list(
+                pool.map(read_tags, changed, [on_disk[path] for path in changed])
+            )
+        connection.executemany(
+            "INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (t.path, t.mtime_ns, t.title, t.artist, t.album, t.genre, t.duration)
+                for t in tracks
+            ],
+        )
+        connection.executemany(
+            "DELETE FROM tracks WHERE path = ?", [(path,) for path in removed]
+        )
+    connection.close()
+    return len(changed), len(removed), len(on_disk) - len(changed)
+
+
+def _like_pattern(value: str) -> str:
+    """Returns a LIKE pattern matching value as a literal substring (`ESCAPE '\\'`)."""
+    escaped: str = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def parse_query(query: str) -> tuple[str, list[str]]:
+    """Turns `artist:X genre:"Y Z" words` into a SQL WHERE clause and parameters.
+
+    `field:value` terms match a tag field by substring; bare words match the
+    title, artist, album or path, so untagged files can still be found. All
+    terms must match, and `%` and `_` match literally. Raises ValueError for
+    an unknown field.
+    """
+    clauses: list[str] = []
+    params: list[str] = []
+    for term in shlex.split(query):
+        field, separator, value = term.partition(":")
+        if separator and field.lower() in QUERY_FIELDS:
+            clauses.append(f"{field.lower()} LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(value))
+        elif separator and field:
+            raise ValueError(f"Unknown field {field!r}; use one of {QUERY_FIELDS}")
+        else:
+            clauses.append(
+                "(title LIKE ? ESCAPE '\\' OR artist LIKE ? ESCAPE '\\' "
+                "OR album LIKE ? ESCAPE '\\' OR path LIKE ? ESCAPE '\\')"
+            )
+            params += [_like_pattern(term)] * 4
+    return " AND ".join(clauses) or "1", params
+
+
+@traced()
+def query_tracks(query: str, db_path: Path = LIBRARY_DB) -> list[str]:
+    """Returns the paths of indexed tracks matching a query, in album order."""
+    where, params = parse_query(query)
+    with connect_library(db_path) as connection:
+        paths: list[str] = [
+            row[0]
+            for row in connection.execute(
+                f"SELECT path FROM tracks WHERE {where} ORDER BY artist, album, path",
+                params,
+            )
+        ]
+    connection.close()
+    return paths
+
+
+def write_m3u(paths: list[str], destination: Path) -> Path:
+    """Writes paths as an M3U playlist, atomically replacing destination."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    partial: Path = destination.with_name(f".{destination.name}.{os.getpid()}")
+    partial.write_text("".join(f"{path}\n" for path in paths))
+    partial.replace(destination)
+    return destination
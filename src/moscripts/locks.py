@@ -0,0 +1,77 @@
+# Standard Library
+import fcntl
+import os
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from hashlib import sha1
+from pathlib import Path
+
+# My Imports
+from moscripts.trace import span
+from moscripts.utilities import CACHE_DIR
+
+# Globals
+# Directory locks live here rather than in the locked directory, so scanning
+# `.` never leaves a lock file behind in the user's project.
+LOCK_DIR: Path = CACHE_DIR / "locks"
+
+
+@contextmanager
+def locked(path: Path, exclusive: bool = True, blocking: bool = True) -> Iterator[int]:
+    """Holds an `fcntl.flock` lock on a file for the duration of the block.
+
+    Shared locks can be held by many processes at once; an exclusive lock
+    waits for every other lock to be released. The file is created if it
+    doesn't exist.
+
+    Args:
+        path: File to lock.
+        exclusive: Take an exclusive lock instead of a shared one.
+        blocking: Wait for the lock. When False, raises BlockingIOError if
+            the lock is held elsewhere.
+
+    Yields:
+        The locked file descriptor.
+    """
+    fd: int = os.open(path, os.O_RDONLY | os.O_CREAT | os.O_CLOEXEC, 0o644)
+    operation: int = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+    try:
+        with span("flock", path=path, exclusive=exclusive):
+            fcntl.flock(fd, operation if blocking else operation | fcntl.LOCK_NB)
+        yield fd
+    finally:
+        os.close(fd)
+
+
+def directory_lock_path(directory: Path) -> Path:
+    """Returns the lock file guarding a directory."""
+    digest: str = sha1(str(directory.resolve()).encode()).hexdigest()
+    return LOCK_DIR / f"{digest}.lock"
+
+
+def directory_lock(
+    directory: Path, exclusive: bool = True
+) -> AbstractContextManager[int]:
+    """Locks a directory: shared for readers, exclusive for mutations."""
+    LOCK_DIR.mkdir(parents=True, exist_ok=True)
+    return locked(directory_lock_path(directory), exclusive=exclusive)
+
+
+def hold_for_exec(path: Path) -> int:
+    """Takes a shared lock on a file on an fd that survives `os.exec*`.
+
+    The lock is then held by the exec'd program (e.g. marimo) and released by
+    the kernel when it exits, so an exclusive non-blocking lock attempt tells
+    whether the file is still in use.
+
+    Returns:
+        The inheritable, locked file descriptor.
+    """
+    fd: int = os.open(path, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH)
+    except BaseException:
+        os.close(fd)
+        raise
+    os.set_inheritable(fd, True)
+    return fd
@@ -0,0 +1,102 @@
+# Standard Library
+import os
+import random
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+# My Imports
+from moscripts.mpv import MpvClient, MpvError
+
+# Globals
+# Entries written to the mix playlist before mpv starts; the rest are streamed.
+MIX_HEAD: int = 200
+
+
+def parse_mix_spec(spec: str, playlists: Path) -> tuple[Path, float]:
+    """Parses `NAME[:WEIGHT]` into a playlist path and a weight.
+
+    NAME is looked up in `playlists` unless it's an existing path. The weight
+    defaults to 1 and is relative to the other playlists in the mix.
+
+    Raises:
+        ValueError: The weight isn't a positive number or the playlist is missing.
+    """
+    name, colon, weight_text = spec.rpartition(":")
+    if not colon:
+        name, weight_text = spec, "1"
+    try:
+        weight: float = float(weight_text)
+    except ValueError:
+        raise ValueError(f"Invalid weight in `{spec}`, expected NAME:WEIGHT") from None
+    if weight <= 0:
+        raise ValueError(f"Weight must be positive in `{spec}`")
+    path: Path = Path(name).expanduser()
+    if not path.exists():
+        path = playlists / name
+    if not path.is_file():
+        raise ValueError(f"Playlist `{name}` not found in `{playlists}`")
+    return path, weight
+
+
+def read_entries(playlist: Path) -> Iterator[str]:
+    """Yields the entries of an m3u playlist one line at a time.
+
+    Relative entries are resolved against the playlist's directory so they
+    stay valid when written to another playlist.
+    """
+    with playlist.open(encoding="utf-8", errors="surrogateescape") as lines:
+        for line in lines:
+            entry: str = line.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            if "://" not in entry:
+                entry = os.path.normpath(playlist.parent / entry)
+            yield entry
+
+
+def weighted_mix(
+    sources: Iterable[tuple[Iterator[str], float]], seed: int | None = None
+) -> Iterator[str]:
+    """Interleaves several entry streams, picking each next entry by weight.
+
+    Each source keeps its own order. An exhausted source drops out and the
+    remaining weights are renormalised, so the mix still drains every source.
+    Entries already yielded from any source are skipped.
+    """
+    rng: random.Random = random.Random(seed)
+    active: list[tuple[Iterator[str], float]] = list(sources)
+    seen: set[str] = set()
+    while active:
+        index: int = rng.choices(
+            range(len(active)), weights=[weight for _, weight in active]
+        )[0]
+        entry: str | None = next(active[index][0], None)
+        if entry is None:
+            del active[index]
+        elif entry not in seen:
+            seen.add(entry)
+            yield entry
+
+
+def stream_mix(socket_path: Path, entries: Iterator[str], playlist: Path) -> int:
+    """Appends entries to a running mpv's playlist as they're produced.
+
+    Each entry is also appended to `playlist`, so the file holds the full mix
+    once the stream is drained. Stops early if mpv exits.
+
+    Returns:
+        The number of entries handed to mpv.
+    """
+    appended: int = 0
+    try:
+        with (
+            MpvClient.connect(socket_path) as client,
+            playlist.open("a", buffering=1) as out,
+        ):
+            for entry in entries:
+                out.write(f"{entry}\n")
+                client.command("loadfile", entry, "append")
+                appended += 1
+    except (MpvError, OSError):
+        pass
+    return appended
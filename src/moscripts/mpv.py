@@ -0,0 +1,140 @@
+# Standard Library
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Self
+
+# Globals
+# Seconds to wait for mpv to answer a command.
+IPC_TIMEOUT: float = 2.0
+
+
+class MpvError(RuntimeError):
+    """mpv answered an IPC command with an error."""
+
+
+def mpv_socket_path() -> Path:
+    """Returns the IPC socket of the shared mpv instance.
+
+    Honours MOSCRIPTS_MPV_SOCKET, then $XDG_RUNTIME_DIR/moscripts, and falls
+    back to ~/.cache/moscripts.
+    """
+    override: str | None = os.environ.get("MOSCRIPTS_MPV_SOCKET")
+    if override:
+        return Path(override)
+    runtime: str | None = os.environ.get("XDG_RUNTIME_DIR")
+    base: Path = (
+        Path(runtime) / "moscripts" if runtime else Path.home() / ".cache" / "moscripts"
+    )
+    return base / "mpv.sock"
+
+
+class MpvClient:
+    """Client for mpv's JSON IPC protocol (`--input-ipc-server`).
+
+    Commands are sent as newline-delimited JSON with a request_id; event
+    messages mpv interleaves with the replies are skipped.
+    """
+
+    def __init__(self, connection: socket.socket) -> None:
+        self._connection: socket.socket = connection
+        self._buffer: bytes = b""
+        self._request_id: int = 0
+
+    @classmethod
+    def connect(cls, socket_path: Path, timeout: float = IPC_TIMEOUT) -> Self:
+        """Connects to a running mpv. Raises OSError if nothing is listening."""
+        connection: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        try:
+            connection.connect(str(socket_path))
+        except OSError:
+            connection.close()
+            raise
+        return cls(connection)
+
+    def command(self, *args: Any) -> Any:
+        """Runs an mpv command and returns its `data`. Raises MpvError on failure."""
+        self._request_id += 1
+        request: dict[str, Any] = {
+            "command": list(args),
+            "request_id": self._request_id,
+        }
+        self._connection.sendall(json.dumps(request).encode() + b"\n")
+        while True:
+            message: dict[str, Any] = self._read_message()
+            if message.get("request_id") != self._request_id or "error" not in message:
+                continue
+            if message["error"] != "success":
+                raise MpvError(f"{args[0]}: {message['error']}")
+            return message.get("data")
+
+    def next_event(self) -> dict[str, Any]:
+        """Returns the next event message, skipping command replies.
+
+        Raises TimeoutError when none arrives within the socket timeout.
+        """
+        while True:
+            message: dict[str, Any] = self._read_message()
+            if "event" in message:
+                return message
+
+    def _read_message(self) -> dict[str, Any]:
+        while b"\n" not in self._buffer:
+            chunk: bytes = self._connection.recv(65536)
+            if not chunk:
+                raise ConnectionError("mpv closed the IPC connection")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def connect_mpv(socket_path: Path | None = None) -> MpvClient | None:
+    """Returns a client for the shared mpv instance, or None if it isn't running.
+
+    A socket file left behind by an mpv that exited is treated as not running.
+    """
+    try:
+        return MpvClient.connect(socket_path or mpv_socket_path())
+    except OSError:
+        return None
+
+
+def load_playlist(client: MpvClient, playlist: Path, shuffle: bool = True) -> None:
+    """Replaces mpv's playlist and starts playing it, keeping volume and filters."""
+    client.command("loadlist", str(playlist), "replace")
+    if shuffle:
+        client.command("playlist-shuffle")
+        client.command("playlist-play-index", 0)
+    client.command("set_property", "pause", False)
+
+
+def replace_entry(client: MpvClient, index: int, expected: str, filename: str) -> bool:
+    """Swaps playlist entry `index` for another file if it still is `expected`.
+
+    Uses only `loadfile append`, `playlist-move` and `playlist-remove`, which
+    every mpv version supports. The entry that is playing is never swapped,
+    as removing it would stop playback.
+
+    Returns:
+        Whether the entry was replaced.
+    """
+    if client.command("get_property", "playlist-pos") == index:
+        return False
+    if client.command("get_property", f"playlist/{index}/filename") != expected:
+        return False
+    count: int = client.command("get_property", "playlist-count")
+    client.command("loadfile", filename, "append")
+    client.command("playlist-move", count, index)
+    client.command("playlist-remove", index + 1)
+    return True
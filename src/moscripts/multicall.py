@@ -0,0 +1,90 @@
+# Standard Library
+import os
+import runpy
+import sys
+from pathlib import Path
+
+# My Imports
+from moscripts.client import DAEMON_TOOLS, call_daemon
+from moscripts.trace import span
+
+# Globals
+# Directory holding `apps/` and `pythonScripts/`. Nix builds set MOSCRIPTS_ROOT;
+# a source checkout falls back to the repository root. Other installs (a wheel
+# in a venv) don't ship the tools, so they need MOSCRIPTS_ROOT.
+ROOT: Path = Path(os.environ.get("MOSCRIPTS_ROOT", Path(__file__).resolve().parents[2]))
+TOOL_DIRS: tuple[str, ...] = ("apps", "pythonScripts")
+
+
+def tool_paths(root: Path = ROOT) -> dict[str, Path]:
+    """Maps each tool name to its script, mirroring the flake's discovery."""
+    tools: dict[str, Path] = {}
+    for tool_dir in TOOL_DIRS:
+        try:
+            entries: list[os.DirEntry[str]] = list(os.scandir(root / tool_dir))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(".py") and entry.is_file():
+                tools[entry.name.removesuffix(".py")] = Path(entry.path)
+    return tools
+
+
+def resolve_tool(
+    argv: list[str], tools: dict[str, Path]
+) -> tuple[str, list[str]] | None:
+    """Returns the tool name and its arguments from argv[0] or the first argument."""
+    invoked: str = Path(argv[0]).name.removesuffix(".py") if argv else ""
+    if invoked in tools:
+        return invoked, argv[1:]
+    if len(argv) > 1 and argv[1] in tools:
+        return argv[1], argv[2:]
+    return None
+
+
+def run_tool(path: Path, name: str, args: list[str]) -> None:
+    """Runs a tool script as `__main__` with its own argv."""
+    sys.argv = [name, *args]
+    with span(f"run {name}", path=path):
+        runpy.run_path(str(path), run_name="__main__")
+
+
+def missing_tools(root: Path) -> str:
+    return (
+        f"moscripts: no tools found in {root / TOOL_DIRS[0]} or {root / TOOL_DIRS[1]}.\n"
+        "Set MOSCRIPTS_ROOT to the directory holding them: a moscripts checkout, "
+        "or share/moscripts of the nix build.\n"
+    )
+
+
+def usage(tools: dict[str, Path]) -> str:
+    lines: list[str] = ["Usage: moscripts <tool> [args...]", "", "Tools:"]
+    lines += [f"  {name}" for name in sorted(tools)]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Busybox-style entry point that runs any moscripts tool from one interpreter.
+
+    `moscripts <tool> [args...]` runs a tool as a subcommand, and a symlink
+    named after a tool (e.g. `motmp -> moscripts`) dispatches on argv[0].
+    Only the requested tool's module is imported. Tools in DAEMON_TOOLS are
+    forwarded to a running `moscriptsd` daemon when one is listening, unless
+    MOSCRIPTS_NO_DAEMON is set.
+    """
+    argv = sys.argv if argv is None else argv
+    tools: dict[str, Path] = tool_paths()
+    if not tools:
+        sys.stderr.write(missing_tools(ROOT))
+        raise SystemExit(2)
+    resolved: tuple[str, list[str]] | None = resolve_tool(argv, tools)
+    if resolved is None:
+        wants_help: bool = len(argv) > 1 and argv[1] in ("-h", "--help")
+        (sys.stdout if wants_help else sys.stderr).write(usage(tools))
+        raise SystemExit(0 if wants_help else 2)
+    name, args = resolved
+    if name in DAEMON_TOOLS and not os.environ.get("MOSCRIPTS_NO_DAEMON"):
+        code: int | None = call_daemon(name, args)
+        if code is not None:
+            raise SystemExit(code)
+    run_tool(tools[name], name, args)
@@ -0,0 +1,132 @@
+# Standard Library
+import os
+import re
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+# My Imports
+from moscripts.trace import span, traced
+from moscripts.utilities import CACHE_DIR
+
+# Globals
+NOTEBOOK_INDEX: Path = CACHE_DIR / "notebooks.sqlite"
+# A word of free-text search input, optionally ending in `*` for prefix search.
+SEARCH_TERM: re.Pattern[str] = re.compile(r"\w+\*?")
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS notebooks (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    directory TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notebooks_directory ON notebooks (directory);
+CREATE VIRTUAL TABLE IF NOT EXISTS notebook_text USING fts5(
+    source, tokenize = 'porter unicode61'
+);
+"""
+
+
+def connect_index(db_path: Path = NOTEBOOK_INDEX) -> sqlite3.Connection:
+    """Opens the notebook search index, creating it if needed."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection: sqlite3.Connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+@traced()
+def update_index(
+    directory: Path, notebooks: Iterable[Path], db_path: Path = NOTEBOOK_INDEX
+) -> tuple[int, int, int]:
+    """Brings the index for one directory of notebooks up to date.
+
+    Only notebooks whose mtime or size changed are read; rows for notebooks
+    that disappeared from the directory are deleted. The full-text row of a
+    notebook shares the rowid of its `notebooks` row.
+
+    Returns:
+        Counts of (updated, removed, unchanged) notebooks.
+    """
+    key: str = str(directory.resolve())
+    on_disk: dict[str, os.stat_result] = {
+        os.path.join(key, notebook.name): notebook.stat() for notebook in notebooks
+    }
+    with connect_index(db_path) as connection:
+        indexed: dict[str, tuple[int, int, int]] = {
+            path: (row_id, mtime_ns, size)
+            for row_id, path, mtime_ns, size in connection.execute(
+                "SELECT id, path, mtime_ns, size FROM notebooks WHERE directory = ?",
+                (key,),
+            )
+        }
+        changed: list[str] = [
+            path
+            for path, stat in on_disk.items()
+            if indexed.get(path, (None,))[1:] != (stat.st_mtime_ns, stat.st_size)
+        ]
+        removed: list[int] = [
+            row_id for path, (row_id, _, _) in indexed.items() if path not in on_disk
+        ]
+        with span("index notebooks", files=len(changed)):
+            for path in changed:
+                stat: os.stat_result = on_disk[path]
+                (row_id,) = connection.execute(
+                    "INSERT INTO notebooks (path, directory, mtime_ns, size) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (path) DO UPDATE SET "
+                    "mtime_ns = excluded.mtime_ns, size = excluded.size RETURNING id",
+                    (path, key, stat.st_mtime_ns, stat.st_size),
+                ).fetchone()
+                source: str = Path(path).read_text(encoding="utf-8", errors="replace")
+                connection.execute(
+                    "DELETE FROM notebook_text WHERE rowid = ?", (row_id,)
+                )
+                connection.execute(
+                    "INSERT INTO notebook_text (rowid, source) VALUES (?, ?)",
+                    (row_id, source),
+                )
+        for statement in (
+            "DELETE FROM notebooks WHERE id = ?",
+            "DELETE FROM notebook_text WHERE rowid = ?",
+        ):
+            connection.executemany(statement, [(row_id,) for row_id in removed])
+    connection.close()
+    return len(changed), len(removed), len(on_disk) - len(changed)
+
+
+def fts_query(terms: str) -> str:
+    """Turns free text into an FTS5 query that matches notebooks with every term.
+
+    Each word is quoted, so FTS5 operators in the input are matched literally;
+    a trailing `*` keeps prefix matching (`pola*`).
+    """
+    return " ".join(
+        f'"{term.rstrip("*")}"' + ("*" if term.endswith("*") else "")
+        for term in SEARCH_TERM.findall(terms)
+    )
+
+
+@traced()
+def search_notebooks(
+    terms: str, directory: Path, db_path: Path = NOTEBOOK_INDEX, limit: int = 20
+) -> list[tuple[Path, str]]:
+    """Ranks the notebooks of a directory against search terms with BM25.
+
+    Returns:
+        Up to `limit` (notebook, snippet) pairs, best match first.
+    """
+    query: str = fts_query(terms)
+    if not query:
+        return []
+    with connect_index(db_path) as connection:
+        rows: list[tuple[str, str]] = connection.execute(
+            "SELECT notebooks.path, snippet(notebook_text, 0, '[', ']', '…', 12) "
+            "FROM notebook_text JOIN notebooks ON notebooks.id = notebook_text.rowid "
+            "WHERE notebook_text MATCH ? AND notebooks.directory = ? "
+            "ORDER BY bm25(notebook_text) LIMIT ?",
+            (query, str(directory.resolve()), limit),
+        ).fetchall()
+    connection.close()
+    return [(Path(path), " ".join(snippet.split())) for path, snippet in rows]
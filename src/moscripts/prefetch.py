@@ -0,0 +1,211 @@
+# Standard Library
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import sha1
+from pathlib import Path
+
+# My Imports
+from moscripts.mpv import MpvClient, MpvError, replace_entry
+from moscripts.trace import span
+from moscripts.utilities import CACHE_DIR, clone_file
+
+# Globals
+AUDIO_CACHE: Path = CACHE_DIR / "audio"
+# Seconds between checks for finished prefetches while waiting for mpv events.
+EVENT_POLL: float = 0.2
+
+
+class TrackCache:
+    """Size-bounded LRU cache of audio files on local disk.
+
+    Entries are keyed by source path, size and mtime, so an edited file is
+    fetched again. A file's mtime in the cache records its last use, and the
+    least recently used files are evicted to stay under `max_bytes`. Files in
+    `pinned` (those the player is about to use) are never evicted.
+    """
+
+    def __init__(self, directory: Path = AUDIO_CACHE, max_bytes: int = 2 * 1024**3):
+        self.directory: Path = directory
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.bytes_cached: int = 0
+        self.pinned: frozenset[str] = frozenset()
+        self._lock: threading.Lock = threading.Lock()
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def cached_path(self, source: Path) -> Path:
+        """Returns where a source file is (or would be) cached."""
+        stat: os.stat_result = source.stat()
+        key: str = f"{source.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        return self.directory / f"{sha1(key.encode()).hexdigest()}{source.suffix}"
+
+    def is_cached(self, filename: str) -> bool:
+        """Returns True if a path points to a file in the cache."""
+        return Path(filename).parent == self.directory and os.path.exists(filename)
+
+    def fetch(self, source: Path) -> Path:
+        """Copies a file into the cache and returns the cached path.
+
+        Files that don't fit next to the pinned files are returned unchanged.
+        """
+        cached: Path = self.cached_path(source)
+        if cached.exists():
+            os.utime(cached)
+            return cached
+        size: int = source.stat().st_size
+        with self._lock:
+            if not self._evict(size):
+                return source
+        partial: Path = cached.with_name(f".{cached.name}.{threading.get_ident()}")
+        partial.unlink(missing_ok=True)
+        with span("prefetch", source=source, size=size):
+            clone_file(source, partial)
+        partial.replace(cached)
+        with self._lock:
+            self.bytes_cached += size
+        return cached
+
+    def _evict(self, incoming: int) -> bool:
+        """Removes least recently used unpinned files until `incoming` bytes fit.
+
+        Returns:
+            Whether they fit.
+        """
+        entries: list[tuple[int, int, str]] = []
+        total: int = 0
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                stat: os.stat_result = entry.stat()
+                total += stat.st_size
+                if entry.path not in self.pinned:
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        for _, size, path in sorted(entries):
+            if total + incoming <= self.max_bytes:
+                break
+            Path(path).unlink(missing_ok=True)
+            total -= size
+        return total + incoming <= self.max_bytes
+
+    def record_play(self, filename: str) -> None:
+        """Counts a track mpv started playing as a cache hit or miss."""
+        if self.is_cached(filename):
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        played: int = self.hits + self.misses
+        return self.hits / played if played else 0.0
+
+
+def upcoming(position: int, count: int, ahead: int) -> list[int]:
+    """Returns the indexes of the `ahead` entries after position, nearest first.
+
+    Wraps around the end of the playlist, as mpv_playlists always runs mpv
+    with `--loop-playlist`.
+    """
+    indexes: dict[int, None] = dict.fromkeys(
+        (position + step) % count for step in range(1, ahead + 1)
+    )
+    indexes.pop(position, None)
+    return list(indexes)
+
+
+def _sync_window(
+    control: MpvClient,
+    cache: TrackCache,
+    pool: ThreadPoolExecutor,
+    pending: dict[Future[Path], tuple[int, str, str]],
+    swapped: dict[int, tuple[str, str]],
+    position: int,
+    ahead: int,
+) -> None:
+    """Restores entries that left the window and fetches the upcoming ones.
+
+    Only reads the entries it needs, so a track change costs a few small IPC
+    replies however long the playlist is.
+    """
+    window: list[int] = upcoming(
+        position, control.command("get_property", "playlist-count"), ahead
+    )
+    keep: set[int] = {position, *window}
+    try:
+        for index in [index for index in swapped if index not in keep]:
+            cached, source = swapped.pop(index)
+            replace_entry(control, index, cached, source)
+        entries: dict[int, str] = {
+            index: control.command("get_property", f"playlist/{index}/filename")
+            for index in keep
+        }
+    except MpvError:
+        return  # The playlist changed under us; retried on the next track
+    cache.pinned = frozenset(entries.values())
+    in_flight: set[str] = {filename for _, filename, _ in pending.values()}
+    for index in window:
+        filename: str = entries[index]
+        if filename in in_flight or cache.is_cached(filename):
+            continue
+        cached_entry: tuple[str, str] | None = swapped.get(index)
+        source: str = (
+            cached_entry[1]
+            if cached_entry is not None and cached_entry[0] == filename
+            else filename
+        )
+        pending[pool.submit(cache.fetch, Path(source))] = (index, filename, source)
+
+
+def prefetch_playlist(
+    socket_path: Path, cache: TrackCache, ahead: int = 3, workers: int = 2
+) -> None:
+    """Keeps the next `ahead` tracks of a running mpv in the cache.
+
+    Follows `playlist-pos` over IPC, copies upcoming tracks into the cache on
+    a thread pool and swaps each copied track into mpv's playlist in place of
+    the original. Once a swapped entry leaves that window (it played, or
+    playback jumped past it), its original path is put back, so the playlist
+    never points at a copy the cache may evict. Upcoming copies the cache lost
+    are fetched again. Returns when mpv exits or closes the connection.
+    """
+    # Playlist index -> (cached path, original path) of swapped entries
+    swapped: dict[int, tuple[str, str]] = {}
+    with (
+        MpvClient.connect(socket_path, timeout=EVENT_POLL) as events,
+        MpvClient.connect(socket_path) as control,
+        ThreadPoolExecutor(max_workers=workers) as pool,
+    ):
+        events.command("observe_property", 1, "playlist-pos")
+        events.command("observe_property", 2, "path")
+        pending: dict[Future[Path], tuple[int, str, str]] = {}
+        while True:
+            try:
+                message: dict | None = events.next_event()
+            except TimeoutError:
+                message = None
+            except (ConnectionError, OSError):
+                break
+            if message is not None and message["event"] == "shutdown":
+                break
+            if message is not None and message["event"] == "property-change":
+                data = message.get("data")
+                if message["name"] == "path" and isinstance(data, str):
+                    cache.record_play(data)
+                elif (
+                    message["name"] == "playlist-pos"
+                    and isinstance(data, int)
+                    and data >= 0
+                ):
+                    _sync_window(control, cache, pool, pending, swapped, data, ahead)
+            for future in [future for future in pending if future.done()]:
+                index, filename, source = pending.pop(future)
+                try:
+                    cached: str = str(future.result())
+                    replaced: bool = cached != filename and replace_entry(
+                        control, index, filename, cached
+                    )
+                    if replaced and cached != source:
+                        swapped[index] = (cached, source)
+                except (OSError, MpvError):
+                    continue  # Unreadable source or a playlist that changed under us
@@ -0,0 +1,154 @@
+# Standard Library
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+# Third Party
+from pydantic import Field, field_validator
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+    TomlConfigSettingsSource,
+)
+
+# My Imports
+from moscripts.trace import traced
+from moscripts.utilities import CACHE_DIR, write_json_atomic
+
+# Globals
+HOME: Path = Path.home()
+ENV_PREFIX: str = "MOSCRIPTS_"
+SETTINGS_CACHE: Path = CACHE_DIR / "settings.json"
+
+
+def config_path() -> Path:
+    """Returns the TOML config file path.
+
+    Honours MOSCRIPTS_CONFIG, then $XDG_CONFIG_HOME/moscripts, and falls back
+    to ~/.config/moscripts.
+    """
+    override: str | None = os.environ.get("MOSCRIPTS_CONFIG")
+    if override:
+        return Path(override).expanduser()
+    config_home: str | None = os.environ.get("XDG_CONFIG_HOME")
+    base: Path = Path(config_home) if config_home else HOME / ".config"
+    return base / "moscripts" / "config.toml"
+
+
+class Settings(BaseSettings):
+    """User settings shared by the moscripts apps.
+
+    Values come from MOSCRIPTS_* env vars, then the TOML config file, then the
+    defaults below.
+    """
+
+    model_config = SettingsConfigDict(env_prefix=ENV_PREFIX, extra="ignore")
+
+    motmp: Path = HOME / ".cache" / "marimo" / "motmp"
+    venv: Path = Field(default_factory=lambda data: data["motmp"] / ".venv")
+    templates: Path = Field(default_factory=lambda data: data["motmp"] / "templates")
+    playlists: Path = HOME / "Music" / "Playlists"
+    music: Path = HOME / "Music"
+    audio_cache_bytes: int = 2 * 1024**3
+    motmp_packages: list[str] = [
+        "marimo[recommended]",
+        "python-lsp-server",
+        "websockets",
+        "watchdog",
+    ]
+
+    @field_validator("motmp", "venv", "templates", "playlists", "music", mode="after")
+    @classmethod
+    def _expand_user(cls, value: Path) -> Path:
+        return value.expanduser()
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            init_settings,
+            env_settings,
+            TomlConfigSettingsSource(settings_cls, toml_file=config_path()),
+        )
+
+
+@traced()
+def load_settings() -> Settings:
+    """Returns the validated settings, reusing a cached copy when possible.
+
+    The validated values are stored in `SETTINGS_CACHE` together with the
+    config file's mtime, the MOSCRIPTS_* env vars and a hash of the Settings
+    fields and defaults; while all are unchanged the cached values are
+    restored with `model_construct`, skipping validation and TOML parsing.
+    """
+    key: dict[str, Any] = _settings_cache_key()
+    try:
+        cached = json.loads(SETTINGS_CACHE.read_text())
+        if cached["key"] == key:
+            return _restore_settings(cached["settings"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    settings: Settings = Settings()
+    try:
+        write_json_atomic(
+            SETTINGS_CACHE, {"key": key, "settings": settings.model_dump(mode="json")}
+        )
+    except OSError:
+        pass  # An unwritable cache only costs the next process a validation
+    return settings
+
+
+def _settings_cache_key() -> dict[str, Any]:
+    """Returns the inputs that invalidate the cached settings."""
+    path: Path = config_path()
+    try:
+        config_mtime: int | None = path.stat().st_mtime_ns
+    except OSError:
+        config_mtime = None
+    env: dict[str, str] = {
+        var: os.environ[var]
+        for var in (ENV_PREFIX + name.upper() for name in Settings.model_fields)
+        if var in os.environ
+    }
+    return {
+        "schema": _settings_schema_hash(),
+        "config": str(path),
+        "config_mtime_ns": config_mtime,
+        "env": env,
+    }
+
+
+def _settings_schema_hash() -> str:
+    """Returns a hash of the Settings fields, types and static defaults.
+
+    An upgrade that adds a field or changes a default changes the hash, so
+    values cached by the previous version aren't served.
+    """
+    schema: str = repr(
+        [
+            (name, field.annotation, field.default)
+            for name, field in Settings.model_fields.items()
+        ]
+    )
+    return hashlib.sha256(schema.encode()).hexdigest()[:16]
+
+
+def _restore_settings(data: dict[str, Any]) -> Settings:
+    """Rebuilds Settings from a JSON dump without running validation."""
+    if data.keys() != Settings.model_fields.keys():
+        raise KeyError("cached settings do not match the Settings fields")
+    values: dict[str, Any] = {
+        name: Path(data[name]) if field.annotation is Path else data[name]
+        for name, field in Settings.model_fields.items()
+    }
+    return Settings.model_construct(**values)
@@ -0,0 +1,92 @@
+# Standard Library
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+# Globals
+ENABLED: bool = os.environ.get("MOSCRIPTS_TRACE") == "1"
+TRACE_DIR: Path = Path.home() / ".cache" / "moscripts" / "traces"
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_EVENTS: list[dict[str, Any]] = []
+_NULL_SPAN: nullcontext[None] = nullcontext()
+
+
+def span(name: str, **args: Any) -> AbstractContextManager[None]:
+    """Records a Chrome trace-event span around a block when MOSCRIPTS_TRACE=1.
+
+    When tracing is disabled this returns a shared no-op context manager.
+    """
+    if not ENABLED:
+        return _NULL_SPAN
+    return _record(name, args)
+
+
+@contextmanager
+def _record(name: str, args: dict[str, Any]) -> Iterator[None]:
+    start_us: float = time.time_ns() / 1000
+    start: int = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _EVENTS.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": start_us,
+                "dur": (time.perf_counter_ns() - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+                "args": {key: str(value) for key, value in args.items()},
+            }
+        )
+
+
+def traced(name: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorates a function with a span. Returns the function untouched when disabled."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if not ENABLED:
+            return func
+        span_name: str = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with _record(span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def flush() -> Path | None:
+    """Writes the recorded spans as Chrome trace-event JSON.
+
+    The file is MOSCRIPTS_TRACE_FILE, or `<tool>-<pid>.json` under TRACE_DIR.
+    Call this before `os.exec*`, which skips atexit handlers.
+    """
+    if not _EVENTS:
+        return None
+    path: Path = Path(
+        os.environ.get("MOSCRIPTS_TRACE_FILE")
+        or TRACE_DIR / f"{Path(sys.argv[0]).stem}-{os.getpid()}.json"
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"traceEvents": _EVENTS, "displayTimeUnit": "ms"}))
+    _EVENTS.clear()
+    return path
+
+
+if ENABLED:
+    atexit.register(flush)
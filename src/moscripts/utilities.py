@@ -6,12 +6,130 @@ from pathlib import Path
 import os
 import re
 import platform
+import json
+import tempfile
+import fcntl
+import shutil
 from datetime import timedelta
+from collections.abc import Iterable, Iterator
+from functools import cache, lru_cache
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+from moscripts.trace import traced
 
+if TYPE_CHECKING:
+    import numpy as np
 
+# Cache directory shared by all moscripts apps.
+CACHE_DIR: Path = Path.home() / ".cache" / "moscripts"
+TIMEZONE_CACHE: Path = CACHE_DIR / "timezone.json"
+LOCALTIME: Path = Path("/etc/localtime")
+# Leading UTC offset such as +05:30, -0800 or +05.
+UTC_OFFSET_PATTERN: re.Pattern[str] = re.compile(r"([+-])(\d{1,2})(?::?(\d{2}))?")
+# Maximum number of distinct strings memoized by str_to_timezone.
+TIMEZONE_MEMO_SIZE: int = 1024
+# Epoch values at or above this magnitude are treated as milliseconds.
+EPOCH_MS_THRESHOLD: int = 100_000_000_000
+# Maximum number of timezones kept in the ZoneInfo and transition table caches.
+ZONE_CACHE_SIZE: int = 64
+# UTC years [start, end) covered by the precomputed zone transition tables.
+TRANSITION_YEARS: tuple[int, int] = (1970, 2100)
+UNIX_EPOCH: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# ioctl request that reflinks one file into another (linux/fs.h).
+FICLONE: int = 0x40049409
+# strftime directives that depend on the time of day and on nothing else.
+_TIME_DIRECTIVES: frozenset[str] = frozenset("HIMSpf")
+# strftime directives that mix the time of day into a composite field.
+_COMPOSITE_DIRECTIVES: frozenset[str] = frozenset("cXrTRsEOklP")
+_MERIDIEM: tuple[str, str] = (
+    datetime(2000, 1, 1, 0).strftime("%p"),
+    datetime(2000, 1, 1, 12).strftime("%p"),
+)
+
+
+@traced()
 def _get_system_timezone_name() -> str:
+    """Returns the system's timezone name, shared across processes via a cache file.
+
+    The resolved name is stored in `TIMEZONE_CACHE` together with the mtime of
+    `/etc/localtime` and the `TZ` env var; it is reused for as long as both
+    are unchanged, so parallel invocations skip the subprocess lookups. The
+    UTC fallback for a failed lookup (e.g. a timedatectl timeout) is not
+    stored, so the next process tries again.
+    """
+    key: dict[str, int | str | None] = _timezone_cache_key()
+    try:
+        cached = json.loads(TIMEZONE_CACHE.read_text())
+        if cached["key"] == key and isinstance(cached["timezone"], str):
+            return cached["timezone"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    tz_name: str | None = _resolve_system_timezone_name()
+    if tz_name is None:
+        return "UTC"
+    try:
+        write_json_atomic(TIMEZONE_CACHE, {"key": key, "timezone": tz_name})
+    except OSError:
+        pass  # An unwritable cache only costs the next process a lookup
+    return tz_name
+
+
+def _timezone_cache_key() -> dict[str, int | str | None]:
+    """Returns the inputs that invalidate the cached system timezone."""
+    try:
+        localtime_mtime: int | None = os.lstat(LOCALTIME).st_mtime_ns
+    except OSError:
+        localtime_mtime = None
+    return {"localtime_mtime_ns": localtime_mtime, "TZ": os.environ.get("TZ")}
+
+
+def write_json_atomic(path: Path, data: object) -> None:
+    """Writes JSON to a file atomically so concurrent readers never see partial data."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(data, tmp_file)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def clone_file(source: Path, destination: Path) -> None:
+    """Copies a file, sharing its extents when the filesystem allows it.
+
+    Tries a reflink (FICLONE: btrfs, XFS, bcachefs), then an in-kernel
+    `os.copy_file_range`, then falls back to `shutil.copyfile`. Raises
+    FileExistsError if the destination exists.
+    """
+    with open(source, "rb") as src, open(destination, "xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return
+        except OSError:
+            pass
+        try:
+            remaining: int = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied: int = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            return
+        except OSError:
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+        shutil.copyfileobj(src, dst)
+
+
+@traced()
+def _resolve_system_timezone_name() -> str | None:
     """
     Attempts to retrieve the system's timezone name using various methods.
+    Returns None if no method succeeds.
     """
     # Try timedatectl for Linux systems
     if platform.system() == "Linux":
@@ -53,29 +171,124 @@ def _get_system_timezone_name() -> str:
     ):
         pass
 
-    # Fallback to UTC if no system timezone can be determined
-    return "UTC"
+    # No system timezone could be determined
+    return None
+
+
+@lru_cache(maxsize=ZONE_CACHE_SIZE)
+def get_zone(name: str) -> ZoneInfo:
+    """Returns the ZoneInfo for an IANA timezone name from a bounded LRU cache."""
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=ZONE_CACHE_SIZE)
+def zone_transitions(name: str) -> tuple[list[int], list[timezone], int]:
+    """Precomputes the UTC-offset transition table of a zone.
+
+    The zone is sampled once a day across `TRANSITION_YEARS` and every change
+    of offset or abbreviation is bisected down to the second, so converting an
+    instant inside the table only needs a fixed-offset timezone.
 
+    Args:
+        name: The IANA timezone name.
+
+    Returns:
+        The sorted epoch seconds at which each period starts, a fixed-offset
+        timezone (named after the zone's abbreviation) for each period, and
+        the epoch second at which the table stops being valid.
+    """
+    zone: ZoneInfo = get_zone(name)
+    first: int = int(
+        datetime(TRANSITION_YEARS[0], 1, 1, tzinfo=timezone.utc).timestamp()
+    )
+    end: int = int(datetime(TRANSITION_YEARS[1], 1, 1, tzinfo=timezone.utc).timestamp())
+    fixed: dict[tuple[timedelta | None, str | None], timezone] = {}
+
+    def period(epoch: int) -> timezone:
+        local_dt: datetime = datetime.fromtimestamp(epoch, zone)
+        key: tuple[timedelta | None, str | None] = (
+            local_dt.utcoffset(),
+            local_dt.tzname(),
+        )
+        if key not in fixed:
+            offset: timedelta = key[0] or timedelta(0)
+            fixed[key] = (
+                timezone(offset) if key[1] is None else timezone(offset, key[1])
+            )
+        return fixed[key]
+
+    starts: list[int] = [first]
+    zones: list[timezone] = [period(first)]
+    known: int = first
+    for epoch in range(first + 86_400, end + 86_400, 86_400):
+        current: timezone = period(epoch)
+        while current is not zones[-1]:
+            # Bisect (known, epoch] for the first second of the next period.
+            low, high = known, epoch
+            while high - low > 1:
+                mid: int = (low + high) // 2
+                if period(mid) is zones[-1]:
+                    low = mid
+                else:
+                    high = mid
+            starts.append(high)
+            zones.append(period(high))
+            known = high
+        known = epoch
+    return starts, zones, end
 
+
+@lru_cache(maxsize=TIMEZONE_MEMO_SIZE)
 def str_to_timezone(tz_str: str) -> ZoneInfo | timezone:
+    """Converts an IANA name or a `+05:30`-style UTC offset into a tzinfo.
+
+    Results are memoized per string. Strings starting with a sign are parsed
+    as offsets first, since IANA keys never do, so they skip the failed
+    ZoneInfo lookup. Anything unparseable falls back to UTC.
+    """
+    if tz_str[:1] in ("+", "-"):
+        offset_tz: timezone | None = _parse_utc_offset(tz_str)
+        if offset_tz is not None:
+            return offset_tz
     try:
-        return ZoneInfo(tz_str)  # IANA timezone
-    except Exception:
-        try:
-            # Attempt to parse as UTC offset
-            match = re.match(r"([+-])(\d{1,2})(?::?(\d{2}))?", tz_str)
-            if match:
-                sign, hours_str, minutes_str = match.groups()
-                hours = int(hours_str)
-                minutes = int(minutes_str) if minutes_str else 0
-                offset = timedelta(hours=hours, minutes=minutes)
-                if sign == "-":
-                    offset = -offset
-                return timezone(offset)
-            else:
-                raise ValueError("Invalid timezone string format")
-        except ValueError:
-            return timezone.utc  # fallback
+        return get_zone(tz_str)  # IANA timezone
+    except (ValueError, KeyError, OSError):
+        return _parse_utc_offset(tz_str) or timezone.utc  # fallback
+
+
+def _parse_utc_offset(tz_str: str) -> timezone | None:
+    """Parses a leading UTC offset such as `+05:30`, `-0800` or `+05`."""
+    match: re.Match[str] | None = UTC_OFFSET_PATTERN.match(tz_str)
+    if match is None:
+        return None
+    sign, hours_str, minutes_str = match.groups()
+    minutes: int = int(hours_str) * 60 + (int(minutes_str) if minutes_str else 0)
+    try:
+        return _offset_timezone(-minutes if sign == "-" else minutes)
+    except ValueError:
+        return None  # Offsets of 24 hours or more
+
+
+@cache
+def _offset_timezone(minutes: int) -> timezone:
+    """Returns a shared fixed-offset timezone for an offset in minutes."""
+    return timezone(timedelta(minutes=minutes))
+
+
+def parse_many(tz_strs: Iterable[str]) -> list[ZoneInfo | timezone]:
+    """Converts many timezone strings with `str_to_timezone`.
+
+    Repeated strings within the batch are resolved once through a local dict,
+    which is cheaper than going through the shared memo for every record.
+    """
+    seen: dict[str, ZoneInfo | timezone] = {}
+    result: list[ZoneInfo | timezone] = []
+    for tz_str in tz_strs:
+        tz: ZoneInfo | timezone | None = seen.get(tz_str)
+        if tz is None:
+            tz = seen[tz_str] = str_to_timezone(tz_str)
+        result.append(tz)
+    return result
 
 
 def create_human_readable_timestamp(
@@ -85,8 +298,9 @@ def create_human_readable_timestamp(
 ) -> str:
     """Creates a formatted, human-readable timestamp from a datetime object.
 
-    This function is optimized to cache ZoneInfo lookups, making it highly
-    performant for repeated calls with the same target timezone.
+    ZoneInfo lookups go through the bounded `get_zone` LRU cache, so repeated
+    calls with the same target timezone skip the zone lookup. Use
+    `convert_many` for bulk conversion.
 
     Args:
         dt_object: An optional timezone-aware datetime object. If naive, it's
@@ -104,12 +318,338 @@ def create_human_readable_timestamp(
     else:
         source_dt = dt_object
 
-    display_tz: ZoneInfo = ZoneInfo(target_tz)
+    display_tz: ZoneInfo = get_zone(target_tz)
     local_dt: datetime = source_dt.astimezone(display_tz)
 
     return local_dt.strftime(fmt)
 
 
+def parse_timestamp(value: str | int | float | datetime) -> datetime:
+    """Parses an epoch or ISO-8601 timestamp into an aware datetime.
+
+    Numeric values are epoch seconds, or epoch milliseconds when their
+    magnitude is at least `EPOCH_MS_THRESHOLD`. Strings that are not numeric
+    are parsed as ISO-8601. Naive results are assumed to be in UTC.
+
+    Raises:
+        ValueError: If the value is not a recognised timestamp.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+    return UNIX_EPOCH + timedelta(microseconds=_epoch_micros(value))
+
+
+def _epoch_micros(value: str | int | float | datetime) -> int:
+    """Returns the epoch microseconds of a timestamp without building a datetime for numbers."""
+    if isinstance(value, datetime):
+        return (parse_timestamp(value) - UNIX_EPOCH) // timedelta(microseconds=1)
+    if isinstance(value, str):
+        text: str = value.strip()
+        try:
+            value = float(text) if "." in text else int(text)
+        except ValueError:
+            return _epoch_micros(datetime.fromisoformat(text))
+    if abs(value) >= EPOCH_MS_THRESHOLD:
+        return round(value * 1_000)
+    return round(value * 1_000_000)
+
+
+@lru_cache(maxsize=32)
+def _compile_format(fmt: str) -> tuple[str, tuple[str, ...]] | None:
+    """Splits a strftime format into a per-day template and time-of-day fields.
+
+    Date directives stay in the template, which is rendered with `strftime`
+    once per local day. Time-of-day directives become `%s` slots filled from
+    integer arithmetic. Returns None when the format contains directives that
+    cannot be split this way (e.g. `%c`, `%T` or platform flags like `%-d`).
+    """
+    template: list[str] = []
+    fields: list[str] = []
+    index: int = 0
+    while index < len(fmt):
+        char: str = fmt[index]
+        if char != "%":
+            template.append(char)
+            index += 1
+            continue
+        if index + 1 == len(fmt):
+            return None
+        directive: str = fmt[index + 1]
+        if directive == "%":
+            template.append("%%%%")
+        elif directive in _TIME_DIRECTIVES:
+            template.append("%%s")
+            fields.append(directive)
+        elif directive.isalpha() and directive not in _COMPOSITE_DIRECTIVES:
+            template.append("%" + directive)
+        else:
+            return None
+        index += 2
+    return "".join(template), tuple(fields)
+
+
+def _time_fields(fields: tuple[str, ...], seconds: int, micros: int) -> tuple[str, ...]:
+    """Renders the time-of-day fields of a compiled format."""
+    hour: int = seconds // 3600
+    values: dict[str, str] = {
+        "H": f"{hour:02d}",
+        "I": f"{hour % 12 or 12:02d}",
+        "M": f"{seconds // 60 % 60:02d}",
+        "S": f"{seconds % 60:02d}",
+        "p": _MERIDIEM[hour >= 12],
+        "f": f"{micros:06d}",
+    }
+    return tuple(values[field] for field in fields)
+
+
+def convert_many(
+    values: Iterable[str | int | float | datetime],
+    target_tz: str = "America/Chicago",
+    fmt: str = "%Y-%m-%d %I:%M:%S %p",
+    on_error: str = "raise",
+) -> Iterator[str]:
+    """Lazily converts many timestamps into human-readable strings.
+
+    Instants are resolved against the zone's precomputed `zone_transitions`
+    table with a moving pointer, so a sorted stream advances through the
+    table instead of doing a full timezone lookup per value. The format is
+    compiled once: date fields are rendered once per local day and time
+    fields are filled in from integer arithmetic, without a datetime per
+    value.
+
+    Args:
+        values: Epoch seconds, epoch milliseconds, ISO-8601 strings or
+                datetime objects. Blank strings are skipped.
+        target_tz: The IANA timezone name to convert the times to.
+        fmt: The strftime format string for the output.
+        on_error: What to do with an unparseable value: raise a ValueError,
+                  skip it, or pass it through unchanged.
+
+    Yields:
+        One formatted string per converted value.
+
+    Raises:
+        ValueError: If a value is invalid and `on_error` is "raise", or if
+                    `on_error` is not one of the supported modes.
+    """
+    if on_error not in ("raise", "skip", "passthrough"):
+        raise ValueError(f"Invalid on_error mode: {on_error!r}")
+    display_tz: ZoneInfo = get_zone(target_tz)
+    starts, zones, end = zone_transitions(target_tz)
+    offsets: list[int] = [
+        (zone.utcoffset(None) or timedelta(0)) // timedelta(microseconds=1)
+        for zone in zones
+    ]
+    last_start: int = len(starts) - 1
+    compiled: tuple[str, tuple[str, ...]] | None = _compile_format(fmt)
+    day_templates: dict[tuple[int, int], str] = {}
+    time_cache: dict[int, tuple[str, ...]] = {}
+    index: int = 0
+
+    for value in values:
+        if isinstance(value, str) and not value.strip():
+            continue
+        try:
+            micros: int = _epoch_micros(value)
+            epoch: int = micros // 1_000_000
+            if compiled is None or not starts[0] <= epoch < end:
+                yield (
+                    (UNIX_EPOCH + timedelta(microseconds=micros))
+                    .astimezone(display_tz)
+                    .strftime(fmt)
+                )
+                continue
+        except (ValueError, OverflowError, OSError):
+            if on_error == "skip":
+                continue
+            if on_error == "passthrough":
+                yield str(value).strip()
+                continue
+            raise ValueError(f"Invalid timestamp: {value!r}")
+
+        if epoch < starts[index]:
+            index = bisect_right(starts, epoch) - 1
+        while index < last_start and starts[index + 1] <= epoch:
+            index += 1
+
+        local_seconds, fraction = divmod(micros + offsets[index], 1_000_000)
+        day, seconds = divmod(local_seconds, 86_400)
+        template: str | None = day_templates.get((day, index))
+        if template is None:
+            if len(day_templates) >= 4096:
+                day_templates.clear()
+            midnight: datetime = datetime.fromtimestamp(
+                day * 86_400, timezone.utc
+            ).replace(tzinfo=zones[index])
+            template = midnight.strftime(compiled[0])
+            day_templates[(day, index)] = template
+
+        if "f" in compiled[1]:
+            yield template % _time_fields(compiled[1], seconds, fraction)
+            continue
+        fields: tuple[str, ...] | None = time_cache.get(seconds)
+        if fields is None:
+            fields = _time_fields(compiled[1], seconds, 0)
+            time_cache[seconds] = fields
+        yield template % fields
+
+
+def format_datetime64(
+    values: "np.ndarray",
+    target_tz: str = "America/Chicago",
+    fmt: str = "%Y-%m-%d %I:%M:%S %p",
+) -> "np.ndarray":
+    """Formats an array of UTC instants without creating a datetime per element.
+
+    Zone offsets come from `zone_transitions` via a vectorized searchsorted,
+    civil dates are derived with integer arithmetic, and the digits are written
+    straight into a fixed-width byte buffer. Requires numpy.
+
+    Args:
+        values: A numpy datetime64 array of UTC instants, in any unit. NaT
+                elements produce an empty string.
+        target_tz: The IANA timezone name to convert the times to.
+        fmt: A strftime format built from `%Y %y %m %d %H %I %M %S %p %%` and
+             ASCII literals.
+
+    Returns:
+        A fixed-width bytes (`S<n>`) array with the same shape as `values`.
+
+    Raises:
+        ValueError: If `fmt` uses an unsupported directive.
+    """
+    import numpy as np
+
+    layout: list[tuple[str, bytes]] = _datetime64_layout(fmt)
+    width: int = sum(len(chunk) for _, chunk in layout)
+    array = np.asarray(values)
+    flat = array.astype("datetime64[s]").ravel()
+    not_a_time = np.isnat(flat)
+    seconds = np.where(not_a_time, 0, flat.astype(np.int64))
+
+    starts, zones, end = zone_transitions(target_tz)
+    offsets = np.array(
+        [
+            (zone.utcoffset(None) or timedelta(0)) // timedelta(seconds=1)
+            for zone in zones
+        ],
+        dtype=np.int64,
+    )
+    index = (
+        np.searchsorted(np.asarray(starts, dtype=np.int64), seconds, side="right") - 1
+    )
+    local = seconds + offsets[np.clip(index, 0, len(offsets) - 1)]
+    outside = np.flatnonzero((seconds < starts[0]) | (seconds >= end))
+    if outside.size:
+        display_tz: ZoneInfo = get_zone(target_tz)
+        for position in outside:
+            instant: datetime = UNIX_EPOCH + timedelta(seconds=int(seconds[position]))
+            offset: timedelta = instant.astimezone(display_tz).utcoffset() or timedelta(
+                0
+            )
+            local[position] = seconds[position] + offset // timedelta(seconds=1)
+
+    # Civil date from days since the epoch (Howard Hinnant's days_from_civil inverse).
+    days, second_of_day = np.divmod(local, 86_400)
+    shifted = days + 719_468
+    era = np.floor_divide(shifted, 146_097)
+    day_of_era = shifted - era * 146_097
+    year_of_era = (
+        day_of_era - day_of_era // 1_460 + day_of_era // 36_524 - day_of_era // 146_096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    month_index = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month_index + 2) // 5 + 1
+    month = np.where(month_index < 10, month_index + 3, month_index - 9)
+    year = year_of_era + era * 400 + (month <= 2)
+    hour = second_of_day // 3_600
+
+    fields: dict[str, "np.ndarray"] = {
+        "Y": year,
+        "y": year % 100,
+        "m": month,
+        "d": day,
+        "H": hour,
+        "I": np.where(hour % 12 == 0, 12, hour % 12),
+        "M": second_of_day // 60 % 60,
+        "S": second_of_day % 60,
+    }
+    buffer = np.zeros((flat.size, width), dtype=np.uint8)
+    column: int = 0
+    for directive, chunk in layout:
+        if directive == "p":
+            buffer[:, column : column + len(chunk)] = np.where(
+                (hour >= 12)[:, None],
+                np.frombuffer(_MERIDIEM[1].encode("ascii"), dtype=np.uint8),
+                np.frombuffer(_MERIDIEM[0].encode("ascii"), dtype=np.uint8),
+            )
+        elif directive:
+            value = fields[directive]
+            for digit in range(len(chunk)):
+                power: int = 10 ** (len(chunk) - digit - 1)
+                buffer[:, column + digit] = 48 + value // power % 10
+        else:
+            buffer[:, column : column + len(chunk)] = np.frombuffer(
+                chunk, dtype=np.uint8
+            )
+        column += len(chunk)
+
+    buffer[not_a_time] = 0
+    return buffer.view(f"S{width}").reshape(array.shape)
+
+
+def _datetime64_layout(fmt: str) -> list[tuple[str, bytes]]:
+    """Splits a format into (directive, placeholder) pairs; literals use an empty directive."""
+    widths: dict[str, int] = {
+        "Y": 4,
+        "y": 2,
+        "m": 2,
+        "d": 2,
+        "H": 2,
+        "I": 2,
+        "M": 2,
+        "S": 2,
+    }
+    if (
+        len(_MERIDIEM[0]) != len(_MERIDIEM[1])
+        or not (_MERIDIEM[0] + _MERIDIEM[1]).isascii()
+    ):
+        widths.pop("p", None)
+    else:
+        widths["p"] = len(_MERIDIEM[0])
+
+    layout: list[tuple[str, bytes]] = []
+    index: int = 0
+    while index < len(fmt):
+        char: str = fmt[index]
+        if char == "%" and index + 1 < len(fmt) and fmt[index + 1] == "%":
+            if layout and not layout[-1][0]:
+                layout[-1] = ("", layout[-1][1] + b"%")
+            else:
+                layout.append(("", b"%"))
+        elif char == "%" and index + 1 < len(fmt) and fmt[index + 1] in widths:
+            layout.append((fmt[index + 1], b"0" * widths[fmt[index + 1]]))
+        elif char == "%":
+            raise ValueError(f"Unsupported directive in {fmt!r} at position {index}")
+        elif not char.isascii():
+            raise ValueError(f"Non-ASCII literal {char!r} in {fmt!r}")
+        elif layout and not layout[-1][0]:
+            layout[-1] = ("", layout[-1][1] + char.encode("ascii"))
+            index += 1
+            continue
+        else:
+            layout.append(("", char.encode("ascii")))
+            index += 1
+            continue
+        index += 2
+    return layout
+
+
+@traced()
 def nix_run_prefix(command: str) -> tuple[str, ...]:
     """Returns the prefix for nix commands."""
     return (
@@ -122,6 +662,7 @@ def nix_run_prefix(command: str) -> tuple[str, ...]:
     )
 
 
+@traced()
 def which_nix() -> Path:
     """Returns the path to the nix executable."""
     result: CompletedProcess[str] = subprocess.run(
@@ -135,6 +676,7 @@ def which_nix() -> Path:
     return nix
 
 
+@traced()
 def which_executable(executable: str) -> Path:
     """Returns the path to the nix executable."""
     result: CompletedProcess[str] = subprocess.run(
@@ -0,0 +1,77 @@
+# Standard Library
+import lzma
+import os
+import tarfile
+import time
+from pathlib import Path
+
+# My Imports
+from moscripts.archive import (
+    ARCHIVE_FILE,
+    archive_notebooks,
+    read_index,
+    restore_entry,
+)
+from moscripts.locks import hold_for_exec
+
+
+def make_notebook(
+    directory: Path, name: str, session: bool
+) -> tuple[Path, Path | None]:
+    notebook: Path = directory / f"{name}.py"
+    notebook.write_text(f"# {name}\n")
+    if not session:
+        return notebook, None
+    session_file: Path = directory / "__marimo__" / "session" / f"{name}.py.json"
+    session_file.parent.mkdir(parents=True, exist_ok=True)
+    session_file.write_text('{"cells": []}')
+    return notebook, session_file
+
+
+def test_archive_and_restore(tmp_path: Path) -> None:
+    directory: Path = tmp_path / "motmp"
+    directory.mkdir()
+    archive_dir: Path = directory / "archive"
+    first = make_notebook(directory, "motmp_a", session=True)
+    second = make_notebook(directory, "motmp_b", session=False)
+
+    entries = archive_notebooks(
+        [first, second], directory, archive_dir, time.time() + 1
+    )
+    assert [entry.name for entry in entries] == ["motmp_a", "motmp_b"]
+    assert first[1] is not None
+    assert not first[0].exists() and not first[1].exists() and not second[0].exists()
+    index = read_index(archive_dir)
+    assert index["motmp_a"].members == (
+        "motmp_a.py",
+        "__marimo__/session/motmp_a.py.json",
+    )
+
+    # Each notebook is its own stream, and the whole archive is one valid tar.xz
+    with tarfile.open(archive_dir / ARCHIVE_FILE, "r:xz") as tar:
+        assert tar.getnames() == [*index["motmp_a"].members, "motmp_b.py"]
+
+    # Restoring reads only the entry's own bytes
+    data: bytes = (archive_dir / ARCHIVE_FILE).read_bytes()
+    entry = index["motmp_b"]
+    assert lzma.decompress(data[entry.offset : entry.offset + entry.length])
+    assert restore_entry(archive_dir, entry, directory) == second[0]
+    assert second[0].read_text() == "# motmp_b\n"
+    restore_entry(archive_dir, index["motmp_a"], directory)
+    assert first[1].read_text() == '{"cells": []}'
+
+
+def test_archive_skips_recent_and_open(tmp_path: Path) -> None:
+    directory: Path = tmp_path / "motmp"
+    directory.mkdir()
+    recent = make_notebook(directory, "motmp_recent", session=False)
+    opened = make_notebook(directory, "motmp_open", session=False)
+    fd: int = hold_for_exec(opened[0])
+
+    assert archive_notebooks([recent], directory, directory / "archive", 0) == []
+    assert (
+        archive_notebooks([opened], directory, directory / "archive", time.time() + 1)
+        == []
+    )
+    assert recent[0].exists() and opened[0].exists()
+    os.close(fd)
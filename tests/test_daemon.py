@@ -0,0 +1,131 @@
+# Standard Library
+import os
+import stat
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+# Third Party
+import pytest
+
+# My Imports
+import moscripts.client
+from moscripts.client import call_daemon
+from moscripts.daemon import serve
+
+test_dir: Path = Path(__file__).parent
+root_dir: Path = test_dir.parent
+CLIENT: str = moscripts.client.__file__
+
+
+@pytest.fixture
+def daemon_socket(tmp_path: Path) -> Iterator[Path]:
+    """Starts a daemon on a temporary socket and stops it afterwards."""
+    socket_path: Path = tmp_path / "daemon.sock"
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from pathlib import Path; from moscripts.daemon import serve; serve(Path(sys.argv[1]))",
+            str(socket_path),
+        ],
+        env={**os.environ, "MOSCRIPTS_ROOT": str(root_dir)},
+    )
+    for _ in range(100):
+        if socket_path.exists():
+            break
+        time.sleep(0.05)
+    yield socket_path
+    process.terminate()
+    process.wait(timeout=5)
+
+
+def run_through_daemon(
+    socket_path: Path, tool: str, args: list[str], stdin: bytes = b""
+) -> tuple[int | None, str, str]:
+    """Calls the daemon with pipes for stdio and returns (code, stdout, stderr)."""
+    stdin_read, stdin_write = os.pipe()
+    os.write(stdin_write, stdin)
+    os.close(stdin_write)
+    out_read, out_write = os.pipe()
+    err_read, err_write = os.pipe()
+    code: int | None = call_daemon(
+        tool, args, socket_path, fds=(stdin_read, out_write, err_write)
+    )
+    for fd in (stdin_read, out_write, err_write):
+        os.close(fd)
+    with os.fdopen(out_read) as out, os.fdopen(err_read) as err:
+        return code, out.read(), err.read()
+
+
+def test_call_daemon_without_daemon(tmp_path: Path) -> None:
+    assert call_daemon("hello", [], tmp_path / "missing.sock") is None
+
+
+def test_call_daemon_hello(daemon_socket: Path) -> None:
+    code, stdout, stderr = run_through_daemon(daemon_socket, "hello", [])
+    assert code == 0
+    assert stdout == "Hello from moscripts hello app!\n"
+    assert stderr == ""
+
+
+def test_call_daemon_forwards_argv_and_stdin(daemon_socket: Path) -> None:
+    code, stdout, _ = run_through_daemon(
+        daemon_socket, "password_generator", ["--cli", "--length", "16"]
+    )
+    assert code == 0
+    assert len(stdout.strip()) == 16
+
+    code, stdout, _ = run_through_daemon(
+        daemon_socket,
+        "human_timestamp",
+        ["--stdin", "-t", "UTC", "-f", "%Y"],
+        stdin=b"0\n",
+    )
+    assert code == 0
+    assert stdout == "1970\n"
+
+
+def test_call_daemon_exit_codes(daemon_socket: Path) -> None:
+    code, _, stderr = run_through_daemon(
+        daemon_socket, "password_generator", ["--length", "0"]
+    )
+    assert code == 2
+    assert stderr != ""
+
+    code, _, stderr = run_through_daemon(daemon_socket, "motmp", [])
+    assert code == 127
+    assert "not served" in stderr
+
+
+def test_daemon_socket_is_private(daemon_socket: Path) -> None:
+    assert stat.S_IMODE(daemon_socket.stat().st_mode) & 0o077 == 0
+
+
+def test_serve_refuses_shared_directory(tmp_path: Path) -> None:
+    tmp_path.chmod(0o777)
+    with pytest.raises(RuntimeError, match="not writable by others"):
+        serve(tmp_path / "daemon.sock")
+    assert not (tmp_path / "daemon.sock").exists()
+
+
+def test_client_shim(daemon_socket: Path, tmp_path: Path) -> None:
+    shim: list[str] = [sys.executable, "-I", "-S", str(CLIENT), "hello"]
+    env: dict[str, str] = {
+        **os.environ,
+        "MOSCRIPTS_ROOT": str(root_dir),
+        "MOSCRIPTS_DAEMON_SOCKET": str(daemon_socket),
+    }
+    served = subprocess.run(shim, env=env, capture_output=True, text=True, check=False)
+    assert served.returncode == 0
+    assert served.stdout == "Hello from moscripts hello app!\n"
+
+    # Falls back to running the tool in-process
+    env["MOSCRIPTS_DAEMON_SOCKET"] = str(tmp_path / "missing.sock")
+    fallback = subprocess.run(
+        shim, env=env, capture_output=True, text=True, check=False
+    )
+    assert fallback.returncode == 0
+    assert fallback.stdout == served.stdout
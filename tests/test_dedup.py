@@ -0,0 +1,62 @@
+# Standard Library
+import os
+from pathlib import Path
+
+# Third Party
+import pytest
+
+# My Imports
+from moscripts import dedup
+from moscripts.dedup import find_duplicates
+
+
+def write(path: Path, content: bytes, mtime_ns: int) -> Path:
+    path.write_bytes(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def test_find_duplicates(tmp_path: Path) -> None:
+    empty: Path = write(tmp_path / "empty.py", b"", 1)
+    older: Path = write(tmp_path / "older.py", b"import polars\n", 1)
+    newer: Path = write(tmp_path / "newer.py", b"import polars\n", 2)
+    # Same size as the duplicates, different contents
+    other: Path = write(tmp_path / "other.py", b"import altair\n", 3)
+    unique: Path = write(tmp_path / "unique.py", b"x = 1\n", 4)
+    cache: Path = tmp_path / "digests.json"
+
+    assert find_duplicates([empty, older, newer, other, unique], cache) == (
+        [empty],
+        [older],
+    )
+    assert cache.exists()
+
+
+def test_find_duplicates_uses_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first: Path = write(tmp_path / "a.py", b"same", 1)
+    second: Path = write(tmp_path / "b.py", b"same", 2)
+    cache: Path = tmp_path / "digests.json"
+    find_duplicates([first, second], cache)
+
+    hashed: list[Path] = []
+    real_digest = dedup.file_digest
+    monkeypatch.setattr(
+        dedup, "file_digest", lambda path: hashed.append(path) or real_digest(path)
+    )
+    assert find_duplicates([first, second], cache) == ([], [first])
+    assert hashed == []
+
+    # Relative paths share the entries of the files they point to
+    monkeypatch.chdir(tmp_path)
+    assert find_duplicates([Path("a.py"), Path("b.py")], cache) == (
+        [],
+        [Path("a.py")],
+    )
+    assert hashed == []
+
+    # A changed file is hashed again
+    write(second, b"diff", 3)
+    assert find_duplicates([first, second], cache) == ([], [])
+    assert hashed == [second]
@@ -0,0 +1,54 @@
+# Standard Library
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# My Imports
+from moscripts.launcher import frozen_sys_path, write_launcher
+
+
+def run(launcher: Path) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-IS", str(launcher), "--flag"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_frozen_sys_path() -> None:
+    sys_path: list[str] = frozen_sys_path(Path(sys.executable))
+    assert sys_path
+    assert "" not in sys_path
+    assert all(Path(path).exists() for path in sys_path)
+
+
+def test_write_launcher(tmp_path: Path) -> None:
+    script: Path = tmp_path / "tool.py"
+    script.write_text(
+        "import sys, typer\n"
+        "print(__name__, __file__, sys.flags.no_site, sys.flags.isolated, sys.argv[1:])\n"
+    )
+    launcher: Path = tmp_path / "tool"
+    manifest: Path = tmp_path / "tool.sys-path.json"
+    sys_path: list[str] = write_launcher(
+        Path(sys.executable), script, launcher, manifest
+    )
+
+    assert json.loads(manifest.read_text()) == sys_path
+    assert launcher.read_text().startswith(f"#!{sys.executable} -IS\n")
+    result: subprocess.CompletedProcess[str] = run(launcher)
+    assert result.stderr == ""
+    assert result.stdout == f"__main__ {script} 1 1 ['--flag']\n"
+
+    # The compiled script runs without recompiling the source
+    code: Path = tmp_path / "tool.code"
+    assert code.read_bytes().startswith(importlib.util.MAGIC_NUMBER)
+    script.write_text("raise SystemExit('source was compiled')\n")
+    assert run(launcher).stdout == f"__main__ {script} 1 1 ['--flag']\n"
+
+    # Code compiled for another interpreter falls back to the source
+    code.write_bytes(b"\0\0\r\n" + code.read_bytes()[4:])
+    assert run(launcher).stderr == "source was compiled\n"
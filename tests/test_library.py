@@ -0,0 +1,152 @@
+# Standard Library
+import os
+import struct
+from pathlib import Path
+
+# Third Party
+import pytest
+
+# My Imports
+from moscripts import library
+from moscripts.library import (
+    Track,
+    parse_query,
+    query_tracks,
+    read_tags,
+    scan_library,
+    write_m3u,
+)
+
+pytest.importorskip("mutagen")
+
+
+def syncsafe(value: int) -> bytes:
+    return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def id3_tag(frames: dict[str, str], version: int = 3) -> bytes:
+    """Builds an ID3v2.3/2.4 tag with UTF-8 (v2.4) or UTF-16 (v2.3) text frames."""
+    body: bytes = b""
+    for frame_id, text in frames.items():
+        payload: bytes = (
+            b"\x03" + text.encode() if version == 4 else b"\x01" + text.encode("utf-16")
+        )
+        size: bytes = (
+            syncsafe(len(payload)) if version == 4 else struct.pack(">I", len(payload))
+        )
+        body += frame_id.encode() + size + b"\x00\x00" + payload
+    body += b"\x00" * 32  # Padding
+    return b"ID3" + bytes((version, 0, 0)) + syncsafe(len(body)) + body
+
+
+def vorbis_comment(comments: dict[str, str]) -> bytes:
+    vendor: bytes = b"test"
+    entries: list[bytes] = [f"{k}={v}".encode() for k, v in comments.items()]
+    return (
+        struct.pack("<I", len(vendor))
+        + vendor
+        + struct.pack("<I", len(entries))
+        + b"".join(struct.pack("<I", len(entry)) + entry for entry in entries)
+    )
+
+
+def flac_file(comments: dict[str, str], sample_rate: int, samples: int) -> bytes:
+    packed: int = (sample_rate << 44) | (1 << 41) | (15 << 36) | samples
+    streaminfo: bytes = b"\x00" * 10 + packed.to_bytes(8, "big") + b"\x00" * 16
+    vorbis: bytes = vorbis_comment(comments)
+    return (
+        b"fLaC"
+        + b"\x00"
+        + len(streaminfo).to_bytes(3, "big")
+        + streaminfo
+        + b"\x84"
+        + len(vorbis).to_bytes(3, "big")
+        + vorbis
+    )
+
+
+# MPEG-1 layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames of 1152 samples
+MP3_HEADER: bytes = b"\xff\xfb\x90\x00"
+MP3_FRAME: bytes = MP3_HEADER + b"\x00" * 413
+
+
+def test_read_tags(tmp_path: Path) -> None:
+    mp3: Path = tmp_path / "song.mp3"
+    mp3.write_bytes(
+        id3_tag({"TIT2": "Blue in Green", "TPE1": "Miles Davis", "TCON": "Jazz"})
+        + MP3_FRAME * 10
+    )
+    track: Track = read_tags(str(mp3), 1)
+    assert (track.title, track.artist, track.album, track.genre) == (
+        "Blue in Green",
+        "Miles Davis",
+        None,
+        "Jazz",
+    )
+    assert track.duration == pytest.approx(10 * 1152 / 44100, rel=0.05)
+    flac: Path = tmp_path / "song.flac"
+    flac.write_bytes(
+        flac_file({"TITLE": "So What", "album": "Kind of Blue"}, 44100, 441000)
+    )
+    track = read_tags(str(flac), 2)
+    assert (track.title, track.album, track.duration) == (
+        "So What",
+        "Kind of Blue",
+        10.0,
+    )
+
+
+def test_read_tags_unreadable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path: Path = tmp_path / "song.ogg"
+    path.write_bytes(b"OggS" + b"\x00" * 100)
+    assert read_tags(str(path), 1) == Track(path=str(path), mtime_ns=1)
+
+    # Without mutagen every file is indexed by path only
+    mp3: Path = tmp_path / "song.mp3"
+    mp3.write_bytes(id3_tag({"TIT2": "Impressions"}) + MP3_FRAME * 10)
+    monkeypatch.setattr(library, "mutagen", None)
+    assert read_tags(str(mp3), 1) == Track(path=str(mp3), mtime_ns=1)
+
+
+def test_parse_query() -> None:
+    assert parse_query('artist:miles genre:"cool jazz"') == (
+        "artist LIKE ? ESCAPE '\\' AND genre LIKE ? ESCAPE '\\'",
+        ["%miles%", "%cool jazz%"],
+    )
+    assert parse_query("artist:100%_")[1] == ["%100\\%\\_%"]
+    assert parse_query("")[0] == "1"
+    with pytest.raises(ValueError, match="Unknown field"):
+        parse_query("year:1959")
+
+
+def test_scan_and_query(tmp_path: Path) -> None:
+    music: Path = tmp_path / "Music"
+    (music / "jazz").mkdir(parents=True)
+    (music / "rock").mkdir()
+    blue: Path = music / "jazz" / "blue.mp3"
+    blue.write_bytes(id3_tag({"TPE1": "Miles Davis", "TCON": "Jazz"}) + MP3_FRAME * 4)
+    what: Path = music / "jazz" / "what.flac"
+    what.write_bytes(flac_file({"ARTIST": "Miles Davis", "GENRE": "Jazz"}, 8000, 8000))
+    rock: Path = music / "rock" / "song.mp3"
+    rock.write_bytes(id3_tag({"TPE1": "Someone", "TCON": "Rock"}) + MP3_FRAME * 4)
+    (music / "cover.jpg").write_bytes(b"")
+    db: Path = tmp_path / "library.sqlite"
+
+    assert scan_library(music, db) == (3, 0, 0)
+    assert query_tracks("artist:miles", db) == [str(blue), str(what)]
+    assert query_tracks("genre:rock", db) == [str(rock)]
+    assert query_tracks("davis genre:jazz", db) == [str(blue), str(what)]
+    assert query_tracks("artist:m_les", db) == []
+
+    # Only changed files are re-read; deleted files leave the index
+    assert scan_library(music, db) == (0, 0, 3)
+    rock.write_bytes(id3_tag({"TPE1": "Someone", "TCON": "Jazz"}) + MP3_FRAME * 4)
+    os.utime(rock, ns=(0, 1))
+    blue.unlink()
+    assert scan_library(music, db) == (1, 1, 1)
+    assert query_tracks("genre:jazz", db) == [str(what), str(rock)]
+
+
+def test_write_m3u(tmp_path: Path) -> None:
+    playlist: Path = write_m3u(["/a.mp3", "/b.flac"], tmp_path / "lists" / "q.m3u")
+    assert playlist.read_text() == "/a.mp3\n/b.flac\n"
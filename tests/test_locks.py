@@ -0,0 +1,73 @@
+# Standard Library
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Third Party
+import pytest
+
+# My Imports
+from moscripts import locks
+from moscripts.locks import directory_lock, directory_lock_path, hold_for_exec, locked
+
+# Reports whether the file in argv[1] can be locked exclusively right now.
+TRY_LOCK: str = (
+    "import fcntl, os, sys\n"
+    "fd = os.open(sys.argv[1], os.O_RDONLY)\n"
+    "try:\n"
+    "    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)\n"
+    "    print('free')\n"
+    "except BlockingIOError:\n"
+    "    print('held')\n"
+)
+
+
+def try_lock(path: Path) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", TRY_LOCK, str(path)], capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_shared_and_exclusive(tmp_path: Path) -> None:
+    path: Path = tmp_path / "file.lock"
+    with locked(path, exclusive=False), locked(path, exclusive=False, blocking=False):
+        with pytest.raises(BlockingIOError):
+            with locked(path, blocking=False):
+                pass
+    with locked(path):
+        with pytest.raises(BlockingIOError):
+            with locked(path, exclusive=False, blocking=False):
+                pass
+        assert try_lock(path) == "held"
+    assert try_lock(path) == "free"
+
+
+def test_directory_lock(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(locks, "LOCK_DIR", tmp_path / "locks")
+    directory: Path = tmp_path / "notebooks"
+    assert directory_lock_path(directory) == directory_lock_path(
+        tmp_path / "." / "notebooks"
+    )
+    with directory_lock(directory):
+        assert try_lock(directory_lock_path(directory)) == "held"
+    assert not directory.exists()
+
+
+def test_hold_for_exec(tmp_path: Path) -> None:
+    notebook: Path = tmp_path / "motmp_test.py"
+    notebook.touch()
+    fd: int = hold_for_exec(notebook)
+    try:
+        assert os.get_inheritable(fd)
+        # A child that inherits the fd keeps the lock after the parent closes it
+        child: subprocess.Popen[bytes] = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stdin.read()"],
+            stdin=subprocess.PIPE,
+            pass_fds=(fd,),
+        )
+    finally:
+        os.close(fd)
+    assert try_lock(notebook) == "held"
+    child.communicate(b"")
+    assert try_lock(notebook) == "free"
@@ -0,0 +1,53 @@
+# Standard Library
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+
+# Third Party
+import pytest
+
+# My Imports
+from moscripts.mix import parse_mix_spec, read_entries, weighted_mix
+
+
+def test_parse_mix_spec(tmp_path: Path) -> None:
+    (tmp_path / "focus.m3u").write_text("")
+    assert parse_mix_spec("focus.m3u:0.7", tmp_path) == (tmp_path / "focus.m3u", 0.7)
+    assert parse_mix_spec("focus.m3u", tmp_path) == (tmp_path / "focus.m3u", 1.0)
+    with pytest.raises(ValueError, match="positive"):
+        parse_mix_spec("focus.m3u:0", tmp_path)
+    with pytest.raises(ValueError, match="not found"):
+        parse_mix_spec("missing.m3u:1", tmp_path)
+
+
+def test_read_entries(tmp_path: Path) -> None:
+    playlist: Path = tmp_path / "list.m3u"
+    playlist.write_text(
+        "#EXTM3U\n/music/a.mp3\n\nsub/../b.flac\nhttps://radio.example/stream\n"
+    )
+    assert list(read_entries(playlist)) == [
+        "/music/a.mp3",
+        str(tmp_path / "b.flac"),
+        "https://radio.example/stream",
+    ]
+
+
+def test_weighted_mix() -> None:
+    heavy: list[str] = [f"/heavy/{n}" for n in range(10_000)]
+    light: list[str] = [f"/light/{n}" for n in range(10_000)]
+    head: list[str] = list(
+        islice(weighted_mix([(iter(heavy), 0.7), (iter(light), 0.3)], seed=1), 1000)
+    )
+    share: float = Counter(entry.split("/")[1] for entry in head)["heavy"] / 1000
+    assert 0.65 < share < 0.75
+    # Each source keeps its own order
+    assert [entry for entry in head if entry.startswith("/light")] == light[
+        : 1000 - int(share * 1000)
+    ]
+
+
+def test_weighted_mix_drains_and_dedups() -> None:
+    mixed: list[str] = list(
+        weighted_mix([(iter(["a", "b", "c"]), 5), (iter(["c", "d"]), 1)], seed=0)
+    )
+    assert sorted(mixed) == ["a", "b", "c", "d"]
@@ -0,0 +1,113 @@
+# Standard Library
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+# Third Party
+import pytest
+
+# My Imports
+from moscripts.mpv import (
+    MpvClient,
+    MpvError,
+    connect_mpv,
+    load_playlist,
+    mpv_socket_path,
+)
+
+
+class FakeMpv:
+    """Minimal stand-in for mpv's JSON IPC server.
+
+    Records every command, answers with `success` unless the command is in
+    `failing`, and sends an event before each reply as mpv does.
+    """
+
+    def __init__(self, socket_path: Path) -> None:
+        self.commands: list[list[Any]] = []
+        self.failing: set[str] = set()
+        self.server: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(str(socket_path))
+        self.server.listen()
+        self.thread: threading.Thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self) -> None:
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                return
+            with connection, connection.makefile("rb") as lines:
+                for line in lines:
+                    request: dict[str, Any] = json.loads(line)
+                    self.commands.append(request["command"])
+                    error: str = (
+                        "invalid parameter"
+                        if request["command"][0] in self.failing
+                        else "success"
+                    )
+                    reply: dict[str, Any] = {
+                        "request_id": request["request_id"],
+                        "error": error,
+                        "data": None,
+                    }
+                    connection.sendall(
+                        b'{"event":"playback-restart"}\n'
+                        + json.dumps(reply).encode()
+                        + b"\n"
+                    )
+
+    def close(self) -> None:
+        self.server.close()
+
+
+@pytest.fixture
+def fake_mpv(tmp_path: Path) -> Iterator[tuple[FakeMpv, Path]]:
+    socket_path: Path = tmp_path / "mpv.sock"
+    server: FakeMpv = FakeMpv(socket_path)
+    yield server, socket_path
+    server.close()
+
+
+def test_mpv_socket_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MOSCRIPTS_MPV_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert mpv_socket_path() == Path("/run/user/1000/moscripts/mpv.sock")
+    monkeypatch.setenv("MOSCRIPTS_MPV_SOCKET", "/tmp/mpv.sock")
+    assert mpv_socket_path() == Path("/tmp/mpv.sock")
+
+
+def test_connect_without_mpv(tmp_path: Path) -> None:
+    assert connect_mpv(tmp_path / "missing.sock") is None
+    stale: Path = tmp_path / "stale.sock"
+    listener: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(stale))
+    listener.close()
+    assert connect_mpv(stale) is None
+
+
+def test_load_playlist(fake_mpv: tuple[FakeMpv, Path]) -> None:
+    server, socket_path = fake_mpv
+    client: MpvClient | None = connect_mpv(socket_path)
+    assert client is not None
+    with client:
+        load_playlist(client, Path("/music/focus.m3u"), shuffle=True)
+    assert server.commands == [
+        ["loadlist", "/music/focus.m3u", "replace"],
+        ["playlist-shuffle"],
+        ["playlist-play-index", 0],
+        ["set_property", "pause", False],
+    ]
+
+
+def test_command_error(fake_mpv: tuple[FakeMpv, Path]) -> None:
+    server, socket_path = fake_mpv
+    server.failing.add("loadlist")
+    with MpvClient.connect(socket_path) as client:
+        with pytest.raises(MpvError, match="invalid parameter"):
+            client.command("loadlist", "/missing.m3u", "replace")
+        assert client.command("set_property", "pause", False) is None
@@ -0,0 +1,45 @@
+# Standard Library
+import os
+from pathlib import Path
+
+# My Imports
+from moscripts.notebook_index import fts_query, search_notebooks, update_index
+
+
+def test_fts_query() -> None:
+    assert fts_query("polars joins") == '"polars" "joins"'
+    assert fts_query('pola* AND "df"') == '"pola"* "AND" "df"'
+    assert fts_query("  -- ") == ""
+
+
+def test_update_and_search(tmp_path: Path) -> None:
+    notebooks: Path = tmp_path / "motmp"
+    notebooks.mkdir()
+    joins: Path = notebooks / "motmp_a.py"
+    joins.write_text("import polars as pl\ndf = left.join(right, on='id')\n")
+    plot: Path = notebooks / "motmp_b.py"
+    plot.write_text("import altair as alt\nchart = alt.Chart(df)\n")
+    empty: Path = notebooks / "motmp_c.py"
+    empty.write_text("")
+    db: Path = tmp_path / "notebooks.sqlite"
+
+    assert update_index(notebooks, [joins, plot, empty], db) == (3, 0, 0)
+    results: list[tuple[Path, str]] = search_notebooks("polars joins", notebooks, db)
+    assert [path for path, _ in results] == [joins.resolve()]
+    assert "[polars]" in results[0][1] and "[join]" in results[0][1]
+    assert [path for path, _ in search_notebooks("alt*", notebooks, db)] == [
+        plot.resolve()
+    ]
+    assert search_notebooks("polars", tmp_path, db) == []  # Other directories
+
+    # Only changed notebooks are re-read; deleted notebooks leave the index
+    assert update_index(notebooks, [joins, plot, empty], db) == (0, 0, 3)
+    empty.write_text("import polars\n")
+    os.utime(empty, ns=(0, 1))
+    plot.unlink()
+    assert update_index(notebooks, [joins, empty], db) == (1, 1, 1)
+    assert {path for path, _ in search_notebooks("polars", notebooks, db)} == {
+        joins.resolve(),
+        empty.resolve(),
+    }
+    assert search_notebooks("altair", notebooks, db) == []
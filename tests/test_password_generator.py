@@ -215,3 +215,48 @@ def test_password_generator_length() -> None:
     assert result.stdout != ""
     assert result.stderr == ""
     assert len(result.stdout.strip()) == 64
+
+
+def test_password_generator_seed_key() -> None:
+    def run(*args: str) -> CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, str(pythonScripts_dir / "password_generator.py"), *args],
+            capture_output=True,
+            text=True,
+        )
+
+    first: CompletedProcess[str] = run("--seed-key", "fixture", "--count", "100")
+    second: CompletedProcess[str] = run("--seed-key", "fixture", "--count", "100")
+    other: CompletedProcess[str] = run("--seed-key", "other", "--count", "100")
+    assert "never as real credentials" in first.stderr
+    assert first.stdout == second.stdout != other.stdout
+    passwords: list[str] = first.stdout.splitlines()
+    assert len(passwords) == len(set(passwords)) == 100
+    assert all(len(password) == 64 for password in passwords)
+
+    digits: CompletedProcess[str] = run(
+        "--seed-key", "fixture", "--cli", "--custom", "0123456789", "-l", "8"
+    )
+    assert digits.stdout.strip().isdigit() and len(digits.stdout.strip()) == 8
+
+
+def test_keyed_passwords_unbiased() -> None:
+    import importlib.util
+    from collections import Counter
+    from itertools import islice
+
+    spec = importlib.util.spec_from_file_location(
+        "password_generator", pythonScripts_dir / "password_generator.py"
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # 7 and 300 characters don't divide the byte or two-byte range evenly
+    for charset in ("abcdefg", [chr(0x100 + n) for n in range(300)]):
+        counts: Counter[str] = Counter(
+            "".join(islice(module.keyed_passwords(b"key", 100, charset), 3000))
+        )
+        assert set(counts) == set(charset)
+        expected: float = 300_000 / len(charset)
+        assert all(abs(n - expected) < expected * 0.1 for n in counts.values())
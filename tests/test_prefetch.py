@@ -0,0 +1,209 @@
+# Standard Library
+import json
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# My Imports
+from moscripts.mpv import MpvClient, replace_entry
+from moscripts.prefetch import TrackCache, prefetch_playlist, upcoming
+
+
+def make_track(directory: Path, name: str, size: int) -> Path:
+    path: Path = directory / name
+    path.write_bytes(os.urandom(size))
+    return path
+
+
+def test_fetch_and_hits(tmp_path: Path) -> None:
+    music: Path = tmp_path / "music"
+    music.mkdir()
+    cache: TrackCache = TrackCache(tmp_path / "cache", max_bytes=1000)
+    track: Path = make_track(music, "a.flac", 300)
+
+    cached: Path = cache.fetch(track)
+    assert cached.parent == cache.directory and cached.suffix == ".flac"
+    assert cached.read_bytes() == track.read_bytes()
+    assert cache.fetch(track) == cached
+    assert cache.bytes_cached == 300
+
+    cache.record_play(str(cached))
+    cache.record_play(str(track))
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+    # Editing the source invalidates its cached copy
+    track.write_bytes(b"changed")
+    os.utime(track, ns=(0, 1))
+    assert cache.fetch(track) != cached
+
+
+def test_eviction(tmp_path: Path) -> None:
+    music: Path = tmp_path / "music"
+    music.mkdir()
+    cache: TrackCache = TrackCache(tmp_path / "cache", max_bytes=1000)
+    first, second, third = (make_track(music, f"{n}.mp3", 400) for n in "abc")
+
+    first_cached: Path = cache.fetch(first)
+    second_cached: Path = cache.fetch(second)
+    os.utime(second_cached, ns=(0, 1))  # Least recently used
+    os.utime(first_cached, ns=(0, 2))
+    cache.fetch(third)
+
+    assert first_cached.exists() and not second_cached.exists()
+    assert sum(path.stat().st_size for path in cache.directory.iterdir()) <= 1000
+
+    # Tracks larger than the cache are played from the source
+    huge: Path = make_track(music, "huge.mp3", 2000)
+    assert cache.fetch(huge) == huge
+
+
+class FakePlaylistMpv:
+    """mpv IPC stand-in with a playlist, for the commands prefetching uses.
+
+    `play` moves the playlist position and notifies observing connections.
+    """
+
+    def __init__(self, socket_path: Path, playlist: list[str]) -> None:
+        self.playlist: list[str] = playlist
+        self.position: int = -1
+        self.observers: list[socket.socket] = []
+        self.lock: threading.Lock = threading.Lock()
+        self.server: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(str(socket_path))
+        self.server.listen()
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    def accept(self) -> None:
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self.serve, args=(connection,), daemon=True).start()
+
+    def serve(self, connection: socket.socket) -> None:
+        with connection.makefile("rb") as lines:
+            for line in lines:
+                request: dict[str, Any] = json.loads(line)
+                with self.lock:
+                    data: Any = self.run(connection, *request["command"])
+                reply: dict[str, Any] = {
+                    "request_id": request["request_id"],
+                    "error": "success",
+                    "data": data,
+                }
+                self.send(connection, reply)
+
+    def run(self, connection: socket.socket, name: str, *args: Any) -> Any:
+        if name == "observe_property" and connection not in self.observers:
+            self.observers.append(connection)
+        elif name == "get_property" and args[0] == "playlist-pos":
+            return self.position
+        elif name == "get_property" and args[0] == "playlist-count":
+            return len(self.playlist)
+        elif name == "get_property":
+            return self.playlist[int(args[0].split("/")[1])]
+        elif name == "loadfile":
+            self.playlist.append(args[0])
+        elif name == "playlist-move":
+            self.playlist.insert(args[1], self.playlist.pop(args[0]))
+        elif name == "playlist-remove":
+            del self.playlist[args[0]]
+        return None
+
+    def send(self, connection: socket.socket, message: dict[str, Any]) -> None:
+        connection.sendall(json.dumps(message).encode() + b"\n")
+
+    def play(self, position: int) -> None:
+        self.position = position
+        for observer in self.observers:
+            self.send(
+                observer,
+                {"event": "property-change", "name": "playlist-pos", "data": position},
+            )
+
+    def shutdown(self) -> None:
+        for observer in self.observers:
+            self.send(observer, {"event": "shutdown"})
+        self.server.close()
+
+
+def wait_for(condition: Callable[[], bool]) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError("timed out")
+
+
+def test_upcoming() -> None:
+    assert upcoming(0, 10, 3) == [1, 2, 3]
+    assert upcoming(8, 10, 3) == [9, 0, 1]
+    assert upcoming(1, 3, 5) == [2, 0]
+    assert upcoming(0, 1, 3) == []
+
+
+def test_prefetch_playlist(tmp_path: Path) -> None:
+    music: Path = tmp_path / "music"
+    music.mkdir()
+    tracks: list[str] = [str(make_track(music, f"{n}.mp3", 100)) for n in "abcd"]
+    cache: TrackCache = TrackCache(tmp_path / "cache", max_bytes=1000)
+    mpv: FakePlaylistMpv = FakePlaylistMpv(tmp_path / "mpv.sock", list(tracks))
+    follower: threading.Thread = threading.Thread(
+        target=prefetch_playlist, args=(tmp_path / "mpv.sock", cache, 2), daemon=True
+    )
+    follower.start()
+    wait_for(lambda: len(mpv.observers) == 1)
+
+    def cached() -> list[bool]:
+        return [cache.is_cached(filename) for filename in mpv.playlist]
+
+    mpv.play(0)
+    wait_for(lambda: cached() == [False, True, True, False])
+    mpv.play(1)
+    wait_for(lambda: cached() == [False, True, True, True])
+    # Played entries get their original path back
+    mpv.play(2)
+    wait_for(lambda: cached() == [False, False, True, True])
+    assert mpv.playlist[1] == tracks[1]
+    # The window wraps around to the start of the looped playlist
+    mpv.play(3)
+    wait_for(lambda: cached() == [True, True, False, True])
+
+    # A copy the cache lost is fetched again
+    Path(mpv.playlist[0]).unlink()
+    mpv.play(3)
+    wait_for(lambda: cached() == [True, True, False, True])
+
+    mpv.shutdown()
+    follower.join(timeout=5)
+    assert not follower.is_alive()
+
+
+def test_replace_entry_skips_the_playing_entry(tmp_path: Path) -> None:
+    mpv: FakePlaylistMpv = FakePlaylistMpv(tmp_path / "mpv.sock", ["a", "b", "c"])
+    mpv.position = 1
+    with MpvClient.connect(tmp_path / "mpv.sock") as client:
+        assert not replace_entry(client, 1, "b", "cached-b")
+        assert not replace_entry(client, 2, "b", "cached-b")
+        assert replace_entry(client, 2, "c", "cached-c")
+    assert mpv.playlist == ["a", "b", "cached-c"]
+    mpv.shutdown()
+
+
+def test_pinned_files_are_not_evicted(tmp_path: Path) -> None:
+    music: Path = tmp_path / "music"
+    music.mkdir()
+    cache: TrackCache = TrackCache(tmp_path / "cache", max_bytes=1000)
+    first, second = (make_track(music, f"{n}.mp3", 600) for n in "ab")
+    first_cached: Path = cache.fetch(first)
+    cache.pinned = frozenset({str(first_cached)})
+
+    assert cache.fetch(second) == second
+    assert cache.is_cached(str(first_cached))
+    first_cached.unlink()
+    assert not cache.is_cached(str(first_cached))
@@ -1,9 +1,14 @@
+import os
 import subprocess
 from subprocess import CompletedProcess
 import sys
 from pathlib import Path
 import moscripts
-from moscripts.utilities import str_to_timezone, _get_system_timezone_name
+from moscripts.utilities import (
+    str_to_timezone,
+    parse_many,
+    _get_system_timezone_name,
+)
 
 test_dir: Path = Path(__file__).parent
 app_dir: Path = test_dir.parent / "apps"
@@ -16,6 +21,85 @@ def test_import() -> None:
     assert moscripts.HOME is not None
 
 
+def test_import_is_lazy() -> None:
+    result: CompletedProcess[str] = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import moscripts, sys; print('NIX' in vars(moscripts), 'moscripts.utilities' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout == "False False\n"
+    assert result.stderr == ""
+
+
+def test_multicall() -> None:
+    multicall_env: dict[str, str] = {
+        **os.environ,
+        "MOSCRIPTS_ROOT": str(test_dir.parent),
+    }
+    result: CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-m", "moscripts", "hello"],
+        capture_output=True,
+        text=True,
+        env=multicall_env,
+    )
+    assert result.stdout == "Hello from moscripts hello app!\n"
+    assert result.stderr == ""
+
+    result = subprocess.run(
+        [sys.executable, "-m", "moscripts", "password_generator", "--cli", "-l", "12"],
+        capture_output=True,
+        text=True,
+        env=multicall_env,
+    )
+    assert len(result.stdout.strip()) == 12
+    assert result.stderr == ""
+
+    result = subprocess.run(
+        [sys.executable, "-m", "moscripts", "--help"],
+        capture_output=True,
+        text=True,
+        env=multicall_env,
+    )
+    assert "human_timestamp" in result.stdout
+    assert "password_generator" in result.stdout
+
+    result = subprocess.run(
+        [sys.executable, "-m", "moscripts", "not_a_tool"],
+        capture_output=True,
+        text=True,
+        env=multicall_env,
+    )
+    assert result.returncode == 2
+    assert "Usage" in result.stderr
+
+
+def test_multicall_without_tools(tmp_path: Path) -> None:
+    result: CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-m", "moscripts", "motmp"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "MOSCRIPTS_ROOT": str(tmp_path)},
+    )
+    assert result.returncode == 2
+    assert f"no tools found in {tmp_path / 'apps'}" in result.stderr
+    assert "MOSCRIPTS_ROOT" in result.stderr
+
+
+def test_multicall_resolve_tool() -> None:
+    from moscripts.multicall import resolve_tool, tool_paths
+
+    tools: dict[str, Path] = tool_paths(test_dir.parent)
+    assert tools["motmp"] == app_dir / "motmp.py"
+    assert tools["human_timestamp"] == pythonScript_dir / "human_timestamp.py"
+    assert resolve_tool(["/usr/bin/motmp", "--scan"], tools) == ("motmp", ["--scan"])
+    assert resolve_tool(["moscripts", "hello", "x"], tools) == ("hello", ["x"])
+    assert resolve_tool(["moscripts"], tools) is None
+
+
 def test_hello() -> None:
     result: CompletedProcess[str] = subprocess.run(
         [sys.executable, str(app_dir / "hello.py")], capture_output=True, text=True
@@ -116,9 +200,74 @@ def test_str_to_timezone() -> None:
     tz_empty_fallback = str_to_timezone("")
     assert tz_empty_fallback == timezone.utc
 
+    # Test offsets of a day or more fall back to UTC
+    assert str_to_timezone("+24:00") == timezone.utc
+
+    # Test memoized results and shared offset timezones
+    assert str_to_timezone("+05:30") is str_to_timezone("+05:30")
+    assert str_to_timezone("+0530") is str_to_timezone("+05:30")
+
     # Test system timezone getter
     system_tz_name = _get_system_timezone_name()
     assert isinstance(system_tz_name, str)
     assert system_tz_name != ""
     # Further checks could involve mocking subprocess to control output
     # For now, just ensure it returns a string and is not empty
+
+
+def test_parse_many() -> None:
+    from zoneinfo import ZoneInfo
+    from datetime import timezone, timedelta
+
+    result = parse_many(["America/Chicago", "+05:30", "bogus", "America/Chicago"])
+    assert result[0] == ZoneInfo("America/Chicago")
+    assert result[1] == timezone(timedelta(hours=5, minutes=30))
+    assert result[2] == timezone.utc
+    assert result[3] is result[0]
+    assert parse_many([]) == []
+
+
+def test_human_timestamp_stdin() -> None:
+    result: CompletedProcess[str] = subprocess.run(
+        [
+            sys.executable,
+            str(pythonScript_dir / "human_timestamp.py"),
+            "--stdin",
+            "-t",
+            "UTC",
+        ],
+        input="0\n1700000000000\n\n2024-01-01T12:00:00+00:00\n",
+        capture_output=True,
+        text=True,
+    )
+    assert result.stderr == ""
+    assert result.stdout.splitlines() == [
+        "1970-01-01 12:00:00 AM",
+        "2023-11-14 10:13:20 PM",
+        "2024-01-01 12:00:00 PM",
+    ]
+
+    result = subprocess.run(
+        [sys.executable, str(pythonScript_dir / "human_timestamp.py"), "--stdin"],
+        input="not a timestamp\n",
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert result.stderr != ""
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(pythonScript_dir / "human_timestamp.py"),
+            "--stdin",
+            "--on-error",
+            "passthrough",
+            "-f",
+            "%Y",
+        ],
+        input="not a timestamp\n0\n",
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.splitlines() == ["not a timestamp", "1969"]
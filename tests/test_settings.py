@@ -0,0 +1,93 @@
+# Standard Library
+import json
+import os
+from pathlib import Path
+
+# Third Party
+import pytest
+
+# My Imports
+from moscripts import settings
+from moscripts.settings import Settings, config_path, load_settings
+
+
+@pytest.fixture
+def settings_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Points the config file and settings cache at tmp_path."""
+    for var in list(os.environ):
+        if var.startswith(settings.ENV_PREFIX):
+            monkeypatch.delenv(var)
+    config: Path = tmp_path / "config.toml"
+    monkeypatch.setenv("MOSCRIPTS_CONFIG", str(config))
+    monkeypatch.setattr(settings, "SETTINGS_CACHE", tmp_path / "settings.json")
+    return config
+
+
+def test_config_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MOSCRIPTS_CONFIG", raising=False)
+    monkeypatch.setenv("XDG_CONFIG_HOME", "/xdg")
+    assert config_path() == Path("/xdg/moscripts/config.toml")
+    monkeypatch.setenv("MOSCRIPTS_CONFIG", "/etc/moscripts.toml")
+    assert config_path() == Path("/etc/moscripts.toml")
+
+
+def test_defaults(settings_env: Path) -> None:
+    result: Settings = load_settings()
+    assert result.motmp == Path.home() / ".cache" / "marimo" / "motmp"
+    assert result.venv == result.motmp / ".venv"
+    assert "marimo[recommended]" in result.motmp_packages
+
+
+def test_toml_and_env(settings_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    settings_env.write_text(
+        'motmp = "~/notebooks"\nmusic = "/toml"\nmotmp_packages = ["marimo"]\n'
+    )
+    monkeypatch.setenv("MOSCRIPTS_MUSIC", "/env")
+    result: Settings = load_settings()
+    assert result.motmp == Path.home() / "notebooks"
+    assert result.venv == Path.home() / "notebooks" / ".venv"
+    assert result.music == Path("/env")
+    assert result.motmp_packages == ["marimo"]
+
+
+def test_cache_skips_validation(
+    settings_env: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings_env.write_text('playlists = "/music"\n')
+    first: Settings = load_settings()
+    assert settings.SETTINGS_CACHE.exists()
+
+    def fail() -> None:
+        raise AssertionError("settings were revalidated")
+
+    monkeypatch.setattr(Settings, "__init__", lambda self: fail())
+    second: Settings = load_settings()
+    assert second == first
+    assert isinstance(second.playlists, Path)
+
+
+def test_cache_invalidation(
+    settings_env: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings_env.write_text('music = "/first"\n')
+    assert load_settings().music == Path("/first")
+
+    settings_env.write_text('music = "/second"\n')
+    os.utime(settings_env, ns=(0, 1))
+    assert load_settings().music == Path("/second")
+
+    monkeypatch.setenv("MOSCRIPTS_MUSIC", "/env")
+    assert load_settings().music == Path("/env")
+    assert json.loads(settings.SETTINGS_CACHE.read_text())["key"]["env"] == {
+        "MOSCRIPTS_MUSIC": "/env"
+    }
+
+
+def test_cache_from_another_schema(settings_env: Path) -> None:
+    load_settings()
+    # A cache written by a version with other defaults
+    cached: dict = json.loads(settings.SETTINGS_CACHE.read_text())
+    cached["key"]["schema"] = "0" * 16
+    cached["settings"]["audio_cache_bytes"] = 1024
+    settings.SETTINGS_CACHE.write_text(json.dumps(cached))
+    assert load_settings().audio_cache_bytes == 2 * 1024**3
@@ -0,0 +1,71 @@
+# Standard Library
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Third Party
+import pytest
+
+# My Imports
+from moscripts import trace
+
+test_dir: Path = Path(__file__).parent
+
+
+def test_disabled_is_a_no_op(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(trace, "ENABLED", False)
+
+    def func() -> int:
+        return 1
+
+    assert trace.traced()(func) is func
+    assert trace.span("a") is trace.span("b")
+    with trace.span("ignored"):
+        pass
+    assert trace._EVENTS == []
+    assert trace.flush() is None
+
+
+def test_enabled_records_chrome_events(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(trace, "ENABLED", True)
+    monkeypatch.setattr(trace, "_EVENTS", [])
+    monkeypatch.setenv("MOSCRIPTS_TRACE_FILE", str(tmp_path / "trace.json"))
+
+    @trace.traced("decorated")
+    def func(value: int) -> int:
+        return value * 2
+
+    assert func(2) == 4
+    with trace.span("block", count=3):
+        pass
+
+    path: Path | None = trace.flush()
+    assert path is not None and path == tmp_path / "trace.json"
+    events: list[dict] = json.loads(path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["decorated", "block"]
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+    assert events[1]["args"] == {"count": "3"}
+    assert trace._EVENTS == []
+
+
+def test_trace_env_var_writes_file(tmp_path: Path) -> None:
+    trace_file: Path = tmp_path / "hello.json"
+    result = subprocess.run(
+        [sys.executable, "-m", "moscripts", "hello"],
+        capture_output=True,
+        text=True,
+        env={
+            **os.environ,
+            "MOSCRIPTS_ROOT": str(test_dir.parent),
+            "MOSCRIPTS_NO_DAEMON": "1",
+            "MOSCRIPTS_TRACE": "1",
+            "MOSCRIPTS_TRACE_FILE": str(trace_file),
+        },
+    )
+    assert result.returncode == 0
+    events: list[dict] = json.loads(trace_file.read_text())["traceEvents"]
+    assert "run hello" in [event["name"] for event in events]
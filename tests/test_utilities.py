@@ -2,6 +2,9 @@
 from datetime import datetime, timezone
 import subprocess
 from subprocess import CompletedProcess
+from pathlib import Path
+from unittest.mock import patch
+import json
 
 # Third Party
 import pytest
@@ -9,9 +12,17 @@ import pytest
 # My Imports
 from moscripts.utilities import (
     create_human_readable_timestamp,
+    convert_many,
+    format_datetime64,
+    get_zone,
+    parse_timestamp,
+    zone_transitions,
     which_nix,
     nix_run_prefix,
     which_executable,
+    write_json_atomic,
+    clone_file,
+    _get_system_timezone_name,
 )
 
 
@@ -24,6 +35,134 @@ def test_create_human_readable_timestamp() -> None:
     )
 
 
+def test_parse_timestamp() -> None:
+    expected: datetime = datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+    assert parse_timestamp("1700000000") == expected
+    assert parse_timestamp("1700000000000") == expected
+    assert parse_timestamp(1700000000) == expected
+    assert parse_timestamp("2023-11-14T22:13:20Z") == expected
+    assert parse_timestamp("2023-11-14 22:13:20") == expected
+    with pytest.raises(ValueError):
+        parse_timestamp("yesterday")
+
+
+def test_convert_many() -> None:
+    values: list[str] = ["0", "", "1700000000000", "2024-01-01T12:00:00+00:00"]
+    assert list(convert_many(values, target_tz="UTC")) == [
+        "1970-01-01 12:00:00 AM",
+        "2023-11-14 10:13:20 PM",
+        "2024-01-01 12:00:00 PM",
+    ]
+    assert list(convert_many(["0"], target_tz="America/Chicago", fmt="%H")) == ["18"]
+    assert list(
+        convert_many(["bad", "0"], target_tz="UTC", fmt="%Y", on_error="skip")
+    ) == ["1970"]
+    assert list(convert_many(["bad"], target_tz="UTC", on_error="passthrough")) == [
+        "bad"
+    ]
+    with pytest.raises(ValueError):
+        list(convert_many(["bad"], target_tz="UTC"))
+
+
+def test_get_zone_is_cached() -> None:
+    assert get_zone("America/Chicago") is get_zone("America/Chicago")
+    assert get_zone.cache_info().maxsize is not None
+
+
+def test_zone_transitions() -> None:
+    from zoneinfo import ZoneInfo
+
+    starts, zones, end = zone_transitions("America/Chicago")
+    assert starts == sorted(starts)
+    assert len(starts) == len(zones)
+    chicago: ZoneInfo = ZoneInfo("America/Chicago")
+    for start, zone in list(zip(starts, zones))[1:20]:
+        before: datetime = datetime.fromtimestamp(start - 1, chicago)
+        after: datetime = datetime.fromtimestamp(start, chicago)
+        assert before.utcoffset() != after.utcoffset()
+        assert zone.utcoffset(None) == after.utcoffset()
+        assert zone.tzname(None) == after.tzname()
+    assert end > starts[-1]
+
+
+def test_convert_many_matches_zoneinfo() -> None:
+    from zoneinfo import ZoneInfo
+
+    chicago: ZoneInfo = ZoneInfo("America/Chicago")
+    # Sorted stream across DST changes, then an out-of-order and out-of-table value.
+    epochs: list[int] = list(range(1_710_050_000, 1_710_070_000, 599))
+    epochs += [1_000_000_000, 5_000_000_000]
+    for fmt in ("%Y-%m-%d %I:%M:%S %p", "%a %j %H:%M %Z %z %%", "%c"):
+        expected: list[str] = [
+            datetime.fromtimestamp(epoch, chicago).strftime(fmt) for epoch in epochs
+        ]
+        assert list(convert_many(epochs, "America/Chicago", fmt)) == expected
+
+
+def test_format_datetime64() -> None:
+    np = pytest.importorskip("numpy")
+    from zoneinfo import ZoneInfo
+
+    chicago: ZoneInfo = ZoneInfo("America/Chicago")
+    epochs: list[int] = [0, 1_710_054_000, 1_710_057_600, 1_730_613_600, 5_000_000_000]
+    values = np.array(epochs, dtype="datetime64[s]")
+    expected: list[bytes] = [
+        datetime.fromtimestamp(epoch, chicago).strftime("%Y-%m-%d %I:%M:%S %p").encode()
+        for epoch in epochs
+    ]
+    assert format_datetime64(values).tolist() == expected
+    assert format_datetime64(values.astype("datetime64[ms]")).tolist() == expected
+
+    with_nat = np.array(["NaT", "2024-01-01T18:30"], dtype="datetime64[m]")
+    assert format_datetime64(with_nat, "UTC", "%d/%m/%y %H:%M").tolist() == [
+        b"",
+        b"01/01/24 18:30",
+    ]
+    with pytest.raises(ValueError):
+        format_datetime64(values, fmt="%c")
+
+
+def test_write_json_atomic(tmp_path: Path) -> None:
+    target: Path = tmp_path / "nested" / "data.json"
+    write_json_atomic(target, {"a": 1})
+    write_json_atomic(target, {"a": 2})
+    assert json.loads(target.read_text()) == {"a": 2}
+    assert [path.name for path in target.parent.iterdir()] == ["data.json"]
+
+
+def test_system_timezone_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache: Path = tmp_path / "timezone.json"
+    monkeypatch.setattr("moscripts.utilities.TIMEZONE_CACHE", cache)
+    monkeypatch.setenv("TZ", "Europe/Paris")
+    with patch(
+        "moscripts.utilities._resolve_system_timezone_name", return_value="Asia/Tokyo"
+    ) as mock_resolve:
+        assert _get_system_timezone_name() == "Asia/Tokyo"
+        assert _get_system_timezone_name() == "Asia/Tokyo"
+        mock_resolve.assert_called_once()
+
+        # Changing TZ invalidates the cached resolution
+        monkeypatch.setenv("TZ", "UTC")
+        assert _get_system_timezone_name() == "Asia/Tokyo"
+        assert mock_resolve.call_count == 2
+
+        # A corrupt cache file falls back to resolving again
+        cache.write_text("{not json")
+        assert _get_system_timezone_name() == "Asia/Tokyo"
+        assert mock_resolve.call_count == 3
+    assert json.loads(cache.read_text())["timezone"] == "Asia/Tokyo"
+
+    # A failed lookup falls back to UTC without replacing the cached name
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    with patch(
+        "moscripts.utilities._resolve_system_timezone_name", return_value=None
+    ) as mock_resolve:
+        assert _get_system_timezone_name() == "UTC"
+        assert _get_system_timezone_name() == "UTC"
+        assert mock_resolve.call_count == 2
+    assert json.loads(cache.read_text())["timezone"] == "Asia/Tokyo"
+
+
 def test_which_nix() -> None:
     assert which_nix().exists()
 
@@ -66,3 +205,25 @@ def test_nix_run_prefix_subprocess_nixpkgs_download() -> None:
 def test_which_executable() -> None:
     assert which_executable("which").exists()
     assert which_executable("nix").exists()
+
+
+def test_clone_file(tmp_path: Path) -> None:
+    source: Path = tmp_path / "template.py"
+    source.write_bytes(b"import marimo\n" * 10_000)
+    destination: Path = tmp_path / "motmp_clone.py"
+    clone_file(source, destination)
+    assert destination.read_bytes() == source.read_bytes()
+    with pytest.raises(FileExistsError):
+        clone_file(source, destination)
+
+
+def test_clone_file_fallback(tmp_path: Path) -> None:
+    source: Path = tmp_path / "template.py"
+    source.write_text("import marimo\n")
+    destination: Path = tmp_path / "motmp_clone.py"
+    with (
+        patch("moscripts.utilities.fcntl.ioctl", side_effect=OSError),
+        patch("moscripts.utilities.os.copy_file_range", side_effect=OSError),
+    ):
+        clone_file(source, destination)
+    assert destination.read_text() == "import marimo\n"